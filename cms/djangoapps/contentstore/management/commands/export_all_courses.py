@@ -2,13 +2,21 @@
 Script for exporting all courseware from Mongo to a directory and listing the courses which failed to export
 """
 from __future__ import print_function
+import os
+from multiprocessing import Pool
 from six import text_type
 
 from django.core.management.base import BaseCommand
+from django.db import connections
+from opaque_keys.edx.keys import CourseKey
 
-from xmodule.contentstore.django import contentstore
-from xmodule.modulestore.django import modulestore
-from xmodule.modulestore.xml_exporter import export_course_to_xml
+from xmodule.contentstore.django import clear_existing_contentstores, contentstore
+from xmodule.modulestore.django import clear_existing_modulestores, modulestore
+from xmodule.modulestore.xml_exporter import export_course_to_tarball, export_course_to_xml
+
+# Each worker process is replaced after exporting this many courses, which bounds the memory
+# that a long-lived worker can accumulate in caches.
+COURSES_PER_WORKER = 50
 
 
 class Command(BaseCommand):
@@ -19,12 +27,30 @@ class Command(BaseCommand):
 
     def add_arguments(self, parser):
         parser.add_argument('output_path')
+        parser.add_argument(
+            '--tarballs',
+            action='store_true',
+            help='Stream each course into its own <course>.tar.gz file instead of exporting to a directory tree',
+        )
+        parser.add_argument(
+            '--processes',
+            type=int,
+            default=1,
+            help='Number of worker processes to export courses with concurrently (implies --tarballs)',
+        )
 
     def handle(self, *args, **options):
         """
         Execute the command
         """
-        courses, failed_export_courses = export_courses_to_output_path(options['output_path'])
+        if options['processes'] > 1:
+            courses, failed_export_courses = export_courses_to_tarballs_in_parallel(
+                options['output_path'], options['processes']
+            )
+        elif options['tarballs']:
+            courses, failed_export_courses = export_courses_to_tarballs(options['output_path'])
+        else:
+            courses, failed_export_courses = export_courses_to_output_path(options['output_path'])
 
         print("=" * 80)
         print("=" * 30 + "> Export summary")
@@ -60,3 +86,78 @@ def export_courses_to_output_path(output_path):
             print(err)
 
     return courses, failed_export_courses
+
+
+def export_courses_to_tarballs(output_path):
+    """
+    Export each course to its own tar.gz file in the target directory and return the list of
+    courses which failed to export
+    """
+    course_ids = [text_type(course.id) for course in modulestore().get_course_summaries()]
+    failed_export_courses = [
+        course_id
+        for course_id in course_ids
+        if not export_course_to_tarball_file(course_id, output_path)[1]
+    ]
+    return course_ids, failed_export_courses
+
+
+def export_courses_to_tarballs_in_parallel(output_path, processes):
+    """
+    Export each course to its own tar.gz file in the target directory using a pool of worker
+    processes, and return the list of courses which failed to export
+    """
+    course_ids = [text_type(course.id) for course in modulestore().get_course_summaries()]
+    # The workers must open their own database connections rather than share the parent's.
+    connections.close_all()
+
+    pool = Pool(processes, initializer=_reset_connections, maxtasksperchild=COURSES_PER_WORKER)
+    try:
+        results = pool.imap_unordered(_export_course_to_tarball_file_star, [
+            (course_id, output_path) for course_id in course_ids
+        ])
+        failed_export_courses = [course_id for course_id, succeeded in results if not succeeded]
+    finally:
+        pool.close()
+        pool.join()
+
+    return course_ids, failed_export_courses
+
+
+def export_course_to_tarball_file(course_id, output_path):
+    """
+    Stream a single course into <output_path>/<course_dir>.tar.gz.
+
+    Returns a (course_id, succeeded) tuple.
+    """
+    course_key = CourseKey.from_string(course_id)
+    course_dir = course_id.replace('/', '...')
+    filename = os.path.join(output_path, course_dir + '.tar.gz')
+    print("Exporting course id = {0} to {1}".format(course_id, filename))
+    try:
+        with open(filename, 'wb') as tarball_file:
+            export_course_to_tarball(modulestore(), contentstore(), course_key, tarball_file, course_dir)
+    except Exception as err:  # pylint: disable=broad-except
+        print("=" * 30 + "> Oops, failed to export {0}".format(course_id))
+        print("Error:")
+        print(err)
+        if os.path.exists(filename):
+            os.remove(filename)
+        return course_id, False
+    return course_id, True
+
+
+def _export_course_to_tarball_file_star(args):
+    """
+    Unpack the arguments for export_course_to_tarball_file, since Pool.imap passes a single argument.
+    """
+    return export_course_to_tarball_file(*args)
+
+
+def _reset_connections():
+    """
+    Make a worker process create its own modulestore, contentstore, and database connections.
+    """
+    connections.close_all()
+    clear_existing_modulestores()
+    clear_existing_contentstores()
@@ -1,10 +1,15 @@
 """
 Test for export all courses.
 """
+import os
 import shutil
+import tarfile
 from tempfile import mkdtemp
 
-from contentstore.management.commands.export_all_courses import export_courses_to_output_path
+from contentstore.management.commands.export_all_courses import (
+    export_courses_to_output_path,
+    export_courses_to_tarballs
+)
 
 from xmodule.modulestore import ModuleStoreEnum
 from xmodule.modulestore.django import modulestore
@@ -48,3 +53,18 @@ class ExportAllCourses(ModuleStoreTestCase):
         self.assertEqual(len(courses), 2)
         self.assertEqual(len(failed_export_courses), 1)
         self.assertEqual(failed_export_courses[0], unicode(second_course_id))
+
+    def test_export_all_courses_to_tarballs(self):
+        """
+        Test streaming each course into its own tarball
+        """
+        courses, failed_export_courses = export_courses_to_tarballs(self.temp_dir)
+        self.assertEqual(len(courses), 2)
+        self.assertEqual(len(failed_export_courses), 0)
+
+        for course in (self.first_course, self.second_course):
+            course_dir = unicode(course.id).replace('/', '...')
+            with tarfile.open(os.path.join(self.temp_dir, course_dir + '.tar.gz')) as tarball:
+                names = tarball.getnames()
+            self.assertIn(course_dir + '/course.xml', names)
+            self.assertIn(course_dir + '/policies/assets.json', names)
@@ -21,7 +21,7 @@ from django.test import RequestFactory
 from django.utils.text import get_valid_filename
 from django.utils.translation import ugettext as _
 from djcelery.common import respect_language
-from opaque_keys.edx.keys import CourseKey
+from opaque_keys.edx.keys import AssetKey, CourseKey
 from opaque_keys.edx.locator import LibraryLocator
 from organizations.models import OrganizationCourse
 from path import Path as path
@@ -36,12 +36,13 @@ from contentstore.storage import course_import_export_storage
 from contentstore.utils import initialize_permissions, reverse_usage_url
 from course_action_state.models import CourseRerunState
 from models.settings.course_metadata import CourseMetadata
+from openedx.core.djangoapps.contentserver.caching import del_cached_content
 from openedx.core.djangoapps.embargo.models import CountryAccessRule, RestrictedCourse
 from openedx.core.lib.extract_tar import safetar_extractall
 from student.auth import has_course_author_access
 from xmodule.contentstore.django import contentstore
 from xmodule.course_module import CourseFields
-from xmodule.exceptions import SerializationError
+from xmodule.exceptions import NotFoundError, SerializationError
 from xmodule.modulestore import COURSE_ROOT, LIBRARY_ROOT
 from xmodule.modulestore.django import modulestore
 from xmodule.modulestore.exceptions import DuplicateCourseError, ItemNotFoundError
@@ -195,6 +196,32 @@ def push_course_update_task(course_key_string, course_subscription_id, course_di
     send_push_course_update(course_key_string, course_subscription_id, course_display_name)
 
 
+@task(routing_key=settings.THUMBNAIL_GENERATION_ROUTING_KEY)
+def generate_asset_thumbnail(asset_key_string):
+    """
+    Generates the thumbnail of an uploaded image.
+
+    The asset already points at the location of its thumbnail, where a placeholder
+    is served until this task stores it. If no thumbnail can be generated, the asset
+    is unlinked from it instead.
+    """
+    asset_key = AssetKey.from_string(asset_key_string)
+    store = contentstore()
+    content = store.find(asset_key, throw_on_not_found=False)
+    if content is None:
+        LOGGER.info(u'Asset %s was deleted before its thumbnail was generated', asset_key_string)
+        return
+
+    thumbnail_content, thumbnail_location = store.generate_thumbnail(content)
+    del_cached_content(thumbnail_location)
+    if thumbnail_content is None:
+        try:
+            store.set_attr(asset_key, 'thumbnail_location', None)
+        except NotFoundError:
+            return
+        del_cached_content(asset_key)
+
+
 class CourseExportTask(UserTask):  # pylint: disable=abstract-method
     """
     Base class for course and library export tasks.
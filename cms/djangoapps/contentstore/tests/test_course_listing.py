@@ -157,7 +157,7 @@ class TestCourseListing(ModuleStoreTestCase):
             self.assertEqual(len(list(courses_iter)), 0)
 
     @ddt.data(
-        (ModuleStoreEnum.Type.split, 3),
+        (ModuleStoreEnum.Type.split, 2),
         (ModuleStoreEnum.Type.mongo, 2)
     )
     @ddt.unpack
@@ -239,7 +239,7 @@ class TestCourseListing(ModuleStoreTestCase):
         )
 
     @ddt.data(
-        (ModuleStoreEnum.Type.split, 3, 3),
+        (ModuleStoreEnum.Type.split, 2, 2),
         (ModuleStoreEnum.Type.mongo, 2, 2)
     )
     @ddt.unpack
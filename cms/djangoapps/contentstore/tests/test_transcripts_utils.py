@@ -660,6 +660,29 @@ class TestTranscript(unittest.TestCase):
         with self.assertRaises(transcripts_utils.TranscriptsGenerationException):
             transcripts_utils.Transcript.convert(invalid_srt_transcript, 'srt', 'sjson')
 
+    def test_convert_cached(self):
+        """
+        Tests that a transcript is only converted once for the same content and formats.
+        """
+        srt_transcript = self.srt_transcript.replace('Dream', 'Dream {}'.format(uuid4().hex))
+        convert = transcripts_utils.Transcript._convert  # pylint: disable=protected-access
+        with patch.object(transcripts_utils.Transcript, '_convert', wraps=convert) as mock_convert:
+            first = transcripts_utils.Transcript.convert(srt_transcript, 'srt', 'sjson')
+            second = transcripts_utils.Transcript.convert(srt_transcript, 'srt', 'sjson')
+            self.assertEqual(mock_convert.call_count, 1)
+            self.assertDictEqual(first, second)
+
+            transcripts_utils.Transcript.convert(srt_transcript, 'srt', 'txt')
+            self.assertEqual(mock_convert.call_count, 2)
+
+    def test_iter_srt_from_sjson(self):
+        """
+        Tests that the srt entries are generated one at a time, and match the whole srt transcript.
+        """
+        entries = list(transcripts_utils.iter_srt_from_sjson(json.loads(self.sjson_transcript), speed=1.0))
+        self.assertEqual(len(entries), 2)
+        self.assertEqual(''.join(entries), self.srt_transcript)
+
     def test_dummy_non_existent_transcript(self):
         """
         Test `Transcript.asset` raises `NotFoundError` for dummy non-existent transcript.
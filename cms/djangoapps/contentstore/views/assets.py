@@ -21,6 +21,7 @@ from xmodule.modulestore.django import modulestore
 from xmodule.modulestore.exceptions import ItemNotFoundError
 
 from contentstore.config.models import NewAssetsPageFlag
+from contentstore.tasks import generate_asset_thumbnail
 from contentstore.utils import reverse_course_url
 from contentstore.views.exception import AssetNotFoundException, AssetSizeTooLargeException
 from edxmako.shortcuts import render_to_response
@@ -31,6 +32,9 @@ from util.json_request import JsonResponse
 
 __all__ = ['assets_handler']
 
+# The asset attributes used by _get_assets_in_json_format.
+ASSET_LIST_FIELDS = ('displayname', 'contentType', 'uploadDate', 'thumbnail_location', 'locked')
+
 REQUEST_DEFAULTS = {
     'page': 0,
     'page_size': 50,
@@ -327,7 +331,8 @@ def _get_assets_for_page(course_key, options):
     filter_params = options['filter_params'] if options['filter_params'] else None
     start = current_page * page_size
     return contentstore().get_all_content_for_course(
-        course_key, start=start, maxresults=page_size, sort=sort, filter_params=filter_params
+        course_key, start=start, maxresults=page_size, sort=sort, filter_params=filter_params,
+        fields=ASSET_LIST_FIELDS
     )
 
 
@@ -370,18 +375,26 @@ def update_course_run_asset(course_key, upload_file):
 
     content, temporary_file_path = _get_file_content_and_path(file_metadata, course_key)
 
-    (thumbnail_content, thumbnail_location) = contentstore().generate_thumbnail(content,
-                                                                                tempfile_path=temporary_file_path)
+    # An image which was uploaded before keeps its thumbnail. Others get theirs generated in the background,
+    # and the contentserver serves a placeholder at the thumbnail's location until then.
+    generate_thumbnail = False
+    thumbnail_location = contentstore().get_thumbnail_location(content)
+    if contentstore().can_generate_thumbnail(content):
+        thumbnail_content = contentstore().find_thumbnail(content, tempfile_path=temporary_file_path)
+        if not _check_thumbnail_uploaded(thumbnail_content):
+            contentstore().delete(thumbnail_location)
+            generate_thumbnail = True
+        content.thumbnail_location = thumbnail_location
 
     # delete cached thumbnail even if one couldn't be created this time (else the old thumbnail will continue to show)
     del_cached_content(thumbnail_location)
 
-    if _check_thumbnail_uploaded(thumbnail_content):
-        content.thumbnail_location = thumbnail_location
-
     contentstore().save(content)
     del_cached_content(content.location)
 
+    if generate_thumbnail:
+        generate_asset_thumbnail.delay(text_type(content.location))
+
     return content
 
 
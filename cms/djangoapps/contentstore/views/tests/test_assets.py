@@ -349,6 +349,37 @@ class UploadTestCase(AssetsTestCase):
         resp = self.upload_asset("test_image", asset_type="image")
         self.assertEquals(resp.status_code, 200)
 
+    def test_upload_image_thumbnail(self):
+        with patch('contentstore.views.assets.generate_asset_thumbnail') as generate_asset_thumbnail:
+            resp = self.upload_asset("test_image", asset_type="image")
+        self.assertEquals(resp.status_code, 200)
+        asset_json = json.loads(resp.content)['asset']
+        asset_key = StaticContent.get_location_from_path(asset_json['url'])
+        generate_asset_thumbnail.delay.assert_called_once_with(unicode(asset_key))
+
+        # Until the thumbnail is generated, the asset links to where it will be stored.
+        thumbnail_location = StaticContent.get_location_from_path(asset_json['thumbnail'])
+        self.assertEquals(contentstore().find(asset_key).thumbnail_location, thumbnail_location)
+        self.assertIsNone(contentstore().find(thumbnail_location, throw_on_not_found=False))
+
+        resp = self.upload_asset("test_image", asset_type="image")
+        self.assertEquals(resp.status_code, 200)
+        self.assertIsNotNone(contentstore().find(thumbnail_location, throw_on_not_found=False))
+
+        # Uploading the same image again reuses its thumbnail.
+        with patch('contentstore.views.assets.generate_asset_thumbnail') as generate_asset_thumbnail:
+            resp = self.upload_asset("test_image", asset_type="image")
+        self.assertEquals(resp.status_code, 200)
+        self.assertFalse(generate_asset_thumbnail.delay.called)
+        self.assertEquals(contentstore().find(asset_key).thumbnail_location, thumbnail_location)
+
+    def test_upload_text_no_thumbnail(self):
+        with patch('contentstore.views.assets.generate_asset_thumbnail') as generate_asset_thumbnail:
+            resp = self.upload_asset()
+        self.assertEquals(resp.status_code, 200)
+        self.assertIsNone(json.loads(resp.content)['asset']['thumbnail'])
+        self.assertFalse(generate_asset_thumbnail.delay.called)
+
     def test_no_file(self):
         resp = self.client.post(self.url, {"name": "file.txt"}, "application/json")
         self.assertEquals(resp.status_code, 400)
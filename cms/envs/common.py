@@ -62,7 +62,7 @@ from lms.envs.common import (
     # The following setting is included as it is used to check whether to
     # display credit eligibility table on the CMS or not.
     ENABLE_CREDIT_ELIGIBILITY, YOUTUBE_API_KEY,
-    COURSE_MODE_DEFAULTS, DEFAULT_COURSE_ABOUT_IMAGE_URL,
+    COURSE_MODE_DEFAULTS, DEFAULT_COURSE_ABOUT_IMAGE_URL, THUMBNAIL_PLACEHOLDER_IMAGE_URL,
 
     # User-uploaded content
     MEDIA_ROOT,
@@ -1465,6 +1465,13 @@ POLICY_CHANGE_GRADES_ROUTING_KEY = LOW_PRIORITY_QUEUE
 ############## Settings for CourseGraph ############################
 COURSEGRAPH_JOB_QUEUE = LOW_PRIORITY_QUEUE
 
+######################## Asset thumbnails ###########################
+
+# Queue to use for generating the thumbnails of uploaded images. Routing it to a
+# dedicated queue bounds the number of thumbnails generated at once to the
+# concurrency of the workers consuming that queue.
+THUMBNAIL_GENERATION_ROUTING_KEY = LOW_PRIORITY_QUEUE
+
 ###################### VIDEO IMAGE STORAGE ######################
 
 VIDEO_IMAGE_DEFAULT_FILENAME = 'images/video-images/default_video_image.png'
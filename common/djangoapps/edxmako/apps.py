@@ -3,7 +3,7 @@ Configuration for the edxmako Django application.
 """
 from django.apps import AppConfig
 from django.conf import settings
-from . import add_lookup, clear_lookups
+from . import LOOKUP, add_lookup, clear_lookups
 
 
 class EdxMakoConfig(AppConfig):
@@ -15,7 +15,7 @@ class EdxMakoConfig(AppConfig):
 
     def ready(self):
         """
-        Setup mako lookup directories.
+        Setup mako lookup directories, and load the precompiled templates if MAKO_PRELOAD_TEMPLATES is set.
 
         IMPORTANT: This method can be called multiple times during application startup. Any changes to this method
         must be safe for multiple callers during startup phase.
@@ -28,3 +28,5 @@ class EdxMakoConfig(AppConfig):
             clear_lookups(namespace)
             for directory in directories:
                 add_lookup(namespace, directory)
+            if getattr(settings, 'MAKO_PRELOAD_TEMPLATES', False):
+                LOOKUP[namespace].load_indexed_templates()
@@ -0,0 +1,28 @@
+"""
+Compile the mako templates of every lookup namespace and write the template index for each.
+
+Run this at deploy time, after collecting the theme directories, so that server workers load the
+precompiled template modules instead of compiling and searching for templates themselves.
+"""
+from __future__ import print_function
+
+from django.core.management.base import BaseCommand
+
+from edxmako import LOOKUP
+
+
+class Command(BaseCommand):
+    """
+    Compile the mako templates of every lookup namespace
+    """
+    help = 'Compile the mako templates of every lookup namespace and write their template indexes'
+
+    def handle(self, *args, **options):
+        """
+        Execute the command
+        """
+        for namespace, lookup in sorted(LOOKUP.items()):
+            count = lookup.compile_templates()
+            print(u"Compiled {0} templates in namespace '{1}' to {2}".format(
+                count, namespace, lookup.index_filename
+            ))
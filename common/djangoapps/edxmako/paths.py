@@ -4,8 +4,11 @@ Set up lookup paths for mako templates.
 
 import contextlib
 import hashlib
+import json
+import logging
 import os
 
+import mako
 import pkg_resources
 from django.conf import settings
 from mako.exceptions import TopLevelLookupException
@@ -17,6 +20,17 @@ from openedx.core.djangoapps.theming.helpers import get_template_path_with_theme
 
 from . import LOOKUP
 
+log = logging.getLogger(__name__)
+
+# Extensions of the files in the lookup directories which compile_mako_templates precompiles.
+TEMPLATE_EXTENSIONS = ('.html', '.txt', '.xml')
+
+# The template arguments which affect the code that mako compiles a template to.
+COMPILE_ARGS = (
+    'default_filters', 'buffer_filters', 'imports', 'future_imports',
+    'input_encoding', 'disable_unicode', 'enable_loop', 'strict_undefined',
+)
+
 
 class TopLevelTemplateURI(unicode):
     """
@@ -33,8 +47,10 @@ class DynamicTemplateLookup(TemplateLookup):
     for adding directories progressively.
     """
     def __init__(self, *args, **kwargs):
+        kwargs.setdefault('modulename_callable', self._compiled_module_filename)
         super(DynamicTemplateLookup, self).__init__(*args, **kwargs)
         self.__original_module_directory = self.template_args['module_directory']
+        self._template_index = None
 
     def __repr__(self):
         return "<{0.__class__.__name__} {0.directories}>".format(self)
@@ -59,6 +75,159 @@ class DynamicTemplateLookup(TemplateLookup):
         # Also clear the internal caches. Ick.
         self._collection.clear()
         self._uri_cache.clear()
+        self._template_index = None
+
+    def _compiled_module_filename(self, filename, uri):
+        """
+        Return the path of the compiled module for a template.
+
+        The path is derived from the template's source, uri and location, so the compiled module can be
+        shared by every process (and every lookup path) which loads that exact template, and is
+        naturally replaced when the template changes.
+        """
+        digest = hashlib.sha1()
+        with open(filename, 'rb') as template_file:
+            digest.update(template_file.read())
+        digest.update(b'\0'.join([
+            uri.encode('utf-8'),
+            filename.encode('utf-8'),
+            mako.__version__.encode('utf-8'),
+            repr([self.template_args.get(arg) for arg in COMPILE_ARGS]).encode('utf-8'),
+        ]))
+        return os.path.join(self._compiled_module_directory, digest.hexdigest() + '.py')
+
+    @property
+    def _compiled_module_directory(self):
+        """
+        The directory holding the compiled modules of every lookup path.
+        """
+        return os.path.join(self.__original_module_directory, 'compiled')
+
+    @property
+    def index_filename(self):
+        """
+        The path of the template index file for this lookup path (see `compile_templates`).
+        """
+        return os.path.join(self.template_args['module_directory'], 'template_index.json')
+
+    @property
+    def modules_filename(self):
+        """
+        The path of the file listing the compiled modules referenced by the template index of this lookup path.
+        """
+        return os.path.join(self.template_args['module_directory'], 'compiled_modules.json')
+
+    @property
+    def template_index(self):
+        """
+        A dict mapping template uris to the source files which this lookup path resolves them to.
+
+        It is loaded from the index written by `compile_templates` at deploy time, if there is one,
+        and lets templates be loaded without probing each lookup directory in turn.
+        """
+        if self._template_index is None:
+            try:
+                with open(self.index_filename) as index_file:
+                    self._template_index = json.load(index_file)
+            except (IOError, ValueError):
+                self._template_index = {}
+        return self._template_index
+
+    def compile_templates(self):
+        """
+        Compile every template in the lookup directories and write the template index for this lookup path.
+
+        Intended to be run once at deploy time (see the compile_mako_templates management command), so that
+        workers import precompiled modules instead of each compiling their own.
+
+        Compiled modules which are no longer referenced by the template index of any lookup path are removed.
+
+        Returns the number of templates compiled.
+        """
+        index = {}
+        modules = []
+        for directory in self.directories:
+            for dirpath, __, filenames in os.walk(directory):
+                for filename in filenames:
+                    if not filename.endswith(TEMPLATE_EXTENSIONS):
+                        continue
+                    template_filename = os.path.join(dirpath, filename)
+                    uri = os.path.relpath(template_filename, directory).replace(os.path.sep, '/')
+                    # The first directory which has a template wins, as in TemplateLookup.get_template
+                    if uri in index:
+                        continue
+                    try:
+                        self._load(template_filename, uri)
+                    except Exception:  # pylint: disable=broad-except
+                        log.warning(u"Unable to compile mako template %s", template_filename, exc_info=True)
+                        continue
+                    index[uri] = template_filename
+                    modules.append(os.path.basename(self._compiled_module_filename(template_filename, uri)))
+
+        index_directory = os.path.dirname(self.index_filename)
+        if not os.path.isdir(index_directory):
+            os.makedirs(index_directory)
+        # Write the index atomically, since running workers may be reading it.
+        _write_json_atomically(self.modules_filename, modules)
+        _write_json_atomically(self.index_filename, index)
+
+        self._template_index = index
+        self._remove_unreferenced_modules()
+        return len(index)
+
+    def _remove_unreferenced_modules(self):
+        """
+        Remove the compiled modules which the template index of no lookup path references.
+        """
+        referenced_modules = set()
+        original_module_directory = self.__original_module_directory
+        for lookup_directory in os.listdir(original_module_directory):
+            modules_filename = os.path.join(original_module_directory, lookup_directory, 'compiled_modules.json')
+            try:
+                with open(modules_filename) as modules_file:
+                    referenced_modules.update(json.load(modules_file))
+            except (IOError, OSError, ValueError):
+                continue
+
+        if not os.path.isdir(self._compiled_module_directory):
+            return
+        for filename in os.listdir(self._compiled_module_directory):
+            # Also remove the bytecode of removed modules.
+            module_name = os.path.splitext(filename)[0] + '.py'
+            if module_name in referenced_modules:
+                continue
+            try:
+                os.remove(os.path.join(self._compiled_module_directory, filename))
+            except OSError:
+                log.warning(u"Unable to remove compiled mako template %s", filename, exc_info=True)
+
+    def _get_indexed_template(self, uri):
+        """
+        Get a template from the mako lookup, using the template index to find its source file if it isn't loaded yet.
+        """
+        if uri not in self._collection:
+            template_filename = self.template_index.get(uri.lstrip('/'))
+            if template_filename is not None:
+                try:
+                    return self._load(template_filename, uri)
+                except (IOError, OSError):
+                    # The index is stale; fall back to searching the lookup directories.
+                    log.warning(u"Mako template index entry for %s is stale", uri)
+        return super(DynamicTemplateLookup, self).get_template(uri)
+
+    def load_indexed_templates(self):
+        """
+        Load every template in the template index.
+
+        When this is done before the server forks its workers, they all share the loaded template modules.
+        """
+        for uri, template_filename in self.template_index.items():
+            if uri not in self._collection:
+                try:
+                    self._load(template_filename, uri)
+                except (IOError, OSError):
+                    # The index is stale; the template is looked up in the lookup directories when it's used.
+                    log.warning(u"Mako template index entry for %s is stale", uri)
 
     def adjust_uri(self, uri, calling_uri):
         """
@@ -104,7 +273,7 @@ class DynamicTemplateLookup(TemplateLookup):
             else:
                 try:
                     # Try to find themed template, i.e. see if current theme overrides the template
-                    template = super(DynamicTemplateLookup, self).get_template(get_template_path_with_theme(uri))
+                    template = self._get_indexed_template(get_template_path_with_theme(uri))
                 except TopLevelLookupException:
                     template = self._get_toplevel_template(uri)
 
@@ -115,7 +284,17 @@ class DynamicTemplateLookup(TemplateLookup):
         Lookup a default/toplevel template, ignoring current theme.
         """
         # Strip off the prefix path to theme and look in default template dirs.
-        return super(DynamicTemplateLookup, self).get_template(strip_site_theme_templates_path(uri))
+        return self._get_indexed_template(strip_site_theme_templates_path(uri))
+
+
+def _write_json_atomically(filename, data):
+    """
+    Write `data` as json to `filename`, replacing it atomically.
+    """
+    temp_filename = u'{}.{}'.format(filename, os.getpid())
+    with open(temp_filename, 'w') as data_file:
+        json.dump(data, data_file)
+    os.rename(temp_filename, filename)
 
 
 def clear_lookups(namespace):
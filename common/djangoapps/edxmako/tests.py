@@ -1,4 +1,7 @@
+import os
+import shutil
 import unittest
+from tempfile import mkdtemp
 
 import ddt
 from django.conf import settings
@@ -7,9 +10,11 @@ from django.http import HttpResponse
 from django.test import TestCase
 from django.test.client import RequestFactory
 from django.test.utils import override_settings
+from mako.lookup import TemplateLookup
 from mock import Mock, patch
 
 from edxmako import LOOKUP, add_lookup
+from edxmako.paths import DynamicTemplateLookup
 from edxmako.request_context import get_template_request_context
 from edxmako.shortcuts import is_any_marketing_link_set, is_marketing_link_set, marketing_link, render_to_string
 from openedx.core.djangoapps.request_cache.middleware import RequestCache
@@ -76,6 +81,63 @@ class AddLookupTests(TestCase):
         self.assertTrue(dirs[0].endswith('management'))
 
 
+class CompileTemplatesTests(TestCase):
+    """
+    Test `DynamicTemplateLookup.compile_templates` and the template index it writes.
+    """
+    def setUp(self):
+        super(CompileTemplatesTests, self).setUp()
+        self.template_dir = mkdtemp()
+        self.addCleanup(shutil.rmtree, self.template_dir)
+        module_dir = mkdtemp()
+        self.addCleanup(shutil.rmtree, module_dir)
+        os.makedirs(os.path.join(self.template_dir, 'sub'))
+        with open(os.path.join(self.template_dir, 'sub', 'hello.html'), 'w') as template_file:
+            template_file.write('Hello ${name}')
+        self.lookup = DynamicTemplateLookup(module_directory=module_dir)
+        self.lookup.add_directory(self.template_dir)
+
+    def test_compile_templates(self):
+        self.assertEqual(self.lookup.compile_templates(), 1)
+        self.assertEqual(
+            self.lookup.template_index,
+            {'sub/hello.html': os.path.join(self.template_dir, 'sub', 'hello.html')},
+        )
+        self.assertTrue(os.path.exists(self.lookup.index_filename))
+
+    def test_indexed_template_lookup(self):
+        self.lookup.compile_templates()
+        # A fresh lookup for the same path reads the index written at compile time.
+        lookup = DynamicTemplateLookup(module_directory=self.lookup.template_args['module_directory'])
+        lookup.directories = self.lookup.directories
+        with patch.object(TemplateLookup, 'get_template') as mock_get_template:
+            template = lookup.get_template('sub/hello.html')
+        self.assertFalse(mock_get_template.called)
+        self.assertEqual(template.render(name='world'), 'Hello world')
+
+    def test_load_stale_indexed_templates(self):
+        self.lookup.compile_templates()
+        os.remove(os.path.join(self.template_dir, 'sub', 'hello.html'))
+        lookup = DynamicTemplateLookup(module_directory=self.lookup.template_args['module_directory'])
+        lookup.directories = self.lookup.directories
+        # Stale index entries are skipped rather than failing the preload.
+        lookup.load_indexed_templates()
+        self.assertNotIn('sub/hello.html', lookup._collection)  # pylint: disable=protected-access
+
+    def test_compile_templates_removes_unreferenced_modules(self):
+        self.lookup.compile_templates()
+        compiled_directory = os.path.join(os.path.dirname(self.lookup.template_args['module_directory']), 'compiled')
+        old_modules = set(os.listdir(compiled_directory))
+        self.assertTrue(old_modules)
+
+        with open(os.path.join(self.template_dir, 'sub', 'hello.html'), 'w') as template_file:
+            template_file.write('Goodbye ${name}')
+        self.lookup.compile_templates()
+        new_modules = set(os.listdir(compiled_directory))
+        self.assertTrue(new_modules)
+        self.assertFalse(old_modules & new_modules)
+
+
 class MakoRequestContextTest(TestCase):
     """
     Test MakoMiddleware.
@@ -1,18 +1,30 @@
+import hashlib
 import logging
 import re
 
 from django.contrib.staticfiles.storage import staticfiles_storage
 from django.contrib.staticfiles import finders
 from django.conf import settings
+from django.core.cache import cache
 
 from xmodule.contentstore.content import StaticContent
 
 from opaque_keys.edx.locator import AssetLocator
 from six import text_type
 
+from openedx.core.djangoapps.request_cache.middleware import RequestCache
+
 log = logging.getLogger(__name__)
 XBLOCK_STATIC_RESOURCE_PREFIX = '/static/xblock'
 
+# Request cache namespace holding resolved static urls, per course version.
+STATIC_URL_CACHE_NAMESPACE = 'static_replace.static_urls'
+# Rewritten fragments are cached per course version, but asset uploads and
+# locks don't bump the course version, so they are only kept briefly.
+REWRITTEN_URLS_CACHE_TIMEOUT = 5 * 60
+
+_COMBINED_URL_REGEXES = {}
+
 
 def _url_replace_regex(prefix):
     """
@@ -109,14 +121,8 @@ def process_static_urls(text, replacement_function, data_dir=None):
         quote = match.group('quote')
         rest = match.group('rest')
 
-        # Don't rewrite XBlock resource links.  Probably wasn't a good idea that /static
-        # works for actual static assets and for magical course asset URLs....
-        full_url = prefix + rest
-
-        starts_with_static_url = full_url.startswith(unicode(settings.STATIC_URL))
-        starts_with_prefix = full_url.startswith(XBLOCK_STATIC_RESOURCE_PREFIX)
-        contains_prefix = XBLOCK_STATIC_RESOURCE_PREFIX in full_url
-        if starts_with_prefix or (starts_with_static_url and contains_prefix):
+        # Don't rewrite XBlock resource links.
+        if _is_xblock_resource_url(prefix, rest):
             return original
 
         return replacement_function(original, prefix, quote, rest)
@@ -148,6 +154,78 @@ def make_static_urls_absolute(request, html):
     )
 
 
+def _is_xblock_resource_url(prefix, rest):
+    """
+    Return whether the url is an XBlock resource link, which must not be rewritten.
+
+    Probably wasn't a good idea that /static works for actual static assets and
+    for magical course asset URLs....
+    """
+    full_url = prefix + rest
+    starts_with_static_url = full_url.startswith(unicode(settings.STATIC_URL))
+    starts_with_prefix = full_url.startswith(XBLOCK_STATIC_RESOURCE_PREFIX)
+    contains_prefix = XBLOCK_STATIC_RESOURCE_PREFIX in full_url
+    return starts_with_prefix or (starts_with_static_url and contains_prefix)
+
+
+def _resolve_static_url(prefix, rest, data_directory, course_id, static_asset_path):
+    """
+    Return the url that a single matched /static/ url should be rewritten to,
+    or None if it should be left alone.
+
+    See replace_static_urls for the meaning of the arguments.
+    """
+    # Don't mess with things that end in '?raw'
+    if rest.endswith('?raw'):
+        return None
+
+    # In debug mode, if we can find the url as is,
+    if settings.DEBUG and finders.find(rest, True):
+        return None
+    # if we're running with a MongoBacked store course_namespace is not None, then use studio style urls
+    elif (not static_asset_path) and course_id:
+        # first look in the static file pipeline and see if we are trying to reference
+        # a piece of static content which is in the edx-platform repo (e.g. JS associated with an xmodule)
+
+        exists_in_staticfiles_storage = False
+        try:
+            exists_in_staticfiles_storage = staticfiles_storage.exists(rest)
+        except Exception as err:
+            log.warning("staticfiles_storage couldn't find path {0}: {1}".format(
+                rest, str(err)))
+
+        if exists_in_staticfiles_storage:
+            url = staticfiles_storage.url(rest)
+        else:
+            # if not, then assume it's courseware specific content and then look in the
+            # Mongo-backed database
+            # Import is placed here to avoid model import at project startup.
+            from static_replace.models import AssetBaseUrlConfig, AssetExcludedExtensionsConfig
+            base_url = AssetBaseUrlConfig.get_base_url()
+            excluded_exts = AssetExcludedExtensionsConfig.get_excluded_extensions()
+            url = StaticContent.get_canonicalized_asset_path(course_id, rest, base_url, excluded_exts)
+
+            if AssetLocator.CANONICAL_NAMESPACE in url:
+                url = url.replace('block@', 'block/', 1)
+
+    # Otherwise, look the file up in staticfiles_storage, and append the data directory if needed
+    else:
+        course_path = "/".join((static_asset_path or data_directory, rest))
+
+        try:
+            if staticfiles_storage.exists(rest):
+                url = staticfiles_storage.url(rest)
+            else:
+                url = staticfiles_storage.url(course_path)
+        # And if that fails, assume that it's course content, and add manually data directory
+        except Exception as err:
+            log.warning("staticfiles_storage couldn't find path {0}: {1}".format(
+                rest, str(err)))
+            url = "".join([prefix, course_path])
+
+    return url
+
+
 def replace_static_urls(text, data_directory=None, course_id=None, static_asset_path=''):
     """
     Replace /static/$stuff urls either with their correct url as generated by collectstatic,
@@ -165,54 +243,108 @@ def replace_static_urls(text, data_directory=None, course_id=None, static_asset_
         """
         Replace a single matched url.
         """
-        # Don't mess with things that end in '?raw'
-        if rest.endswith('?raw'):
+        url = _resolve_static_url(prefix, rest, data_directory, course_id, static_asset_path)
+        if url is None:
             return original
+        return "".join([quote, url, quote])
 
-        # In debug mode, if we can find the url as is,
-        if settings.DEBUG and finders.find(rest, True):
-            return original
-        # if we're running with a MongoBacked store course_namespace is not None, then use studio style urls
-        elif (not static_asset_path) and course_id:
-            # first look in the static file pipeline and see if we are trying to reference
-            # a piece of static content which is in the edx-platform repo (e.g. JS associated with an xmodule)
-
-            exists_in_staticfiles_storage = False
-            try:
-                exists_in_staticfiles_storage = staticfiles_storage.exists(rest)
-            except Exception as err:
-                log.warning("staticfiles_storage couldn't find path {0}: {1}".format(
-                    rest, str(err)))
-
-            if exists_in_staticfiles_storage:
-                url = staticfiles_storage.url(rest)
-            else:
-                # if not, then assume it's courseware specific content and then look in the
-                # Mongo-backed database
-                # Import is placed here to avoid model import at project startup.
-                from static_replace.models import AssetBaseUrlConfig, AssetExcludedExtensionsConfig
-                base_url = AssetBaseUrlConfig.get_base_url()
-                excluded_exts = AssetExcludedExtensionsConfig.get_excluded_extensions()
-                url = StaticContent.get_canonicalized_asset_path(course_id, rest, base_url, excluded_exts)
-
-                if AssetLocator.CANONICAL_NAMESPACE in url:
-                    url = url.replace('block@', 'block/', 1)
-
-        # Otherwise, look the file up in staticfiles_storage, and append the data directory if needed
-        else:
-            course_path = "/".join((static_asset_path or data_directory, rest))
-
-            try:
-                if staticfiles_storage.exists(rest):
-                    url = staticfiles_storage.url(rest)
-                else:
-                    url = staticfiles_storage.url(course_path)
-            # And if that fails, assume that it's course content, and add manually data directory
-            except Exception as err:
-                log.warning("staticfiles_storage couldn't find path {0}: {1}".format(
-                    rest, str(err)))
-                url = "".join([prefix, course_path])
+    return process_static_urls(text, replace_static_url, data_dir=static_asset_path or data_directory)
+
+
+def _combined_url_regex(data_dir, rewrite_course_urls):
+    """
+    Return the compiled regex matching /static/ urls (outside of `data_dir`) and,
+    if `rewrite_course_urls`, /course/ and /jump_to_id/ urls, all in one pass.
 
+    The url matched as /static/ is captured in the `static` group.
+    """
+    key = (settings.STATIC_URL, data_dir, rewrite_course_urls)
+    regex = _COMBINED_URL_REGEXES.get(key)
+    if regex is None:
+        prefixes = [u'(?P<static>(?:{static_url}|/static/)(?!{data_dir}))'.format(
+            static_url=settings.STATIC_URL,
+            data_dir=data_dir
+        )]
+        if rewrite_course_urls:
+            prefixes.extend([u'/course/', u'/jump_to_id/'])
+        regex = _COMBINED_URL_REGEXES[key] = re.compile(_url_replace_regex(u'|'.join(prefixes)))
+    return regex
+
+
+def _rewritten_urls_cache_key(text, data_directory, course_id, course_version, static_asset_path, jump_to_id_base_url):
+    """
+    Return the cache key of `text` rewritten with the given arguments.
+    """
+    key_hash = hashlib.sha1(text.encode('utf-8'))
+    for part in (data_directory, course_id, course_version, static_asset_path, jump_to_id_base_url):
+        key_hash.update(u'|{}'.format(part).encode('utf-8'))
+    return u'static_replace.urls.{}'.format(key_hash.hexdigest())
+
+
+def replace_urls(text, data_directory=None, course_id=None, static_asset_path='', jump_to_id_base_url=None,
+                 course_version=None):
+    """
+    Apply replace_static_urls and, when `course_id` is given, replace_course_urls and
+    replace_jump_to_id_urls (if `jump_to_id_base_url` is given) to `text` in a single pass.
+
+    Static urls resolved for a course version are remembered for the rest of the request.
+    When `course_version` is given, the rewritten text is also cached for a few minutes,
+    so rendering the same content again skips the rewrite entirely.
+
+    text: The source text to do the substitution in
+    course_version: The version of the course the text was loaded from, if known
+    See replace_static_urls and replace_jump_to_id_urls for the other arguments.
+
+    returns: text with the links replaced
+    """
+    data_dir = static_asset_path or data_directory
+    regex = _combined_url_regex(data_dir, course_id is not None)
+    if not regex.search(text):
+        return text
+
+    cache_key = None
+    if course_version:
+        cache_key = _rewritten_urls_cache_key(
+            text, data_directory, course_id, course_version, static_asset_path, jump_to_id_base_url
+        )
+        cached_text = cache.get(cache_key)
+        if cached_text is not None:
+            return cached_text
+
+    static_urls = RequestCache.get_request_cache(STATIC_URL_CACHE_NAMESPACE).setdefault(
+        (data_directory, course_id, course_version, static_asset_path), {}
+    )
+    course_url_prefix = u'/courses/{}/'.format(course_id)
+
+    def replace_url(match):
+        """
+        Replace a single matched url according to its prefix.
+        """
+        original = match.group(0)
+        prefix = match.group('prefix')
+        quote = match.group('quote')
+        rest = match.group('rest')
+
+        if match.group('static') is not None:
+            if _is_xblock_resource_url(prefix, rest):
+                return original
+            url_key = (prefix, rest)
+            if url_key not in static_urls:
+                static_urls[url_key] = _resolve_static_url(
+                    prefix, rest, data_directory, course_id, static_asset_path
+                )
+            url = static_urls[url_key]
+            if url is None:
+                return original
+        elif prefix == '/course/':
+            url = course_url_prefix + rest
+        elif jump_to_id_base_url is not None:
+            url = jump_to_id_base_url + rest
+        else:
+            return original
         return "".join([quote, url, quote])
 
-    return process_static_urls(text, replace_static_url, data_dir=static_asset_path or data_directory)
+    rewritten_text = regex.sub(replace_url, text)
+    if cache_key:
+        cache.set(cache_key, rewritten_text, REWRITTEN_URLS_CACHE_TIMEOUT)
+    return rewritten_text
@@ -19,8 +19,12 @@ from static_replace import (
     make_static_urls_absolute,
     process_static_urls,
     replace_course_urls,
-    replace_static_urls
+    replace_jump_to_id_urls,
+    replace_static_urls,
+    replace_urls
 )
+from openedx.core.djangoapps.request_cache.middleware import RequestCache
+from openedx.core.djangolib.testing.utils import CacheIsolationTestCase
 from xmodule.assetstore.assetmgr import AssetManager
 from xmodule.contentstore.content import StaticContent
 from xmodule.contentstore.django import contentstore
@@ -231,6 +235,63 @@ def test_static_url_with_xblock_resource_on_cdn(mock_modulestore, mock_storage):
     assert_equals(post_text, replace_static_urls(pre_text, DATA_DIRECTORY, COURSE_KEY))
 
 
+class ReplaceUrlsTest(CacheIsolationTestCase):
+    """
+    Tests for the single pass url rewriter.
+    """
+    ENABLED_CACHES = ['default']
+    JUMP_TO_ID_BASE_URL = '/courses/org/course/run/jump_to_id/'
+    SOURCE = (
+        'text <img src="/static/file.png"/> <a href=\'/course/info\'>info</a> '
+        '<a href="/jump_to_id/block_id">block</a> <img src="/static/file.png?raw"/> '
+        '<img src="/static/xblock/resources/block/public/image.png"/> <img src="/static/file.png"/>'
+    )
+
+    def _sequential_replace(self, text):
+        """
+        Apply the three separate replacements, in the order the LMS used to.
+        """
+        text = replace_static_urls(text, DATA_DIRECTORY, COURSE_KEY)
+        text = replace_course_urls(text, COURSE_KEY)
+        return replace_jump_to_id_urls(text, COURSE_KEY, self.JUMP_TO_ID_BASE_URL)
+
+    @patch('static_replace.staticfiles_storage', autospec=True)
+    def test_matches_sequential_replace(self, mock_storage):
+        mock_storage.exists.return_value = True
+        mock_storage.url.side_effect = lambda path: '/static/hashed/' + path
+
+        self.assertEqual(
+            replace_urls(self.SOURCE, DATA_DIRECTORY, COURSE_KEY, jump_to_id_base_url=self.JUMP_TO_ID_BASE_URL),
+            self._sequential_replace(self.SOURCE),
+        )
+        self.assertEqual(replace_urls(self.SOURCE, DATA_DIRECTORY), replace_static_urls(self.SOURCE, DATA_DIRECTORY))
+
+    @patch('static_replace.staticfiles_storage', autospec=True)
+    def test_static_urls_resolved_once(self, mock_storage):
+        mock_storage.exists.return_value = True
+        mock_storage.url.return_value = '/static/file.abc123.png'
+
+        replace_urls(self.SOURCE, DATA_DIRECTORY, COURSE_KEY)
+        replace_urls(STATIC_SOURCE, DATA_DIRECTORY, COURSE_KEY)
+        mock_storage.exists.assert_called_once_with('file.png')
+
+    @patch('static_replace.staticfiles_storage', autospec=True)
+    def test_rewritten_text_cached_per_course_version(self, mock_storage):
+        mock_storage.exists.return_value = True
+        mock_storage.url.return_value = '/static/file.abc123.png'
+
+        expected = '"/static/file.abc123.png"'
+        self.assertEqual(replace_urls(STATIC_SOURCE, DATA_DIRECTORY, COURSE_KEY, course_version='v1'), expected)
+
+        mock_storage.url.return_value = '/static/file.def456.png'
+        RequestCache.clear_request_cache()
+        self.assertEqual(replace_urls(STATIC_SOURCE, DATA_DIRECTORY, COURSE_KEY, course_version='v1'), expected)
+        self.assertEqual(
+            replace_urls(STATIC_SOURCE, DATA_DIRECTORY, COURSE_KEY, course_version='v2'),
+            '"/static/file.def456.png"',
+        )
+
+
 @ddt.ddt
 class CanonicalContentTest(SharedModuleStoreTestCase):
     """
@@ -129,6 +129,8 @@ def check_verify_status_by_course(user, course_enrollments):
     course_deadlines = VerificationDeadline.deadlines_for_courses(enrolled_course_keys)
 
     recent_verification_datetime = None
+    # Whether the user is verified is only looked up, once, if it is needed.
+    user_is_verified = None
 
     for enrollment in course_enrollments:
 
@@ -177,7 +179,9 @@ def check_verify_status_by_course(user, course_enrollments):
             )
             if status is None and not submitted:
                 if deadline is None or deadline > datetime.now(UTC):
-                    if SoftwareSecurePhotoVerification.user_is_verified(user):
+                    if user_is_verified is None:
+                        user_is_verified = SoftwareSecurePhotoVerification.user_is_verified(user)
+                    if user_is_verified:
                         if verification_expiring_soon:
                             # The user has an active verification, but the verification
                             # is set to expire within "EXPIRING_SOON_WINDOW" days (default is 4 weeks).
@@ -441,7 +445,7 @@ class AccountValidationError(Exception):
         self.field = field
 
 
-def cert_info(user, course_overview):
+def cert_info(user, course_overview, cert_status=None):
     """
     Get the certificate info needed to render the dashboard section for the given
     student and course.
@@ -449,6 +453,8 @@ def cert_info(user, course_overview):
     Arguments:
         user (User): A user.
         course_overview (CourseOverview): A course.
+        cert_status (dict): The user's certificate status in the course, as returned
+            by certificate_status_for_student, if it has already been loaded.
 
     Returns:
         dict: A dictionary with keys:
@@ -460,11 +466,9 @@ def cert_info(user, course_overview):
             'grade': if status is not 'processing'
             'can_unenroll': if status allows for unenrollment
     """
-    return _cert_info(
-        user,
-        course_overview,
-        certificate_status_for_student(user, course_overview.id)
-    )
+    if cert_status is None:
+        cert_status = certificate_status_for_student(user, course_overview.id)
+    return _cert_info(user, course_overview, cert_status)
 
 
 def _cert_info(user, course_overview, cert_status):
@@ -987,6 +987,44 @@ class CourseEnrollmentManager(models.Manager):
 CourseEnrollmentState = namedtuple('CourseEnrollmentState', 'mode, is_active')
 
 
+class CourseEnrollmentRoster(object):
+    """
+    A snapshot of the enrollment states of all of the users in a course.
+
+    Get it with CourseEnrollment.get_roster, which loads it with a single
+    query and shares it for the rest of the request or task.  While it is
+    shared, CourseEnrollment.is_enrolled and enrollment_mode_for_user read
+    from it rather than querying each user's enrollment.
+    """
+    NOT_ENROLLED = CourseEnrollmentState(None, None)
+
+    def __init__(self, course_key, states_by_user_id):
+        self.course_key = course_key
+        self._states_by_user_id = states_by_user_id
+
+    def __len__(self):
+        return len(self._states_by_user_id)
+
+    def get_state(self, user_id):
+        """
+        Returns the CourseEnrollmentState of the user in the course, which is
+        (None, None) if the user has no enrollment record.
+        """
+        return self._states_by_user_id.get(user_id, self.NOT_ENROLLED)
+
+    def is_enrolled(self, user_id):
+        """
+        Returns whether the user has an active enrollment in the course.
+        """
+        return self.get_state(user_id).is_active or False
+
+    def active_user_ids(self):
+        """
+        Returns the set of ids of the users with active enrollments in the course.
+        """
+        return {user_id for user_id, state in self._states_by_user_id.iteritems() if state.is_active}
+
+
 class CourseEnrollment(models.Model):
     """
     Represents a Student's Enrollment record for a single Course. You should
@@ -1035,6 +1073,7 @@ class CourseEnrollment(models.Model):
     COURSE_ENROLLMENT_CACHE_KEY = u"enrollment.{}.{}.mode"  # TODO Can this be removed?  It doesn't seem to be used.
 
     MODE_CACHE_NAMESPACE = u'CourseEnrollment.mode_and_active'
+    ROSTER_CACHE_NAMESPACE = u'CourseEnrollment.roster'
 
     class Meta(object):
         unique_together = (('user', 'course'),)
@@ -1547,11 +1586,15 @@ class CourseEnrollment(models.Model):
 
         return status_hash
 
-    def is_paid_course(self):
+    def is_paid_course(self, modes_dict=None):
         """
         Returns True, if course is paid
+
+        Keyword Args:
+            modes_dict (dict): If provided, use these course modes of the course
+                rather than loading them.
         """
-        paid_course = CourseMode.is_white_label(self.course_id)
+        paid_course = CourseMode.is_white_label(self.course_id, modes_dict=modes_dict)
         if paid_course or CourseMode.is_professional_slug(self.mode):
             return True
 
@@ -1855,6 +1898,9 @@ class CourseEnrollment(models.Model):
             return CourseEnrollmentState(None, None)
         enrollment_state = cls._get_enrollment_in_request_cache(user, course_key)
         if not enrollment_state:
+            roster = get_cache(cls.ROSTER_CACHE_NAMESPACE).get(course_key)
+            if roster is not None:
+                return roster.get_state(user.id)
             try:
                 record = cls.objects.get(user=user, course_id=course_key)
                 enrollment_state = CourseEnrollmentState(record.mode, record.is_active)
@@ -1879,6 +1925,32 @@ class CourseEnrollment(models.Model):
             enrollment_state = CourseEnrollmentState(record.mode, record.is_active)
             cls._update_enrollment(cache, record.user.id, course_key, enrollment_state)
 
+    @classmethod
+    def get_roster(cls, course_key):
+        """
+        Returns the CourseEnrollmentRoster of the given course, loading the
+        enrollment states of all of its users with a single query the first
+        time it is requested in this request or task.
+
+        The roster is dropped whenever an enrollment in the course is saved or
+        deleted, so it is reloaded the next time it is requested.
+        """
+        rosters = get_cache(cls.ROSTER_CACHE_NAMESPACE)
+        roster = rosters.get(course_key)
+        if roster is None:
+            # Users share the state tuple of each distinct (mode, is_active)
+            # pair, to keep the rosters of large courses compact.
+            states = {}
+            states_by_user_id = {}
+            enrollments = cls.objects.filter(course_id=course_key).values_list('user_id', 'mode', 'is_active')
+            for user_id, mode, is_active in enrollments.iterator():
+                state = states.get((mode, is_active))
+                if state is None:
+                    state = states[(mode, is_active)] = CourseEnrollmentState(mode, is_active)
+                states_by_user_id[user_id] = state
+            roster = rosters[course_key] = CourseEnrollmentRoster(course_key, states_by_user_id)
+        return roster
+
     @classmethod
     def _get_mode_active_request_cache(cls):
         """
@@ -1921,6 +1993,7 @@ def invalidate_enrollment_mode_cache(sender, instance, **kwargs):  # pylint: dis
         unicode(instance.course_id)
     )
     cache.delete(cache_key)
+    get_cache(CourseEnrollment.ROSTER_CACHE_NAMESPACE).pop(instance.course_id, None)
 
 
 class ManualEnrollmentAudit(models.Model):
@@ -117,6 +117,33 @@ class CourseEnrollmentTests(SharedModuleStoreTestCase):
         )
         self.assertListEqual([self.user, self.user_2], all_enrolled_users)
 
+    def test_roster(self):
+        CourseEnrollmentFactory.create(user=self.user, course_id=self.course.id, mode='verified')
+        CourseEnrollmentFactory.create(user=self.user_2, course_id=self.course.id, is_active=False)
+        other_user = UserFactory()
+
+        with self.assertNumQueries(1):
+            roster = CourseEnrollment.get_roster(self.course.id)
+        self.assertEqual(len(roster), 2)
+        self.assertEqual(roster.active_user_ids(), {self.user.id})
+        self.assertFalse(roster.is_enrolled(other_user.id))
+
+        with self.assertNumQueries(0):
+            self.assertIs(CourseEnrollment.get_roster(self.course.id), roster)
+            self.assertEqual(CourseEnrollment.enrollment_mode_for_user(self.user, self.course.id), ('verified', True))
+            self.assertFalse(CourseEnrollment.is_enrolled(self.user_2, self.course.id))
+            self.assertEqual(CourseEnrollment.enrollment_mode_for_user(other_user, self.course.id), (None, None))
+
+    def test_roster_invalidated_on_enrollment(self):
+        CourseEnrollmentFactory.create(user=self.user, course_id=self.course.id)
+        CourseEnrollment.get_roster(self.course.id)
+
+        CourseEnrollment.enroll(self.user_2, self.course.id)
+
+        roster = CourseEnrollment.get_roster(self.course.id)
+        self.assertEqual(roster.active_user_ids(), {self.user.id, self.user_2.id})
+        self.assertTrue(CourseEnrollment.is_enrolled(self.user_2, self.course.id))
+
     @skip_unless_lms
     # NOTE: We mute the post_save signal to prevent Schedules from being created for new enrollments
     @factory.django.mute_signals(signals.post_save)
@@ -9,8 +9,9 @@ from datetime import timedelta
 import ddt
 from django.conf import settings
 from django.core.urlresolvers import reverse
+from django.db import connection
 from django.test import RequestFactory, TestCase
-from django.test.utils import override_settings
+from django.test.utils import CaptureQueriesContext, override_settings
 from django.utils.timezone import now
 from mock import patch
 from opaque_keys import InvalidKeyError
@@ -31,6 +32,7 @@ from student.helpers import DISABLE_UNENROLL_CERT_STATES
 from student.models import CourseEnrollment, UserProfile
 from student.signals import REFUND_ORDER
 from student.tests.factories import CourseEnrollmentFactory, UserFactory
+from student.views.dashboard import DashboardData
 from util.milestones_helpers import (get_course_milestones,
                                      remove_prerequisite_course,
                                      set_prerequisite_courses)
@@ -576,13 +578,27 @@ class StudentDashboardTests(SharedModuleStoreTestCase, MilestonesTestCaseMixin):
         self.assertIn('You can no longer change sessions.', response.content)
         self.assertIn('Related Programs:', response.content)
 
+    def test_dashboard_data_queries(self):
+        """
+        Verify that the per-course dashboard data is loaded with the same number
+        of queries however many courses the user is enrolled in.
+        """
+        course_enrollments = [CourseEnrollmentFactory(user=self.user) for __ in range(3)]
+        query_counts = []
+        for count in (1, 3):
+            with CaptureQueriesContext(connection) as queries:
+                dashboard_data = DashboardData(self.user, course_enrollments[:count])
+            query_counts.append(len(queries))
+            self.assertEqual(len(dashboard_data.certificate_statuses), count)
+        self.assertEqual(query_counts[0], query_counts[1])
+
     @patch.object(CourseOverview, 'get_from_id')
-    @patch.object(BulkEmailFlag, 'feature_enabled')
+    @patch.object(BulkEmailFlag, 'courses_with_feature_enabled')
     def test_email_settings_fulfilled_entitlement(self, mock_email_feature, mock_course_overview):
         """
         Assert that the Email Settings action is shown when the user has a fulfilled entitlement.
         """
-        mock_email_feature.return_value = True
+        mock_email_feature.side_effect = set
         mock_course_overview.return_value = CourseOverviewFactory(
             start=self.TOMORROW, self_paced=True, enrollment_end=self.TOMORROW
         )
@@ -592,12 +608,12 @@ class StudentDashboardTests(SharedModuleStoreTestCase, MilestonesTestCaseMixin):
         self.assertEqual(pq(response.content)(self.EMAIL_SETTINGS_ELEMENT_ID).length, 1)
 
     @patch.object(CourseOverview, 'get_from_id')
-    @patch.object(BulkEmailFlag, 'feature_enabled')
+    @patch.object(BulkEmailFlag, 'courses_with_feature_enabled')
     def test_email_settings_unfulfilled_entitlement(self, mock_email_feature, mock_course_overview):
         """
         Assert that the Email Settings action is not shown when the entitlement is not fulfilled.
         """
-        mock_email_feature.return_value = True
+        mock_email_feature.side_effect = set
         mock_course_overview.return_value = CourseOverviewFactory(start=self.TOMORROW)
         CourseEntitlementFactory(user=self.user)
         response = self.client.get(self.path)
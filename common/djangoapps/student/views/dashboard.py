@@ -23,6 +23,7 @@ from course_modes.models import CourseMode
 from courseware.access import has_access
 from edxmako.shortcuts import render_to_response, render_to_string
 from entitlements.models import CourseEntitlement
+from lms.djangoapps.certificates.models import certificate_statuses_for_student  # pylint: disable=import-error
 from lms.djangoapps.commerce.utils import EcommerceService  # pylint: disable=import-error
 from lms.djangoapps.verify_student.models import SoftwareSecurePhotoVerification  # pylint: disable=import-error
 from openedx.core.djangoapps import monitoring_utils
@@ -225,6 +226,55 @@ def get_course_enrollments(user, org_whitelist, org_blacklist):
             yield enrollment
 
 
+class DashboardData(object):
+    """
+    The per-course data that the dashboard displays for a user's enrollments.
+
+    Each kind of data is loaded for all of the enrollments at once, with a
+    fixed number of queries, rather than with queries for each enrollment,
+    so that the helpers which render each enrollment can read it from here.
+    """
+    def __init__(self, user, course_enrollments):
+        course_ids = [enrollment.course_id for enrollment in course_enrollments]
+
+        __, unexpired_course_modes = CourseMode.all_and_unexpired_modes_for_courses(course_ids)
+        self.course_modes_by_course = {
+            course_id: {
+                mode.slug: mode
+                for mode in modes
+            }
+            for course_id, modes in iteritems(unexpired_course_modes)
+        }
+
+        self.paid_course_ids = frozenset(
+            enrollment.course_id for enrollment in course_enrollments
+            if enrollment.is_paid_course(modes_dict=self._selectable_modes(enrollment.course_id))
+        )
+
+        self.certificate_statuses = certificate_statuses_for_student(user, course_ids)
+
+        self.redeemed_registration_codes = defaultdict(list)
+        for registration_code in CourseRegistrationCode.objects.filter(
+                course_id__in=course_ids,
+                registrationcoderedemption__redeemed_by=user
+        ).select_related('invoice_item__invoice'):
+            self.redeemed_registration_codes[registration_code.course_id].append(registration_code)
+
+        self.email_enabled_course_ids = BulkEmailFlag.courses_with_feature_enabled(course_ids)
+
+    def _selectable_modes(self, course_id):
+        """
+        Returns the unexpired modes of the course that are shown on the track
+        selection page, like CourseMode.modes_for_course_dict.
+        """
+        modes = {
+            slug: mode
+            for slug, mode in iteritems(self.course_modes_by_course[course_id])
+            if slug not in CourseMode.CREDIT_MODES
+        }
+        return modes or {CourseMode.DEFAULT_MODE.slug: CourseMode.DEFAULT_MODE}
+
+
 def complete_course_mode_info(course_id, enrollment, modes=None):
     """
     We would like to compute some more information from the given course modes
@@ -510,16 +560,10 @@ def student_dashboard(request):
     # Sort the enrollment pairs by the enrollment date
     course_enrollments.sort(key=lambda x: x.created, reverse=True)
 
-    # Retrieve the course modes for each course
-    enrolled_course_ids = [enrollment.course_id for enrollment in course_enrollments]
-    __, unexpired_course_modes = CourseMode.all_and_unexpired_modes_for_courses(enrolled_course_ids)
-    course_modes_by_course = {
-        course_id: {
-            mode.slug: mode
-            for mode in modes
-        }
-        for course_id, modes in iteritems(unexpired_course_modes)
-    }
+    # Load the modes, certificates and other per-course data of all of the
+    # enrollments up front, rather than separately for each enrollment.
+    dashboard_data = DashboardData(user, course_enrollments)
+    course_modes_by_course = dashboard_data.course_modes_by_course
 
     # Check to see if the student has recently enrolled in a course.
     # If so, display a notification message confirming the enrollment.
@@ -632,15 +676,17 @@ def student_dashboard(request):
     # there is no verification messaging to display.
     verify_status_by_course = check_verify_status_by_course(user, course_enrollments)
     cert_statuses = {
-        enrollment.course_id: cert_info(request.user, enrollment.course_overview)
+        enrollment.course_id: cert_info(
+            request.user, enrollment.course_overview,
+            cert_status=dashboard_data.certificate_statuses[enrollment.course_id]
+        )
         for enrollment in course_enrollments
     }
 
     # only show email settings for Mongo course and when bulk email is turned on
     show_email_settings_for = frozenset(
-        enrollment.course_id for enrollment in course_enrollments if (
-            BulkEmailFlag.feature_enabled(enrollment.course_id)
-        )
+        enrollment.course_id for enrollment in course_enrollments
+        if enrollment.course_id in dashboard_data.email_enabled_course_ids
     )
 
     # Verification Attempts
@@ -656,18 +702,12 @@ def student_dashboard(request):
         enrollment.course_id for enrollment in course_enrollments
         if is_course_blocked(
             request,
-            CourseRegistrationCode.objects.filter(
-                course_id=enrollment.course_id,
-                registrationcoderedemption__redeemed_by=request.user
-            ),
+            dashboard_data.redeemed_registration_codes[enrollment.course_id],
             enrollment.course_id
         )
     )
 
-    enrolled_courses_either_paid = frozenset(
-        enrollment.course_id for enrollment in course_enrollments
-        if enrollment.is_paid_course()
-    )
+    enrolled_courses_either_paid = dashboard_data.paid_course_ids
 
     # If there are *any* denied reverifications that have not been toggled off,
     # we'll display the banner
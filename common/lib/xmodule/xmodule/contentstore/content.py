@@ -11,6 +11,7 @@ STREAM_DATA_CHUNK_SIZE = 1024
 VERSIONED_ASSETS_PREFIX = '/assets/courseware'
 VERSIONED_ASSETS_PATTERN = r'/assets/courseware/(v[\d]/)?([a-f0-9]{32})'
 
+import hashlib
 import os
 import logging
 import StringIO
@@ -358,10 +359,13 @@ class ContentStore(object):
     def find(self, filename):
         raise NotImplementedError
 
-    def get_all_content_for_course(self, course_key, start=0, maxresults=-1, sort=None, filter_params=None):
+    def get_all_content_for_course(
+        self, course_key, start=0, maxresults=-1, sort=None, filter_params=None, fields=None
+    ):
         '''
         Returns a list of static assets for a course, followed by the total number of assets.
         By default all assets are returned, but start and maxresults can be provided to limit the query.
+        If fields is given, only those attributes of the assets are returned.
 
         The return format is a list of asset data dictionaries.
         The asset data dictionaries have the following keys:
@@ -386,6 +390,70 @@ class ContentStore(object):
         """
         raise NotImplementedError
 
+    @staticmethod
+    def can_generate_thumbnail(content):
+        """
+        Return whether a thumbnail can be generated for `content`, i.e. whether it is an image.
+        """
+        return content.content_type is not None and content.content_type.split('/')[0] == 'image'
+
+    @staticmethod
+    def _get_thumbnail_name(content, dimensions=None):
+        """
+        Return the name of the thumbnail of `content` with the given `dimensions`.
+        """
+        # use a naming convention to associate originals with the thumbnail
+        return StaticContent.generate_thumbnail_name(
+            content.location.block_id,
+            dimensions=dimensions,
+            extension='.svg' if content.content_type == 'image/svg+xml' else None
+        )
+
+    def get_thumbnail_location(self, content, dimensions=None):
+        """
+        Return the AssetKey the thumbnail of `content` with the given `dimensions` is stored at.
+        """
+        return StaticContent.compute_location(
+            content.location.course_key, self._get_thumbnail_name(content, dimensions), is_thumbnail=True
+        )
+
+    def find_thumbnail(self, content, tempfile_path=None, dimensions=None):
+        """
+        Return the thumbnail previously generated from an image with the same data as `content`, or None.
+
+        Thumbnails are content addressed: each one records the digest of the image it was made from, so
+        an image which is uploaded or imported again unchanged reuses its thumbnail instead of being
+        decoded and scaled once more.
+        """
+        if not self.can_generate_thumbnail(content):
+            return None
+
+        source_digest = _get_source_digest(content, tempfile_path)
+        if source_digest is None:
+            return None
+
+        return self._find_thumbnail(self.get_thumbnail_location(content, dimensions), source_digest)
+
+    def is_thumbnail_referenced(self, thumbnail_location):
+        """
+        Return whether an asset of the thumbnail's course has `thumbnail_location` as its thumbnail.
+        """
+        raise NotImplementedError
+
+    def _find_thumbnail(self, thumbnail_location, source_digest):
+        """
+        Return the thumbnail at `thumbnail_location` if it was made from an image whose digest is
+        `source_digest`, or None. Stores which don't record the digests of thumbnail sources never
+        find one.
+        """
+        return None
+
+    def _save_thumbnail(self, thumbnail_content, source_digest):
+        """
+        Save `thumbnail_content`, which was made from an image whose digest is `source_digest`.
+        """
+        self.save(thumbnail_content)
+
     def generate_thumbnail(self, content, tempfile_path=None, dimensions=None):
         """Create a thumbnail for a given image.
 
@@ -399,16 +467,22 @@ class ContentStore(object):
 
         `dimensions` is an optional param that represents (width, height) in
         pixels. It defaults to None.
+
+        If a thumbnail was already generated from the same image data, it is
+        returned as is.
         """
         thumbnail_content = None
         is_svg = content.content_type == 'image/svg+xml'
-        # use a naming convention to associate originals with the thumbnail
-        thumbnail_name = StaticContent.generate_thumbnail_name(
-            content.location.block_id, dimensions=dimensions, extension='.svg' if is_svg else None
-        )
-        thumbnail_file_location = StaticContent.compute_location(
-            content.location.course_key, thumbnail_name, is_thumbnail=True
-        )
+        thumbnail_name = self._get_thumbnail_name(content, dimensions)
+        thumbnail_file_location = self.get_thumbnail_location(content, dimensions)
+
+        source_digest = None
+        if self.can_generate_thumbnail(content):
+            source_digest = _get_source_digest(content, tempfile_path)
+            if source_digest is not None:
+                thumbnail_content = self._find_thumbnail(thumbnail_file_location, source_digest)
+                if thumbnail_content is not None:
+                    return thumbnail_content, thumbnail_file_location
 
         # if we're uploading an image, then let's generate a thumbnail so that we can
         # serve it up when needed without having to rescale on the fly
@@ -423,8 +497,8 @@ class ContentStore(object):
                         thumbnail_file = StringIO.StringIO(f.read())
                 thumbnail_content = StaticContent(thumbnail_file_location, thumbnail_name,
                                                   'image/svg+xml', thumbnail_file)
-                self.save(thumbnail_content)
-            elif content.content_type is not None and content.content_type.split('/')[0] == 'image':
+                self._save_thumbnail(thumbnail_content, source_digest)
+            elif self.can_generate_thumbnail(content):
                 # use PIL to do the thumbnail generation (http://www.pythonware.com/products/pil/)
                 # My understanding is that PIL will maintain aspect ratios while restricting
                 # the max-height/width to be whatever you pass in as 'size'
@@ -453,7 +527,7 @@ class ContentStore(object):
                 thumbnail_content = StaticContent(thumbnail_file_location, thumbnail_name,
                                                   'image/jpeg', thumbnail_file)
 
-                self.save(thumbnail_content)
+                self._save_thumbnail(thumbnail_content, source_digest)
 
         except Exception, exc:  # pylint: disable=broad-except
             # log and continue as thumbnails are generally considered as optional
@@ -469,3 +543,26 @@ class ContentStore(object):
         an exception if unable to.
         """
         pass
+
+
+def _get_source_digest(content, tempfile_path=None):
+    """
+    Return the md5 digest of the data of `content`, read from `tempfile_path` if given,
+    or None if it can't be computed without consuming the data.
+    """
+    if tempfile_path is not None:
+        md5 = hashlib.md5()
+        with open(tempfile_path, 'rb') as source:
+            for chunk in iter(lambda: source.read(64 * STREAM_DATA_CHUNK_SIZE), b''):
+                md5.update(chunk)
+        return md5.hexdigest()
+
+    # Assets read back from the contentstore carry the digest of their data.
+    content_digest = getattr(content, 'content_digest', None)
+    if content_digest:
+        return content_digest
+
+    data = getattr(content, 'data', None)
+    if isinstance(data, basestring):
+        return hashlib.md5(data).hexdigest()
+    return None
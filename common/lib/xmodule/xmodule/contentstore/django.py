@@ -28,3 +28,14 @@ def contentstore(name='default'):
         _CONTENTSTORE[name] = class_(**options)
 
     return _CONTENTSTORE[name]
+
+
+def clear_existing_contentstores():
+    """
+    Clear the existing contentstore instances, causing
+    them to be re-created when accessed again.
+
+    This is useful for processes which must not share their parent's
+    database connections, such as forked workers.
+    """
+    _CONTENTSTORE.clear()
@@ -1,15 +1,22 @@
 """
 MongoDB/GridFS-level code for the contentstore.
 """
+import calendar
 import os
 import json
+import tarfile
+from io import BytesIO
+from time import time
+
 import pymongo
 import gridfs
+from django.core.cache import cache
 from gridfs.errors import NoFile
 from fs.osfs import OSFS
 from bson.son import SON
 
 from mongodb_proxy import autoretry_read
+from opaque_keys import InvalidKeyError
 from opaque_keys.edx.keys import AssetKey
 from xmodule.contentstore.content import XASSET_LOCATION_TAG
 from xmodule.exceptions import NotFoundError
@@ -18,6 +25,17 @@ from xmodule.util.misc import escape_invalid_characters
 from xmodule.mongo_utils import connect_to_mongodb, create_collection_index
 from .content import StaticContent, ContentStore, StaticContentStream
 
+# The attributes of the assets returned by `MongoContentStore.get_all_content_for_course` when they
+# are sorted by displayname, which requires listing the fields.
+ASSET_FIELDS = (
+    'contentType', 'locked', 'chunkSize', 'content_son', 'displayname', 'filename', 'length',
+    'import_path', 'uploadDate', 'thumbnail_location', 'md5',
+)
+
+# Seconds the number of assets in a course is cached for. Changes made through
+# this class clear it right away.
+ASSET_COUNT_CACHE_TIMEOUT = 10 * 60
+
 
 class MongoContentStore(ContentStore):
     """
@@ -100,12 +118,16 @@ class MongoContentStore(ContentStore):
             else:
                 fp.write(content.data)
 
+        self._clear_asset_counts(_course_fields(content.location.course_key))
         return content
 
     def delete(self, location_or_id):
         """
         Delete an asset.
         """
+        course_fields = _asset_course_fields(location_or_id)
+        if course_fields:
+            self._clear_asset_counts(course_fields)
         if isinstance(location_or_id, AssetKey):
             location_or_id, _ = self.asset_db_key(location_or_id)
         # Deletes of non-existent files are considered successful
@@ -152,19 +174,51 @@ class MongoContentStore(ContentStore):
             else:
                 return None
 
+    def is_thumbnail_referenced(self, thumbnail_location):
+        """
+        Return whether an asset of the thumbnail's course has `thumbnail_location` as its thumbnail.
+        """
+        query = query_for_course(thumbnail_location.course_key, 'asset')
+        query['thumbnail_location'] = thumbnail_location.to_deprecated_list_repr()
+        return self.fs_files.find_one(query, {'_id': True}) is not None
+
+    def _find_thumbnail(self, thumbnail_location, source_digest):
+        """
+        Return the thumbnail at `thumbnail_location` if it was made from an image whose digest is
+        `source_digest`, or None.
+        """
+        content_id, __ = self.asset_db_key(thumbnail_location)
+        if self.fs_files.find_one({'_id': content_id, 'source_md5': source_digest}, {'_id': True}) is None:
+            return None
+        return self.find(thumbnail_location, throw_on_not_found=False)
+
+    def _save_thumbnail(self, thumbnail_content, source_digest):
+        """
+        Save `thumbnail_content` along with the digest of the image it was made from.
+        """
+        self.save(thumbnail_content)
+        if source_digest is not None:
+            self.set_attr(thumbnail_content.location, 'source_md5', source_digest)
+
+    @staticmethod
+    def _export_location(name, import_path, output_directory):
+        """
+        Return the directory and the file name under which an asset should be exported.
+        """
+        if import_path is not None:
+            output_directory = output_directory + '/' + os.path.dirname(import_path)
+
+        # Escape invalid char from filename.
+        export_name = escape_invalid_characters(name=name, invalid_char_list=['/', '\\'])
+        return output_directory, export_name
+
     def export(self, location, output_directory):
         content = self.find(location)
 
-        filename = content.name
-        if content.import_path is not None:
-            output_directory = output_directory + '/' + os.path.dirname(content.import_path)
-
+        output_directory, export_name = self._export_location(content.name, content.import_path, output_directory)
         if not os.path.exists(output_directory):
             os.makedirs(output_directory)
 
-        # Escape invalid char from filename.
-        export_name = escape_invalid_characters(name=filename, invalid_char_list=['/', '\\'])
-
         disk_fs = OSFS(output_directory)
 
         with disk_fs.open(export_name, 'wb') as asset_file:
@@ -194,19 +248,61 @@ class MongoContentStore(ContentStore):
             # When debugging course exports, this might be a good place
             # to look. -- pmitros
             self.export(asset['asset_key'], output_directory)
-            for attr, value in asset.iteritems():
-                if attr not in ['_id', 'md5', 'uploadDate', 'length', 'chunkSize', 'asset_key']:
-                    policy.setdefault(asset['asset_key'].block_id, {})[attr] = value
+            self._add_asset_to_policy(policy, asset)
 
         with open(assets_policy_file, 'w') as f:
             json.dump(policy, f, sort_keys=True, indent=4)
 
+    def export_all_for_course_to_tarball(self, course_key, tarball, output_directory, assets_policy_file):
+        """
+        Add all of this course's assets and their policy file to an open tarball. Each asset is
+        copied out of GridFS chunk by chunk, so no asset is ever held in memory or on disk whole.
+
+        Args:
+            course_key (CourseKey): the :class:`CourseKey` identifying the course
+            tarball (tarfile.TarFile): the tarball, opened for writing (it may be a stream)
+            output_directory: the directory within the tarball under which to put all the asset files
+            assets_policy_file: the path within the tarball for the policy file
+        """
+        policy = {}
+        assets, __ = self.get_all_content_for_course(course_key)
+
+        for asset in assets:
+            content_id, __ = self.asset_db_key(asset['asset_key'])
+            with self.fs.get(content_id) as grid_file:
+                export_directory, export_name = self._export_location(
+                    grid_file.displayname, getattr(grid_file, 'import_path', None), output_directory
+                )
+                tar_info = tarfile.TarInfo(os.path.normpath(export_directory + '/' + export_name).encode('utf-8'))
+                tar_info.size = grid_file.length
+                tar_info.mtime = calendar.timegm(grid_file.uploadDate.utctimetuple())
+                tarball.addfile(tar_info, grid_file)
+            self._add_asset_to_policy(policy, asset)
+
+        policy_data = json.dumps(policy, sort_keys=True, indent=4)
+        tar_info = tarfile.TarInfo(assets_policy_file.encode('utf-8'))
+        tar_info.size = len(policy_data)
+        tar_info.mtime = time()
+        tarball.addfile(tar_info, BytesIO(policy_data))
+
+    @staticmethod
+    def _add_asset_to_policy(policy, asset):
+        """
+        Record an asset's exportable attributes in the assets policy dict.
+        """
+        for attr, value in asset.iteritems():
+            if attr not in ['_id', 'md5', 'uploadDate', 'length', 'chunkSize', 'asset_key']:
+                policy.setdefault(asset['asset_key'].block_id, {})[attr] = value
+
     def get_all_content_thumbnails_for_course(self, course_key):
         return self._get_all_content_for_course(course_key, get_thumbnails=True)[0]
 
-    def get_all_content_for_course(self, course_key, start=0, maxresults=-1, sort=None, filter_params=None):
+    def get_all_content_for_course(
+        self, course_key, start=0, maxresults=-1, sort=None, filter_params=None, fields=None
+    ):
         return self._get_all_content_for_course(
-            course_key, start=start, maxresults=maxresults, get_thumbnails=False, sort=sort, filter_params=filter_params
+            course_key, start=start, maxresults=maxresults, get_thumbnails=False, sort=sort,
+            filter_params=filter_params, fields=fields
         )
 
     def remove_redundant_content_for_courses(self):
@@ -224,6 +320,7 @@ class MongoContentStore(ContentStore):
             items = self.fs_files.find(query)
             assets_to_delete = assets_to_delete + items.count()
             for asset in items:
+                self._clear_asset_counts(_asset_course_fields(asset[prefix]))
                 self.fs.delete(asset[prefix])
 
             self.fs_files.remove(query)
@@ -236,7 +333,8 @@ class MongoContentStore(ContentStore):
                                     start=0,
                                     maxresults=-1,
                                     sort=None,
-                                    filter_params=None):
+                                    filter_params=None,
+                                    fields=None):
         '''
         Returns a list of all static assets for a course. The return format is a list of asset data dictionary elements.
 
@@ -246,74 +344,97 @@ class MongoContentStore(ContentStore):
             uploadDate (datetime.datetime): The date and time that the file was uploadDate
             contentType: The mimetype string of the asset
             md5: An md5 hash of the asset content
+
+        If `fields` is given, only those attributes (and asset_key) are fetched.
         '''
-        # TODO: Using an aggregate() instead of a find() here is a hack to get around the fact that Mongo 3.2 does not
-        # support sorting case-insensitively.
-        # If a sort on displayname is requested, the aggregation pipeline creates a new field:
-        # `insensitive_displayname`, a lowercase version of `displayname` that is sorted on instead.
-        # Mongo 3.4 does not require this hack. When upgraded, change this aggregation back to a find and specifiy
-        # a collation based on user's language locale instead.
-        # See: https://openedx.atlassian.net/browse/EDUCATOR-2221
-        pipeline_stages = []
-        query = query_for_course(course_key, 'asset' if not get_thumbnails else 'thumbnail')
+        category = 'asset' if not get_thumbnails else 'thumbnail'
+        query = query_for_course(course_key, category)
         if filter_params:
             query.update(filter_params)
-        pipeline_stages.append({'$match': query})
-
-        if sort:
-            sort = dict(sort)
-            if 'displayname' in sort:
-                pipeline_stages.append({
-                    '$project': {
-                        'contentType': 1,
-                        'locked': 1,
-                        'chunkSize': 1,
-                        'content_son': 1,
-                        'displayname': 1,
-                        'filename': 1,
-                        'length': 1,
-                        'import_path': 1,
-                        'uploadDate': 1,
-                        'thumbnail_location': 1,
-                        'md5': 1,
-                        'insensitive_displayname': {
-                            '$toLower': '$displayname'
-                        }
-                    }
-                })
-                sort = {'insensitive_displayname': sort['displayname']}
-            pipeline_stages.append({'$sort': sort})
-
-        # This is another hack to get the total query result count, but only the Nth page of actual documents
-        # See: https://stackoverflow.com/a/39784851/6620612
-        pipeline_stages.append({'$group': {'_id': None, 'count': {'$sum': 1}, 'results': {'$push': '$$ROOT'}}})
-        if maxresults > 0:
-            pipeline_stages.append({
-                '$project': {
-                    'count': 1,
-                    'results': {
-                        '$slice': ['$results', start, maxresults]
-                    }
-                }
-            })
-
-        items = self.fs_files.aggregate(pipeline_stages)
-        if items['result']:
-            result = items['result'][0]
-            count = result['count']
-            assets = list(result['results'])
+
+        count = self._count_content_for_course(course_key, category, query, cacheable=not filter_params)
+
+        projection = None
+        if fields:
+            projection = {field: 1 for field in fields}
+            projection['content_son'] = 1
+
+        # Break ties on _id so that pages are stable.
+        sort = list(sort or [])
+        if sort and sort[0][0] != '_id':
+            sort = [sort[0], ('_id', sort[0][1])]
+
+        # Using an aggregate() instead of a find() for displayname is a hack to get around the fact that Mongo 3.2
+        # does not support sorting case-insensitively.
+        # The aggregation pipeline creates a new field: `insensitive_displayname`, a lowercase version of
+        # `displayname` that is sorted on instead.
+        # Mongo 3.4 does not require this hack. When upgraded, use a find and specify
+        # a collation based on user's language locale instead.
+        # See: https://openedx.atlassian.net/browse/EDUCATOR-2221
+        if sort and sort[0][0] == 'displayname':
+            sort[0] = ('insensitive_displayname', sort[0][1])
+            pipeline_stages = [
+                {'$match': query},
+                {'$project': dict(
+                    projection or {field: 1 for field in ASSET_FIELDS},
+                    insensitive_displayname={'$toLower': '$displayname'}
+                )},
+                {'$sort': SON(sort)},
+            ]
+            if maxresults > 0:
+                if start:
+                    pipeline_stages.append({'$skip': start})
+                pipeline_stages.append({'$limit': maxresults})
+            assets = self.fs_files.aggregate(pipeline_stages)['result']
         else:
-            # no results
-            count = 0
-            assets = []
+            cursor = self.fs_files.find(query, projection)
+            if sort:
+                cursor = cursor.sort(sort)
+            if maxresults > 0:
+                if start:
+                    cursor = cursor.skip(start)
+                cursor = cursor.limit(maxresults)
+            assets = list(cursor)
 
         # We're constructing the asset key immediately after retrieval from the database so that
         # callers are insulated from knowing how our identifiers are stored.
         for asset in assets:
+            asset.pop('insensitive_displayname', None)
             asset_id = asset.get('content_son', asset['_id'])
             asset['asset_key'] = course_key.make_asset_key(asset_id['category'], asset_id['name'])
         return assets, count
 
+    def _count_content_for_course(self, course_key, category, query, cacheable):
+        """
+        Returns the number of assets matching the query. The total number of assets of the
+        category in the course is cached.
+        """
+        if not cacheable:
+            return self.fs_files.find(query).count()
+
+        cache_key = self._asset_count_cache_key(_course_fields(course_key), category)
+        count = cache.get(cache_key)
+        if count is None:
+            count = self.fs_files.find(query).count()
+            cache.set(cache_key, count, ASSET_COUNT_CACHE_TIMEOUT)
+        return count
+
+    def _asset_count_cache_key(self, course_fields, category):
+        """
+        Returns the cache key of the number of assets of the category in the course.
+        """
+        return u'contentstore.asset_count.{}.{}.{}'.format(
+            self.fs_files.full_name, u'.'.join(unicode(field) for field in course_fields), category
+        )
+
+    def _clear_asset_counts(self, course_fields):
+        """
+        Clears the cached asset counts of the course.
+        """
+        cache.delete_many([
+            self._asset_count_cache_key(course_fields, category) for category in ('asset', 'thumbnail')
+        ])
+
     def set_attr(self, asset_key, attr, value=True):
         """
         Add/set the given attr on the asset at the given location. Does not allow overwriting gridFS built in
@@ -413,6 +534,7 @@ class MongoContentStore(ContentStore):
                 # getattr b/c caching may mean some pickled instances don't have attr
                 locked=asset.get('locked', False)
             )
+        self._clear_asset_counts(_course_fields(dest_course_key))
 
     def delete_all_course_assets(self, course_key):
         """
@@ -425,6 +547,7 @@ class MongoContentStore(ContentStore):
         for asset in matching_assets:
             asset_key = self.make_id_son(asset)
             self.fs.delete(asset_key)
+        self._clear_asset_counts(_course_fields(course_key))
 
     # codifying the original order which pymongo used for the dicts coming out of location_to_dict
     # stability of order is more important than sanity of order as any changes to order make things
@@ -557,6 +680,22 @@ class MongoContentStore(ContentStore):
             sparse=True,
             background=True
         )
+        # Index needed for counting a course's assets without fetching them, and for paging through
+        # them by `_get_all_content_for_course` with its default `uploadDate` sort.
+        create_collection_index(
+            self.fs_files,
+            [
+                ('content_son.tag', pymongo.ASCENDING),
+                ('content_son.org', pymongo.ASCENDING),
+                ('content_son.course', pymongo.ASCENDING),
+                ('content_son.run', pymongo.ASCENDING),
+                ('content_son.category', pymongo.ASCENDING),
+                ('uploadDate', pymongo.ASCENDING),
+                ('_id', pymongo.ASCENDING)
+            ],
+            sparse=True,
+            background=True
+        )
 
 
 def query_for_course(course_key, category=None):
@@ -580,3 +719,27 @@ def query_for_course(course_key, category=None):
     else:
         dbkey['{}.run'.format(prefix)] = course_key.run
     return dbkey
+
+
+def _course_fields(course_key):
+    """
+    Returns the (org, course, run) identifying the course in the asset ids; run is None
+    for deprecated course keys.
+    """
+    run = None if getattr(course_key, 'deprecated', False) else course_key.run
+    return course_key.org, course_key.course, run
+
+
+def _asset_course_fields(location_or_id):
+    """
+    Returns the (org, course, run) of the course an asset key or database id belongs to,
+    or None if it can't be determined.
+    """
+    if isinstance(location_or_id, AssetKey):
+        return _course_fields(location_or_id.course_key)
+    elif isinstance(location_or_id, dict):
+        return location_or_id.get('org'), location_or_id.get('course'), location_or_id.get('run')
+    try:
+        return _course_fields(AssetKey.from_string(location_or_id).course_key)
+    except InvalidKeyError:
+        return None
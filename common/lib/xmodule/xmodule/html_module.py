@@ -79,6 +79,15 @@ class HtmlBlock(object):
         """
         return Fragment(self.get_html())
 
+    def has_support(self, view, functionality):
+        """
+        The student view is user independent, unless the html includes the
+        user's anonymous id.
+        """
+        if functionality == "user_independent":
+            return getattr(view, '__name__', None) == 'student_view' and "%%USER_ID%%" not in (self.data or "")
+        return super(HtmlBlock, self).has_support(view, functionality)
+
     def student_view_data(self, context=None):  # pylint: disable=unused-argument
         """
         Return a JSON representation of the student_view of this XBlock.
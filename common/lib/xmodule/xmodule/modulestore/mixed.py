@@ -606,6 +606,15 @@ class MixedModuleStore(ModuleStoreDraftAndPublished, ModuleStoreWriteBase):
         except NotImplementedError:
             return None, None
 
+    def diff_structures(self, old_version, new_version):
+        """
+        Returns a StructureDiff of the blocks added, removed, and changed between two versions of a course.
+
+        Raises NotImplementedError if the course's modulestore does not version its structures.
+        """
+        store = self._verify_modulestore_support(new_version, 'diff_structures')
+        return store.diff_structures(old_version, new_version)
+
     def get_modulestore_type(self, course_id):
         """
         Returns a type which identifies which modulestore is servicing the given course_id.
@@ -21,3 +21,11 @@ class BlockKey(namedtuple('BlockKey', 'type id')):
 
 
 CourseEnvelope = namedtuple('CourseEnvelope', 'course_key structure')
+
+
+# A single block's change between two structures: whether its settings/children or its definition pointer moved.
+BlockChange = namedtuple('BlockChange', 'fields_changed definition_changed')
+
+# The result of comparing two structures: sets of added and removed usage keys, and a dict of
+# changed usage keys to BlockChange.
+StructureDiff = namedtuple('StructureDiff', 'added removed changed')
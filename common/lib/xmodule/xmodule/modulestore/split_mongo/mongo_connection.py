@@ -1,13 +1,16 @@
 """
 Segregation of pymongo functions from the data modeling mechanisms for split modulestore.
 """
+import copy
 import datetime
 import cPickle as pickle
 import math
+import threading
 import zlib
 import pymongo
 import pytz
 import re
+from collections import OrderedDict
 from contextlib import contextmanager
 from time import time
 
@@ -279,16 +282,83 @@ class CourseStructureCache(object):
             self.cache.set(key, compressed_pickled_data, None)
 
 
+# How many definitions split keeps in each process-local DefinitionCache unless configured otherwise.
+DEFAULT_DEFINITION_CACHE_SIZE = 1000
+
+
+class DefinitionCache(object):
+    """
+    A bounded, process-local LRU cache of definition documents keyed by their id.
+
+    Definitions are immutable once written (an edit always creates a new definition id), so
+    entries never need invalidating and can be shared across requests. Callers are handed
+    copies so that in-place edits of a fetched definition can't leak into the cache.
+
+    A max_size of 0 disables the cache.
+    """
+    def __init__(self, max_size=DEFAULT_DEFINITION_CACHE_SIZE):
+        self.max_size = max_size
+        self._definitions = OrderedDict()
+        self._lock = threading.Lock()
+
+    def can_hold(self, count):
+        """
+        Return whether `count` definitions would fit in the cache at once.
+        """
+        return 0 < count <= self.max_size
+
+    def get_many(self, ids):
+        """
+        Return a dict of {id: definition} for the ids which are cached, marking them as recently used.
+        """
+        found = {}
+        if not self.max_size:
+            return found
+
+        with self._lock:
+            for definition_id in ids:
+                definition = self._definitions.pop(definition_id, None)
+                if definition is not None:
+                    self._definitions[definition_id] = definition
+                    found[definition_id] = definition
+        return {definition_id: copy.deepcopy(definition) for definition_id, definition in found.iteritems()}
+
+    def set_many(self, definitions):
+        """
+        Add the given definition documents to the cache, evicting the least recently used ones.
+        """
+        if not self.max_size:
+            return
+
+        definitions = [copy.deepcopy(definition) for definition in definitions]
+        with self._lock:
+            for definition in definitions:
+                self._definitions.pop(definition['_id'], None)
+                self._definitions[definition['_id']] = definition
+            while len(self._definitions) > self.max_size:
+                self._definitions.popitem(last=False)
+
+    def clear(self):
+        """
+        Remove all entries from the cache.
+        """
+        with self._lock:
+            self._definitions.clear()
+
+
 class MongoConnection(object):
     """
     Segregation of pymongo functions from the data modeling mechanisms for split modulestore.
     """
     def __init__(
         self, db, collection, host, port=27017, tz_aware=True, user=None, password=None,
-        asset_collection=None, retry_wait_time=0.1, **kwargs
+        asset_collection=None, retry_wait_time=0.1,
+        definition_cache_size=DEFAULT_DEFINITION_CACHE_SIZE, **kwargs
     ):
         """
         Create & open the connection, authenticate, and provide pointers to the collections
+
+        definition_cache_size: how many definitions to keep in the process-local DefinitionCache (0 disables it)
         """
         # Set a write concern of 1, which makes writes complete successfully to the primary
         # only before returning. Also makes pymongo report write errors.
@@ -303,6 +373,7 @@ class MongoConnection(object):
         self.course_index = self.database[collection + '.active_versions']
         self.structures = self.database[collection + '.structures']
         self.definitions = self.database[collection + '.definitions']
+        self.definition_cache = DefinitionCache(definition_cache_size)
 
     def heartbeat(self):
         """
@@ -555,7 +626,12 @@ class MongoConnection(object):
         Get the definition from the persistence mechanism whose id is the given key
         """
         with TIMER.timer("get_definition", course_context) as tagger:
-            definition = self.definitions.find_one({'_id': key})
+            definition = self.definition_cache.get_many([key]).get(key)
+            tagger.tag(from_cache=str(definition is not None).lower())
+            if definition is None:
+                definition = self.definitions.find_one({'_id': key})
+                if definition is not None:
+                    self.definition_cache.set_many([definition])
             tagger.measure("fields", len(definition['fields']))
             tagger.tag(block_type=definition['block_type'])
             return definition
@@ -563,11 +639,20 @@ class MongoConnection(object):
     def get_definitions(self, definitions, course_context=None):
         """
         Retrieve all definitions listed in `definitions`.
+
+        Definitions found in the definition cache are not queried for.
         """
         with TIMER.timer("get_definitions", course_context) as tagger:
             tagger.measure('definitions', len(definitions))
-            definitions = self.definitions.find({'_id': {'$in': definitions}})
-            return definitions
+            cached = self.definition_cache.get_many(definitions)
+            tagger.measure('cached_definitions', len(cached))
+            missing = [definition_id for definition_id in definitions if definition_id not in cached]
+            if not missing:
+                return cached.values()
+
+            found = list(self.definitions.find({'_id': {'$in': missing}}))
+            self.definition_cache.set_many(found)
+            return cached.values() + found
 
     def insert_definition(self, definition, course_context=None):
         """
@@ -622,6 +707,7 @@ class MongoConnection(object):
         If connections is True, then close the connection to the database as well.
         """
         connection = self.database.connection
+        self.definition_cache.clear()
 
         if database:
             connection.drop_database(self.database.name)
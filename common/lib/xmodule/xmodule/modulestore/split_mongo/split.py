@@ -86,8 +86,10 @@ from xmodule.modulestore import (
 from ..exceptions import ItemNotFoundError
 from .caching_descriptor_system import CachingDescriptorSystem
 from xmodule.partitions.partitions_service import PartitionService
-from xmodule.modulestore.split_mongo.mongo_connection import MongoConnection, DuplicateKeyError
-from xmodule.modulestore.split_mongo import BlockKey, CourseEnvelope
+from xmodule.modulestore.split_mongo.mongo_connection import (
+    DEFAULT_DEFINITION_CACHE_SIZE, DuplicateKeyError, MongoConnection
+)
+from xmodule.modulestore.split_mongo import BlockKey, CourseEnvelope, BlockChange, StructureDiff
 from xmodule.modulestore.store_utilities import DETACHED_XBLOCK_TYPES
 from xmodule.error_module import ErrorDescriptor
 from collections import defaultdict
@@ -697,14 +699,16 @@ class SplitMongoModuleStore(SplitBulkWriteMixin, ModuleStoreWriteBase):
                  default_class=None,
                  error_tracker=null_error_tracker,
                  i18n_service=None, fs_service=None, user_service=None,
-                 services=None, signal_handler=None, **kwargs):
+                 services=None, signal_handler=None, definition_cache_size=DEFAULT_DEFINITION_CACHE_SIZE, **kwargs):
         """
         :param doc_store_config: must have a host, db, and collection entries. Other common entries: port, tz_aware.
+        :param definition_cache_size: how many definitions to keep in a process-local LRU cache. Definitions
+            are immutable by id, so the cache is shared across requests. 0 disables the cache.
         """
 
         super(SplitMongoModuleStore, self).__init__(contentstore, **kwargs)
 
-        self.db_connection = MongoConnection(**doc_store_config)
+        self.db_connection = MongoConnection(definition_cache_size=definition_cache_size, **doc_store_config)
 
         if default_class is not None:
             module_path, __, class_name = default_class.rpartition('.')
@@ -783,7 +787,20 @@ class SplitMongoModuleStore(SplitBulkWriteMixin, ModuleStoreWriteBase):
 
             # This method supports lazy loading, where the descendent definitions aren't loaded
             # until they're actually needed.
-            if not lazy:
+            if lazy:
+                # When a subtree is being loaded, fetch all of its definitions in one query so that
+                # the lazy loaders find them in the definition cache instead of each making a round-trip.
+                # Skip this if the definitions wouldn't all fit in the cache anyway.
+                if depth != 0 and self.db_connection.definition_cache.can_hold(len(new_module_data)):
+                    self.get_definitions(
+                        course_key,
+                        [
+                            block.definition
+                            for block in new_module_data.itervalues()
+                            if block.definition is not None and not block.definition_loaded
+                        ]
+                    )
+            else:
                 # Non-lazy loading: Load all descendants by id.
                 descendent_definitions = self.get_definitions(
                     course_key,
@@ -1033,19 +1050,32 @@ class SplitMongoModuleStore(SplitBulkWriteMixin, ModuleStoreWriteBase):
 
         :param branch: the branch for which to return courses.
         """
-        def extract_course_summary(course):
-            """
-            Extract course information from the course block for split.
-            """
-            return {
-                field: course.fields[field]
-                for field in CourseSummary.course_info_fields
-                if field in course.fields
-            }
-
         courses_summaries = []
-        for entry, structure_info in self._get_courselike_blocks_for_branch(branch, **kwargs):
-            course_locator = self._create_course_locator(structure_info, branch=None)
+        matching_version_guids, indexes_by_version = self.collect_ids_from_matching_indexes(branch, **kwargs)
+
+        # Most indexes carry a summary of their head structure's course block (see _update_course_summary),
+        # so only the structures of the remaining ones need to be read.
+        version_guids = []
+        id_version_map = defaultdict(list)
+        for version_guid in matching_version_guids:
+            if version_guid not in indexes_by_version:
+                # an index sharing this version was already handled
+                continue
+            for course_index in indexes_by_version.pop(version_guid):
+                summary = course_index.get('summaries', {}).get(branch)
+                if summary is not None and summary['version'] == version_guid:
+                    courses_summaries.append(
+                        CourseSummary(self._create_course_locator(course_index, branch=None), **summary['fields'])
+                    )
+                else:
+                    id_version_map[version_guid].append(course_index)
+            if version_guid in id_version_map:
+                version_guids.append(version_guid)
+
+        if not version_guids:
+            return courses_summaries
+
+        for entry in self.find_courselike_blocks_by_id(version_guids, self.DEFAULT_ROOT_COURSE_BLOCK_TYPE):
             course_block = [
                 block_data
                 for block_key, block_data in entry['blocks'].items()
@@ -1058,10 +1088,11 @@ class SplitMongoModuleStore(SplitBulkWriteMixin, ModuleStoreWriteBase):
                 raise MultipleCourseBlocksFound(
                     "Expected 1 course block to be found in the course, but found {0}".format(len(course_block))
                 )
-            course_summary = extract_course_summary(course_block[0])
-            courses_summaries.append(
-                CourseSummary(course_locator, **course_summary)
-            )
+            course_summary = _extract_course_summary(course_block[0])
+            for course_index in id_version_map[entry['_id']]:
+                courses_summaries.append(
+                    CourseSummary(self._create_course_locator(course_index, branch=None), **course_summary)
+                )
         return courses_summaries
 
     @autoretry_read()
@@ -1593,6 +1624,62 @@ class SplitMongoModuleStore(SplitBulkWriteMixin, ModuleStoreWriteBase):
             result
         )
 
+    def diff_structures(self, old_version, new_version):
+        """
+        Find which blocks were added, removed, or changed between two structures of a course.
+
+        Blocks present in both structures are only inspected further if their edit_info.update_version
+        differs, so this runs in time linear in the number of blocks and never loads definitions.
+
+        :param old_version: a CourseLocator for the earlier structure (either a branch head or a version_guid)
+        :param new_version: a CourseLocator for the later structure (either a branch head or a version_guid)
+        :return StructureDiff(
+            added: set of BlockUsageLocators only in new_version,
+            removed: set of BlockUsageLocators only in old_version,
+            changed: {BlockUsageLocator: BlockChange(fields_changed, definition_changed)}
+        )
+        The returned usage keys are relative to new_version without its version_guid.
+        """
+        for course_locator in (old_version, new_version):
+            if not isinstance(course_locator, CourseLocator) or course_locator.deprecated:
+                # The supplied CourseKey is of the wrong type, so it can't possibly be stored in this modulestore.
+                raise ItemNotFoundError(course_locator)
+
+        old_blocks = self._lookup_course(old_version, head_validation=False).structure['blocks']
+        new_blocks = self._lookup_course(new_version, head_validation=False).structure['blocks']
+        course_key = new_version.version_agnostic()
+
+        def make_usage_key(block_key):
+            """
+            Convert a BlockKey into a usage key in the new_version course.
+            """
+            return course_key.make_usage_key(block_key.type, block_key.id)
+
+        added = set()
+        changed = {}
+        for block_key, new_block in new_blocks.iteritems():
+            old_block = old_blocks.get(block_key)
+            if old_block is None:
+                added.add(make_usage_key(block_key))
+                continue
+            if old_block.edit_info.update_version == new_block.edit_info.update_version:
+                continue
+            fields_changed = (
+                old_block.fields != new_block.fields or
+                old_block.defaults != new_block.defaults or
+                old_block.get_asides() != new_block.get_asides()
+            )
+            definition_changed = old_block.definition != new_block.definition
+            if fields_changed or definition_changed:
+                changed[make_usage_key(block_key)] = BlockChange(fields_changed, definition_changed)
+
+        removed = set(
+            make_usage_key(block_key)
+            for block_key in old_blocks
+            if block_key not in new_blocks
+        )
+        return StructureDiff(added, removed, changed)
+
     def get_definition_successors(self, definition_locator, version_history_depth=1):
         """
         Find the version_history_depth next versions of this definition. Return as a VersionTree
@@ -1802,7 +1889,7 @@ class SplitMongoModuleStore(SplitBulkWriteMixin, ModuleStoreWriteBase):
                 # see if any search targets changed
                 if fields is not None:
                     self._update_search_targets(index_entry, fields)
-                self._update_head(course_key, index_entry, course_key.branch, new_id)
+                self._update_head(course_key, index_entry, course_key.branch, new_id, new_structure)
                 item_loc = BlockUsageLocator(
                     course_key.version_agnostic(),
                     block_type=block_type,
@@ -2045,6 +2132,8 @@ class SplitMongoModuleStore(SplitBulkWriteMixin, ModuleStoreWriteBase):
             }
             if fields is not None:
                 self._update_search_targets(index_entry, fields)
+            if not isinstance(locator, LibraryLocator):
+                self._update_course_summary(index_entry, master_branch, draft_structure)
             self.insert_course_index(locator, index_entry)
 
             # expensive hack to persist default field values set in __init__ method (e.g., wiki_slug)
@@ -2181,7 +2270,7 @@ class SplitMongoModuleStore(SplitBulkWriteMixin, ModuleStoreWriteBase):
                             branch=course_key.branch,
                             version_guid=new_id
                         )
-                    self._update_head(course_key, index_entry, course_key.branch, new_id)
+                    self._update_head(course_key, index_entry, course_key.branch, new_id, new_structure)
                 elif isinstance(course_key, LibraryLocator):
                     course_key = LibraryLocator(version_guid=new_id)
                 else:
@@ -2278,7 +2367,7 @@ class SplitMongoModuleStore(SplitBulkWriteMixin, ModuleStoreWriteBase):
 
                 # update the index entry if appropriate
                 if index_entry is not None:
-                    self._update_head(course_key, index_entry, xblock.location.branch, new_id)
+                    self._update_head(course_key, index_entry, xblock.location.branch, new_id, new_structure)
 
                 # fetch and return the new item--fetching is unnecessary but a good qc step
                 return self.get_item(xblock.location.for_version(new_id))
@@ -2468,7 +2557,10 @@ class SplitMongoModuleStore(SplitBulkWriteMixin, ModuleStoreWriteBase):
 
             # update the db
             self.update_structure(destination_course, destination_structure)
-            self._update_head(destination_course, index_entry, destination_course.branch, destination_structure['_id'])
+            self._update_head(
+                destination_course, index_entry, destination_course.branch, destination_structure['_id'],
+                destination_structure
+            )
 
     @contract(source_keys="list(BlockUsageLocator)", dest_usage=BlockUsageLocator)
     def copy_from_template(self, source_keys, dest_usage, user_id, head_validation=True):
@@ -2546,7 +2638,9 @@ class SplitMongoModuleStore(SplitBulkWriteMixin, ModuleStoreWriteBase):
                 del dest_structure['blocks'][orphan]
 
             self.update_structure(destination_course, dest_structure)
-            self._update_head(destination_course, index_entry, destination_course.branch, dest_structure['_id'])
+            self._update_head(
+                destination_course, index_entry, destination_course.branch, dest_structure['_id'], dest_structure
+            )
         # Return usage locators for all the new children:
         return [
             destination_course.make_usage_key(*k)
@@ -2690,7 +2784,7 @@ class SplitMongoModuleStore(SplitBulkWriteMixin, ModuleStoreWriteBase):
 
             if index_entry is not None:
                 # update the index entry if appropriate
-                self._update_head(usage_locator.course_key, index_entry, usage_locator.branch, new_id)
+                self._update_head(usage_locator.course_key, index_entry, usage_locator.branch, new_id, new_structure)
                 result = usage_locator.course_key.for_version(new_id)
             else:
                 result = CourseLocator(version_guid=new_id)
@@ -2870,7 +2964,9 @@ class SplitMongoModuleStore(SplitBulkWriteMixin, ModuleStoreWriteBase):
 
             if index_entry is not None:
                 # update the index entry if appropriate
-                self._update_head(asset_key.course_key, index_entry, asset_key.branch, new_structure['_id'])
+                self._update_head(
+                    asset_key.course_key, index_entry, asset_key.branch, new_structure['_id'], new_structure
+                )
 
     def save_asset_metadata_list(self, asset_metadata_list, user_id, import_only=False):
         """
@@ -2901,7 +2997,7 @@ class SplitMongoModuleStore(SplitBulkWriteMixin, ModuleStoreWriteBase):
 
             if index_entry is not None:
                 # update the index entry if appropriate
-                self._update_head(course_key, index_entry, asset_key.branch, new_structure['_id'])
+                self._update_head(course_key, index_entry, asset_key.branch, new_structure['_id'], new_structure)
 
     def save_asset_metadata(self, asset_metadata, user_id, import_only=False):
         """
@@ -2990,7 +3086,9 @@ class SplitMongoModuleStore(SplitBulkWriteMixin, ModuleStoreWriteBase):
 
             if index_entry is not None:
                 # update the index entry if appropriate
-                self._update_head(dest_course_key, index_entry, dest_course_key.branch, new_structure['_id'])
+                self._update_head(
+                    dest_course_key, index_entry, dest_course_key.branch, new_structure['_id'], new_structure
+                )
 
     def fix_not_found(self, course_locator, user_id):
         """
@@ -3011,7 +3109,9 @@ class SplitMongoModuleStore(SplitBulkWriteMixin, ModuleStoreWriteBase):
         self.update_structure(course_locator, new_structure)
         if index_entry is not None:
             # update the index entry if appropriate
-            self._update_head(course_locator, index_entry, course_locator.branch, new_structure['_id'])
+            self._update_head(
+                course_locator, index_entry, course_locator.branch, new_structure['_id'], new_structure
+            )
 
     def convert_references_to_keys(self, course_key, xblock_class, jsonfields, blocks):
         """
@@ -3109,19 +3209,47 @@ class SplitMongoModuleStore(SplitBulkWriteMixin, ModuleStoreWriteBase):
             if field_name in self.SEARCH_TARGET_DICT:
                 index_entry.setdefault('search_targets', {})[field_name] = field_value
 
-    def _update_head(self, course_key, index_entry, branch, new_id):
+    def _update_head(self, course_key, index_entry, branch, new_id, structure=None):
         """
         Update the active index for the given course's branch to point to new_id
 
         :param index_entry:
         :param course_locator:
         :param new_id:
+        :param structure: the structure whose id is new_id, if the caller has it; used to refresh the
+            branch's course summary
         """
         if not isinstance(new_id, ObjectId):
             raise TypeError('new_id must be an ObjectId, but is {!r}'.format(new_id))
         index_entry['versions'][branch] = new_id
+        if not isinstance(course_key, LibraryLocator):
+            if structure is not None:
+                self._update_course_summary(index_entry, branch, structure)
+            else:
+                # e.g. publishing points the published branch at the draft branch's structure,
+                # whose summary is already known.
+                for summary in index_entry.get('summaries', {}).values():
+                    if summary['version'] == new_id:
+                        index_entry['summaries'][branch] = dict(summary)
+                        break
         self.update_course_index(course_key, index_entry)
 
+    def _update_course_summary(self, index_entry, branch, structure):
+        """
+        Store a summary of the course block of the branch's head structure in the index entry, so that
+        get_course_summaries can be answered from the course index alone.
+
+        The summary records the version it was computed from; get_course_summaries ignores it if the
+        branch has since been moved by other means.
+        """
+        root_block = structure['blocks'].get(structure['root'])
+        if root_block is None or root_block.block_type != self.DEFAULT_ROOT_COURSE_BLOCK_TYPE:
+            return
+        index_entry.setdefault('summaries', {})[branch] = {
+            'version': structure['_id'],
+            'fields': _extract_course_summary(root_block),
+        }
+
     def partition_xblock_fields_by_scope(self, xblock):
         """
         Return a dictionary of scopes mapped to this xblock's explicitly set fields w/o any conversions
@@ -3466,6 +3594,17 @@ class SplitMongoModuleStore(SplitBulkWriteMixin, ModuleStoreWriteBase):
         self.db_connection.ensure_indexes()
 
 
+def _extract_course_summary(course_block):
+    """
+    Extract the CourseSummary fields from the BlockData of a course block.
+    """
+    return {
+        field: course_block.fields[field]
+        for field in CourseSummary.course_info_fields
+        if field in course_block.fields
+    }
+
+
 class SparseList(list):
     """
     Enable inserting items into a list in arbitrary order and then retrieving them.
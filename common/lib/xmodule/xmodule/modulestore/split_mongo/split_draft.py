@@ -455,7 +455,9 @@ class DraftVersioningModuleStore(SplitMongoModuleStore, ModuleStoreDraftAndPubli
             self.update_structure(draft_course_key, new_structure)
             index_entry = self._get_index_if_valid(draft_course_key)
             if index_entry is not None:
-                self._update_head(draft_course_key, index_entry, ModuleStoreEnum.BranchName.draft, new_structure['_id'])
+                self._update_head(
+                    draft_course_key, index_entry, ModuleStoreEnum.BranchName.draft, new_structure['_id'], new_structure
+                )
 
     def update_parent_if_moved(self, item_location, original_parent_location, course_structure, user_id):
         """
@@ -121,6 +121,8 @@ def split_mongo_store_config(data_dir):
         'default_class': 'xmodule.raw_module.RawDescriptor',
         'fs_root': data_dir,
         'render_template': 'edxmako.shortcuts.render_to_string',
+        # Don't let definitions cached by earlier tests hide the queries made by later ones.
+        'definition_cache_size': 0,
     }
 
     store = {
@@ -9,6 +9,7 @@ from tempfile import mkdtemp
 import path
 import shutil
 
+from mock import patch
 from opaque_keys.edx.locator import CourseLocator, AssetLocator
 from opaque_keys.edx.keys import AssetKey
 from xmodule.tests import DATA_DIR
@@ -165,6 +166,36 @@ class TestContentstore(unittest.TestCase):
         self.assertEqual(count, 0)
         self.assertEqual(course_assets, [])
 
+    @ddt.data(True, False)
+    def test_get_all_content_fields(self, deprecated):
+        """
+        Test that get_all_content_for_course only returns the requested fields
+        """
+        self.set_up_assets(deprecated)
+        course1_assets, __ = self.contentstore.get_all_content_for_course(self.course1_key, fields=['displayname'])
+        self.assertEqual(len(course1_assets), len(self.course1_files))
+        for asset in course1_assets:
+            self.assertEqual(set(asset), {'_id', 'content_son', 'displayname', 'asset_key'})
+            self.assertEqual(asset['displayname'], asset['asset_key'].block_id)
+
+    @ddt.data(True, False)
+    def test_get_all_content_count_updated(self, deprecated):
+        """
+        Test that the asset count reflects saved and deleted assets
+        """
+        self.set_up_assets(deprecated)
+        __, count = self.contentstore.get_all_content_for_course(self.course1_key)
+        self.assertEqual(count, len(self.course1_files))
+
+        asset_key = self.course1_key.make_asset_key('asset', self.course2_files[2])
+        self.save_asset(self.course2_files[2], asset_key, self.course2_files[2], False)
+        __, count = self.contentstore.get_all_content_for_course(self.course1_key)
+        self.assertEqual(count, len(self.course1_files) + 1)
+
+        self.contentstore.delete(asset_key)
+        __, count = self.contentstore.get_all_content_for_course(self.course1_key)
+        self.assertEqual(count, len(self.course1_files))
+
     @ddt.data(True, False)
     def test_attrs(self, deprecated):
         """
@@ -177,6 +208,31 @@ class TestContentstore(unittest.TestCase):
             self.contentstore.set_attr(asset_key, 'locked', not prelocked)
             self.assertEqual(self.contentstore.get_attr(asset_key, 'locked', False), not prelocked)
 
+    @ddt.data(True, False)
+    def test_generate_thumbnail_deduplicated(self, deprecated):
+        """
+        Test that a thumbnail is only generated again when the image it was made from changes
+        """
+        self.set_up_assets(deprecated)
+        asset_key = self.course1_key.make_asset_key('asset', self.course1_files[1])
+        content = self.contentstore.find(asset_key)
+        self.assertIsNone(self.contentstore.find_thumbnail(content))
+
+        thumbnail_content, thumbnail_location = self.contentstore.generate_thumbnail(content)
+        self.assertIsNotNone(thumbnail_content)
+        self.assertEqual(thumbnail_location, self.contentstore.get_thumbnail_location(content))
+        self.assertIsNotNone(self.contentstore.find_thumbnail(content))
+
+        with patch('xmodule.contentstore.content.Image') as image_class_mock:
+            thumbnail_content, __ = self.contentstore.generate_thumbnail(content)
+            self.assertIsNotNone(thumbnail_content)
+            self.assertFalse(image_class_mock.open.called)
+
+        # Replacing the image with another one makes its thumbnail stale.
+        self.save_asset(self.course1_files[2], asset_key, self.course1_files[1], False)
+        content = self.contentstore.find(asset_key)
+        self.assertIsNone(self.contentstore.find_thumbnail(content))
+
     @ddt.data(True, False)
     def test_copy_assets(self, deprecated):
         """
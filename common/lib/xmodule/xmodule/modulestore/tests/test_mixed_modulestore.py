@@ -99,7 +99,8 @@ class CommonMixedModuleStoreSetup(CourseComparisonTest):
                 'NAME': ModuleStoreEnum.Type.split,
                 'ENGINE': 'xmodule.modulestore.split_mongo.split_draft.DraftVersioningModuleStore',
                 'DOC_STORE_CONFIG': DOC_STORE_CONFIG,
-                'OPTIONS': modulestore_options
+                # Don't let definitions cached by earlier tests hide the queries made by later ones.
+                'OPTIONS': dict(modulestore_options, definition_cache_size=0)
             },
         ],
         'xblock_mixins': modulestore_options['xblock_mixins'],
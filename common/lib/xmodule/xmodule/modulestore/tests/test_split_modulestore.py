@@ -29,6 +29,7 @@ from ccx_keys.locator import CCXBlockUsageLocator
 from xmodule.modulestore.inheritance import InheritanceMixin
 from xmodule.x_module import XModuleMixin
 from xmodule.fields import Date, Timedelta
+from xmodule.modulestore.split_mongo.mongo_connection import DefinitionCache
 from xmodule.modulestore.split_mongo.split import SplitMongoModuleStore
 from xmodule.modulestore.tests.test_modulestore import check_has_course_method
 from xmodule.modulestore.split_mongo import BlockKey
@@ -59,7 +60,9 @@ class SplitModuleTest(unittest.TestCase):
     modulestore_options = {
         'default_class': 'xmodule.raw_module.RawDescriptor',
         'fs_root': tempdir.mkdtemp_clean(),
-        'xblock_mixins': (InheritanceMixin, XModuleMixin, EditInfoMixin)
+        'xblock_mixins': (InheritanceMixin, XModuleMixin, EditInfoMixin),
+        # Don't let definitions cached by earlier tests hide the queries made by later ones.
+        'definition_cache_size': 0,
     }
 
     MODULESTORE = {
@@ -918,6 +921,81 @@ class SplitModuleCourseTests(SplitModuleTest):
         version_history = modulestore().get_block_generations(second_problem.location)
         self.assertNotEqual(version_history.locator.version_guid, first_problem.location.version_guid)
 
+    @patch('xmodule.tabs.CourseTab.from_json', side_effect=mock_tab_from_json)
+    def test_diff_structures(self, _from_json):
+        """
+        Test diff_structures
+        """
+        test_course = modulestore().create_course(
+            org='edu.harvard',
+            course='diff',
+            run='diff101',
+            display_name='diff test course',
+            user_id='testbot',
+            master_branch=ModuleStoreEnum.BranchName.draft
+        )
+        course_key = test_course.id.version_agnostic()
+        chapter = modulestore().create_child(
+            'testbot', test_course.location,
+            block_type='chapter',
+            block_id='chapter1',
+            fields={'display_name': 'chapter 1'}
+        )
+        settings_problem = modulestore().create_child(
+            'testbot', chapter.location.version_agnostic(),
+            block_type='problem',
+            block_id='settings_problem',
+            fields={'display_name': 'problem 1', 'data': '<problem></problem>'}
+        )
+        content_problem = modulestore().create_child(
+            'testbot', chapter.location.version_agnostic(),
+            block_type='problem',
+            block_id='content_problem',
+            fields={'display_name': 'problem 2', 'data': '<problem></problem>'}
+        )
+        deleted_problem = modulestore().create_child(
+            'testbot', chapter.location.version_agnostic(),
+            block_type='problem',
+            block_id='deleted_problem',
+            fields={'display_name': 'problem 3', 'data': '<problem></problem>'}
+        )
+        old_version = CourseLocator(
+            version_guid=modulestore().get_course_index_info(course_key)['versions'][BRANCH_NAME_DRAFT]
+        )
+
+        settings_problem = modulestore().get_item(settings_problem.location.version_agnostic())
+        settings_problem.display_name = 'renamed problem 1'
+        modulestore().update_item(settings_problem, 'testbot')
+        content_problem = modulestore().get_item(content_problem.location.version_agnostic())
+        content_problem.data = '<problem><p>changed</p></problem>'
+        modulestore().update_item(content_problem, 'testbot')
+        modulestore().delete_item(deleted_problem.location.version_agnostic(), 'testbot')
+        added_problem = modulestore().create_child(
+            'testbot', chapter.location.version_agnostic(),
+            block_type='problem',
+            block_id='added_problem',
+            fields={'display_name': 'problem 4', 'data': '<problem></problem>'}
+        )
+
+        diff = modulestore().diff_structures(old_version, course_key)
+        self.assertEqual(diff.added, {added_problem.location.version_agnostic()})
+        self.assertEqual(diff.removed, {course_key.make_usage_key('problem', 'deleted_problem')})
+        self.assertEqual(
+            diff.changed,
+            {
+                chapter.location.version_agnostic(): (True, False),
+                settings_problem.location.version_agnostic(): (True, False),
+                content_problem.location.version_agnostic(): (False, True),
+            }
+        )
+
+        # comparing a structure to itself finds no differences
+        diff = modulestore().diff_structures(course_key, course_key)
+        self.assertEqual(diff, (set(), set(), {}))
+
+        with self.assertRaises(ItemNotFoundError):
+            modulestore().diff_structures(old_version, course_key.make_usage_key('problem', 'added_problem'))
+
     @ddt.data(
         ("course-v1:edx+test_course+test_run", BlockUsageLocator),
         ("ccx-v1:edX+test_course+test_run+ccx@1", CCXBlockUsageLocator),
@@ -1008,6 +1086,50 @@ class TestCourseStructureCache(SplitModuleTest):
         )
 
 
+class TestDefinitionPrefetch(SplitModuleTest):
+    """Tests for prefetching the definitions of a subtree into the DefinitionCache"""
+
+    def setUp(self):
+        super(TestDefinitionPrefetch, self).setUp()
+        self.course = modulestore().create_course(
+            'org', 'prefetch', 'test_run', 'testbot', BRANCH_NAME_DRAFT,
+        )
+        for index in range(3):
+            modulestore().create_child(
+                'testbot', self.course.location,
+                block_type='problem',
+                block_id='problem{}'.format(index),
+                fields={'data': '<problem>{}</problem>'.format(index)}
+            )
+
+    def _load_problem_data(self, definition_cache):
+        """
+        Load the course's problems with the given definition cache and read their definitions.
+
+        Returns the problems' data and the mock of the definitions collection the reads went through.
+        """
+        db_connection = modulestore().db_connection
+        with patch.object(db_connection, 'definition_cache', definition_cache):
+            with patch.object(db_connection, 'definitions', wraps=db_connection.definitions) as definitions:
+                course = modulestore().get_course(self.course.id, depth=1)
+                data = [problem.data for problem in course.get_children()]
+        return data, definitions
+
+    def test_definitions_fetched_in_one_query(self):
+        data, definitions = self._load_problem_data(DefinitionCache(max_size=10))
+        self.assertEqual(data, ['<problem>{}</problem>'.format(index) for index in range(3)])
+        # the course's and the problems' definitions are all fetched by the prefetch
+        self.assertEqual(definitions.find.call_count, 1)
+        self.assertEqual(definitions.find_one.call_count, 0)
+
+    def test_definitions_fetched_one_at_a_time_without_cache(self):
+        data, definitions = self._load_problem_data(DefinitionCache(max_size=0))
+        self.assertEqual(data, ['<problem>{}</problem>'.format(index) for index in range(3)])
+        # one query for the course's definition and one for each problem's
+        self.assertEqual(definitions.find.call_count, 0)
+        self.assertEqual(definitions.find_one.call_count, 4)
+
+
 class SplitModuleItemTests(SplitModuleTest):
     '''
     Item read tests including inheritance
@@ -1795,6 +1917,34 @@ class TestCourseCreation(SplitModuleTest):
         self.assertEqual(len(new_course.grading_policy['GRADER']), 4)
         self.assertDictEqual(new_course.grade_cutoffs, {"Pass": 0.5})
 
+    def test_course_summary_in_index(self):
+        """
+        Test that get_course_summaries is answered from the summary kept in the course index
+        """
+        new_course = modulestore().create_course(
+            'summary_org', 'summary_course', 'summary_run', 'create_user', BRANCH_NAME_DRAFT,
+            fields={'display_name': 'summary course'}
+        )
+        new_course.display_name = 'renamed summary course'
+        modulestore().update_item(new_course, 'create_user')
+        course_key = new_course.id.version_agnostic()
+
+        # only the course index is queried
+        with check_mongo_calls(1):
+            summaries = modulestore().get_course_summaries(BRANCH_NAME_DRAFT, course_keys=[course_key])
+        self.assertEqual(len(summaries), 1)
+        self.assertEqual(summaries[0].id, course_key.for_branch(None))
+        self.assertEqual(summaries[0].display_name, 'renamed summary course')
+
+        # a summary which doesn't match the head version is ignored in favor of the structure
+        index_entry = modulestore().get_course_index(course_key)
+        index_entry['summaries'][BRANCH_NAME_DRAFT]['fields']['display_name'] = 'stale'
+        index_entry['summaries'][BRANCH_NAME_DRAFT]['version'] = None
+        modulestore().update_course_index(course_key, index_entry)
+        with check_mongo_calls(2):
+            summaries = modulestore().get_course_summaries(BRANCH_NAME_DRAFT, course_keys=[course_key])
+        self.assertEqual(summaries[0].display_name, 'renamed summary course')
+
     def test_cloned_course(self):
         """
         Test making a course which points to an existing draft and published but not making any changes to either.
@@ -1,7 +1,7 @@
 """ Test the behavior of split_mongo/MongoConnection """
 import unittest
 from mock import patch
-from xmodule.modulestore.split_mongo.mongo_connection import MongoConnection
+from xmodule.modulestore.split_mongo.mongo_connection import DefinitionCache, MongoConnection
 from xmodule.exceptions import HeartbeatFailure
 
 
@@ -17,3 +17,32 @@ class TestHeartbeatFailureException(unittest.TestCase):
 
             with self.assertRaises(HeartbeatFailure):
                 useless_conn.heartbeat()
+
+
+class TestDefinitionCache(unittest.TestCase):
+    """ Test the process-local LRU cache of definitions """
+    def _definition(self, definition_id):
+        """ Make a minimal definition document """
+        return {'_id': definition_id, 'block_type': 'html', 'fields': {'data': definition_id}}
+
+    def test_disabled(self):
+        cache = DefinitionCache(max_size=0)
+        cache.set_many([self._definition('a')])
+        self.assertEqual(cache.get_many(['a']), {})
+        self.assertFalse(cache.can_hold(1))
+
+    def test_evicts_least_recently_used(self):
+        cache = DefinitionCache(max_size=2)
+        cache.set_many([self._definition('a'), self._definition('b')])
+        # touch 'a' so that 'b' is the least recently used
+        self.assertEqual(cache.get_many(['a']).keys(), ['a'])
+        cache.set_many([self._definition('c')])
+        self.assertEqual(sorted(cache.get_many(['a', 'b', 'c'])), ['a', 'c'])
+        self.assertTrue(cache.can_hold(2))
+        self.assertFalse(cache.can_hold(3))
+
+    def test_returns_copies(self):
+        cache = DefinitionCache(max_size=2)
+        cache.set_many([self._definition('a')])
+        cache.get_many(['a'])['a']['fields']['data'] = 'changed'
+        self.assertEqual(cache.get_many(['a'])['a']['fields']['data'], 'a')
@@ -340,6 +340,8 @@ class VersioningModulestoreBuilder(StoreBuilderBase):
         )
         # Set up a temp directory for storing filesystem content created during import
         fs_root = mkdtemp()
+        # Don't let definitions cached by earlier tests hide the queries made by later ones.
+        kwargs.setdefault('definition_cache_size', 0)
 
         modulestore = DraftVersioningModuleStore(
             contentstore,
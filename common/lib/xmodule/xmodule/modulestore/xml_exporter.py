@@ -3,7 +3,10 @@ Methods for exporting course data to XML
 """
 
 import logging
+import tarfile
+import time
 from abc import abstractmethod
+from io import BytesIO
 from six import text_type
 import lxml.etree
 from xblock.fields import Scope, Reference, ReferenceList, ReferenceValueDict
@@ -14,9 +17,9 @@ from xmodule.modulestore import EdxJSONEncoder, ModuleStoreEnum
 from xmodule.modulestore.inheritance import own_metadata
 from xmodule.modulestore.store_utilities import draft_node_constructor, get_draft_subtree_roots
 from xmodule.modulestore import LIBRARY_ROOT
+from fs.memoryfs import MemoryFS
 from fs.osfs import OSFS
 from json import dumps
-import os
 
 from xmodule.modulestore.draft_and_published import DIRECT_ONLY_CATEGORIES
 from opaque_keys.edx.locator import CourseLocator, LibraryLocator
@@ -105,7 +108,7 @@ class ExportManager(object):
     """
     Manages XML exporting for courselike objects.
     """
-    def __init__(self, modulestore, contentstore, courselike_key, root_dir, target_dir):
+    def __init__(self, modulestore, contentstore, courselike_key, root_dir, target_dir, root_fs=None):
         """
         Export all modules from `modulestore` and content from `contentstore` as xml to `root_dir`.
 
@@ -114,12 +117,14 @@ class ExportManager(object):
         `courselike_key`: The Locator of the Descriptor to export
         `root_dir`: The directory to write the exported xml to
         `target_dir`: The name of the directory inside `root_dir` to write the content to
+        `root_fs`: An optional filesystem to write to instead of `root_dir` (e.g. a `MemoryFS`)
         """
         self.modulestore = modulestore
         self.contentstore = contentstore
         self.courselike_key = courselike_key
         self.root_dir = root_dir
         self.target_dir = text_type(target_dir)
+        self.root_fs = root_fs
 
     @abstractmethod
     def get_key(self):
@@ -149,13 +154,23 @@ class ExportManager(object):
         Get the target courselike object for this export.
         """
 
+    def export_static_assets(self, root_courselike_dir):
+        """
+        Export the static assets from the contentstore, along with their policy file.
+        """
+        self.contentstore.export_all_for_course(
+            self.courselike_key,
+            root_courselike_dir + '/static/',
+            root_courselike_dir + '/policies/assets.json',
+        )
+
     def export(self):
         """
         Perform the export given the parameters handed to this class at init.
         """
         with self.modulestore.bulk_operations(self.courselike_key):
 
-            fsm = OSFS(self.root_dir)
+            fsm = self.root_fs or OSFS(self.root_dir)
             root = lxml.etree.Element('unknown')
 
             # export only the published content
@@ -172,7 +187,7 @@ class ExportManager(object):
             self.process_root(root, export_fs)
 
             # Process extra items-- drafts, assets, etc
-            root_courselike_dir = self.root_dir + '/' + self.target_dir
+            root_courselike_dir = self.root_dir + '/' + self.target_dir if self.root_dir else self.target_dir
             self.process_extra(root, courselike, root_courselike_dir, xml_centric_courselike_key, export_fs)
 
             # Any last pass adjustments
@@ -202,26 +217,20 @@ class CourseExportManager(ExportManager):
 
     def process_extra(self, root, courselike, root_courselike_dir, xml_centric_courselike_key, export_fs):
         # Export the modulestore's asset metadata.
-        asset_dir = root_courselike_dir + '/' + AssetMetadata.EXPORTED_ASSET_DIR + '/'
-        if not os.path.isdir(asset_dir):
-            os.makedirs(asset_dir)
+        asset_dir = export_fs.makedirs(AssetMetadata.EXPORTED_ASSET_DIR, recreate=True)
         asset_root = lxml.etree.Element(AssetMetadata.ALL_ASSETS_XML_TAG)
         course_assets = self.modulestore.get_all_asset_metadata(self.courselike_key, None)
         for asset_md in course_assets:
             # All asset types are exported using the "asset" tag - but their asset type is specified in each asset key.
             asset = lxml.etree.SubElement(asset_root, AssetMetadata.ASSET_XML_TAG)
             asset_md.to_xml(asset)
-        with OSFS(asset_dir).open(AssetMetadata.EXPORTED_ASSET_FILENAME, 'wb') as asset_xml_file:
+        with asset_dir.open(AssetMetadata.EXPORTED_ASSET_FILENAME, 'wb') as asset_xml_file:
             lxml.etree.ElementTree(asset_root).write(asset_xml_file, encoding='utf-8')
 
         # export the static assets
         policies_dir = export_fs.makedir('policies', recreate=True)
         if self.contentstore:
-            self.contentstore.export_all_for_course(
-                self.courselike_key,
-                root_courselike_dir + '/static/',
-                root_courselike_dir + '/policies/assets.json',
-            )
+            self.export_static_assets(root_courselike_dir)
 
             # If we are using the default course image, export it to the
             # legacy location to support backwards compatibility.
@@ -236,10 +245,8 @@ class CourseExportManager(ExportManager):
                 except NotFoundError:
                     pass
                 else:
-                    output_dir = root_courselike_dir + '/static/images/'
-                    if not os.path.isdir(output_dir):
-                        os.makedirs(output_dir)
-                    with OSFS(output_dir).open(u'course_image.jpg', 'wb') as course_image_file:
+                    output_dir = export_fs.makedirs(u'static/images', recreate=True)
+                    with output_dir.open(u'course_image.jpg', 'wb') as course_image_file:
                         course_image_file.write(course_image.data)
 
         # export the static tabs
@@ -320,11 +327,7 @@ class LibraryExportManager(ExportManager):
         export_fs.makedir('policies', recreate=True)
 
         if self.contentstore:
-            self.contentstore.export_all_for_course(
-                self.courselike_key,
-                self.root_dir + '/' + self.target_dir + '/static/',
-                self.root_dir + '/' + self.target_dir + '/policies/assets.json',
-            )
+            self.export_static_assets(root_courselike_dir)
 
     def post_process(self, root, export_fs):
         """
@@ -346,6 +349,67 @@ def export_course_to_xml(modulestore, contentstore, course_key, root_dir, course
     CourseExportManager(modulestore, contentstore, course_key, root_dir, course_dir).export()
 
 
+class CourseTarballExportManager(CourseExportManager):
+    """
+    Export manager which writes a course as a gzipped tarball to a stream, without an intermediate directory.
+
+    The course's xml is built in memory and then written to the tarball, after which the static
+    assets are copied from the contentstore into the tarball chunk by chunk.
+    """
+    def __init__(self, modulestore, contentstore, course_key, fileobj, target_dir):
+        """
+        `fileobj`: A writable file-like object to stream the tarball to. It is never seeked.
+
+        See ExportManager for the other arguments.
+        """
+        super(CourseTarballExportManager, self).__init__(
+            modulestore, contentstore, course_key, None, target_dir, root_fs=MemoryFS()
+        )
+        self.fileobj = fileobj
+
+    def export_static_assets(self, root_courselike_dir):
+        """
+        Static assets are streamed straight into the tarball once the xml has been written; see `export`.
+        """
+
+    def export(self):
+        """
+        Perform the export, writing the tarball to `fileobj`.
+        """
+        super(CourseTarballExportManager, self).export()
+        with tarfile.open(fileobj=self.fileobj, mode='w|gz') as tarball:
+            for file_path in self.root_fs.walk.files():
+                with self.root_fs.open(file_path, 'rb') as xml_file:
+                    data = xml_file.read()
+                _add_bytes_to_tarball(tarball, file_path.lstrip(u'/'), data)
+
+            if self.contentstore:
+                self.contentstore.export_all_for_course_to_tarball(
+                    self.courselike_key,
+                    tarball,
+                    self.target_dir + u'/static/',
+                    self.target_dir + u'/policies/assets.json',
+                )
+        self.root_fs.close()
+
+
+def _add_bytes_to_tarball(tarball, arcname, data, mtime=None):
+    """
+    Add a file named `arcname` containing the byte string `data` to the open TarFile `tarball`.
+    """
+    tar_info = tarfile.TarInfo(arcname.encode('utf-8'))
+    tar_info.size = len(data)
+    tar_info.mtime = time.time() if mtime is None else mtime
+    tarball.addfile(tar_info, BytesIO(data))
+
+
+def export_course_to_tarball(modulestore, contentstore, course_key, fileobj, course_dir):
+    """
+    Thin wrapper for the Course Tarball Export Manager. See CourseTarballExportManager for details.
+    """
+    CourseTarballExportManager(modulestore, contentstore, course_key, fileobj, course_dir).export()
+
+
 def export_library_to_xml(modulestore, contentstore, library_key, root_dir, library_dir):
     """
     Thin wrapper for the Library Export Manager. See ExportManager for details.
@@ -3,8 +3,10 @@ Utility functions for transcripts.
 ++++++++++++++++++++++++++++++++++
 """
 from django.conf import settings
+from django.core.cache import cache
 import os
 import copy
+import hashlib
 import json
 import requests
 import logging
@@ -30,6 +32,10 @@ log = logging.getLogger(__name__)
 
 NON_EXISTENT_TRANSCRIPT = 'non_existent_dummy_file_name'
 
+# Converted transcripts are cached by the digest of their source content, so
+# they never become stale and only need to expire to bound the cache's size.
+TRANSCRIPT_CONVERSION_CACHE_TIMEOUT = 24 * 60 * 60
+
 
 class TranscriptException(Exception):  # pylint: disable=missing-docstring
     pass
@@ -233,19 +239,7 @@ def generate_subs_from_source(speed_subs, subs_type, subs_filedata, item, langua
     if not srt_subs_obj:
         raise TranscriptsGenerationException(_("Something wrong with SubRip transcripts file during parsing."))
 
-    sub_starts = []
-    sub_ends = []
-    sub_texts = []
-
-    for sub in srt_subs_obj:
-        sub_starts.append(sub.start.ordinal)
-        sub_ends.append(sub.end.ordinal)
-        sub_texts.append(sub.text.replace('\n', ' '))
-
-    subs = {
-        'start': sub_starts,
-        'end': sub_ends,
-        'text': sub_texts}
+    subs = generate_sjson_from_srt(srt_subs_obj)
 
     for speed, subs_id in speed_subs.iteritems():
         save_subs_to_store(
@@ -265,25 +259,53 @@ def generate_srt_from_sjson(sjson_subs, speed):
     :param speed: speed of `sjson_subs`.
     :returns: "srt" subs.
     """
+    return ''.join(iter_srt_from_sjson(sjson_subs, speed))
 
-    output = ''
 
-    equal_len = len(sjson_subs['start']) == len(sjson_subs['end']) == len(sjson_subs['text'])
-    if not equal_len:
-        return output
+def iter_srt_from_sjson(sjson_subs, speed):
+    """
+    Generate the SubRip (*.srt) entries, with speed = 1.0, of sjson subs one at
+    a time, without re-timing the whole transcript first.
 
-    sjson_speed_1 = generate_subs(speed, 1, sjson_subs)
+    Arguments:
+        sjson_subs (dict): "sjson" subs.
+        speed (float): speed of `sjson_subs`.
 
-    for i in range(len(sjson_speed_1['start'])):
+    Yields:
+        unicode SubRip entries, each ending with a blank line.
+    """
+    equal_len = len(sjson_subs['start']) == len(sjson_subs['end']) == len(sjson_subs['text'])
+    if not equal_len:
+        return
+
+    # Matches the timing of generate_subs(speed, 1, sjson_subs).
+    coefficient = None if speed == 1 else 1.0 * speed
+    for index, (start, end, text) in enumerate(zip(sjson_subs['start'], sjson_subs['end'], sjson_subs['text'])):
+        if coefficient is not None:
+            start = int(round(start * coefficient))
+            end = int(round(end * coefficient))
         item = SubRipItem(
-            index=i,
-            start=SubRipTime(milliseconds=sjson_speed_1['start'][i]),
-            end=SubRipTime(milliseconds=sjson_speed_1['end'][i]),
-            text=sjson_speed_1['text'][i]
+            index=index,
+            start=SubRipTime(milliseconds=start),
+            end=SubRipTime(milliseconds=end),
+            text=text
         )
-        output += (unicode(item))
-        output += '\n'
-    return output
+        yield unicode(item) + '\n'
+
+
+def iter_srt_items(srt_content, error_handling=SubRipFile.ERROR_PASS):
+    """
+    Parse SubRip (*.srt) content one item at a time, rather than into a whole
+    SubRipFile.
+
+    Arguments:
+        srt_content (unicode): "SRT" subs.
+        error_handling: how pysrt handles invalid items, as in SubRipFile.
+
+    Yields:
+        SubRipItem
+    """
+    return SubRipFile.stream(srt_content.splitlines(True), error_handling=error_handling)
 
 
 def generate_sjson_from_srt(srt_subs):
@@ -291,7 +313,7 @@ def generate_sjson_from_srt(srt_subs):
     Generate transcripts from sjson to SubRip (*.srt).
 
     Arguments:
-        srt_subs(SubRip): "SRT" subs object
+        srt_subs(SubRip): "SRT" subs object, or any iterable of SubRipItems
 
     Returns:
         Subs converted to "SJSON" format.
@@ -598,25 +620,51 @@ class Transcript(object):
         if input_format == output_format:
             return content
 
+        cache_key = Transcript.conversion_cache_key(content, input_format, output_format)
+        converted = cache.get(cache_key)
+        if converted is None:
+            converted = Transcript._convert(content, input_format, output_format)
+            cache.set(cache_key, converted, TRANSCRIPT_CONVERSION_CACHE_TIMEOUT)
+        return converted
+
+    @staticmethod
+    def conversion_cache_key(content, input_format, output_format):
+        """
+        Return the cache key of `content` converted from `input_format` to
+        `output_format`, which is addressed by the digest of the content.
+
+        Converted transcripts are always at speed 1.0.
+        """
+        if isinstance(content, unicode):
+            content = content.encode('utf8')
+        return u'transcripts.converted.{digest}.{input_format}.{output_format}'.format(
+            digest=hashlib.sha1(content).hexdigest(),
+            input_format=input_format,
+            output_format=output_format,
+        )
+
+    @staticmethod
+    def _convert(content, input_format, output_format):
+        """
+        Convert transcript `content` from `input_format` to `output_format`,
+        without caching the result.
+        """
         if input_format == 'srt':
 
             if output_format == 'txt':
-                text = SubRipFile.from_string(content.decode('utf8')).text
+                text = '\n'.join(item.text for item in iter_srt_items(content.decode('utf8')))
                 return HTMLParser().unescape(text)
 
             elif output_format == 'sjson':
                 try:
                     # With error handling (set to 'ERROR_RAISE'), we will be getting
                     # the exception if something went wrong in parsing the transcript.
-                    srt_subs = SubRipFile.from_string(
-                        content.decode('utf8'),
-                        error_handling=SubRipFile.ERROR_RAISE
+                    return generate_sjson_from_srt(
+                        iter_srt_items(content.decode('utf8'), error_handling=SubRipFile.ERROR_RAISE)
                     )
                 except Error as ex:   # Base exception from pysrt
                     raise TranscriptsGenerationException(text_type(ex))
 
-                return generate_sjson_from_srt(srt_subs)
-
         if input_format == 'sjson':
 
             if output_format == 'txt':
@@ -5,6 +5,7 @@ import time
 import yaml
 
 from contracts import contract, new_contract
+from contextlib import contextmanager
 from functools import partial
 from lxml import etree
 from collections import namedtuple
@@ -1297,10 +1298,18 @@ class MetricsMixin(object):
     """
 
     def render(self, block, view_name, context=None):
+        with self.render_metrics(block, view_name):
+            return super(MetricsMixin, self).render(block, view_name, context=context)
+
+    @contextmanager
+    def render_metrics(self, block, view_name):
+        """
+        Times the render of `view_name` on `block` run within it, and logs its metrics.
+        """
         start_time = time.time()
         try:
             status = "success"
-            return super(MetricsMixin, self).render(block, view_name, context=context)
+            yield
 
         except:
             status = "failure"
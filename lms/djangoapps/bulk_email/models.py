@@ -405,6 +405,85 @@ class CourseEmailTemplate(models.Model):
                 context[key] = markupsafe.escape(value)
         return CourseEmailTemplate._render(self.html_template, htmltext, context)
 
+    def prerender(self, context, recipient_keys):
+        """
+        Return a PrerenderedCourseEmailTemplate for sending this template to
+        many recipients.
+
+        The values in `context` are substituted into the templates once, except
+        for those of `recipient_keys`, which differ between recipients.
+        """
+        return PrerenderedCourseEmailTemplate(self, context, recipient_keys)
+
+
+def _escape_context(context):
+    """
+    Return a copy of the context with its string values HTML-escaped.
+    """
+    return {
+        key: markupsafe.escape(value) if isinstance(value, basestring) else value
+        for key, value in context.iteritems()
+    }
+
+
+class PrerenderedCourseEmailTemplate(object):
+    """
+    A CourseEmailTemplate with the parts of the email context which are the
+    same for all recipients already substituted into it.
+
+    Renders the same messages as the CourseEmailTemplate, without formatting
+    the whole template for each recipient.
+    """
+    def __init__(self, template, context, recipient_keys):
+        self.recipient_keys = recipient_keys
+        # Mark where the recipients' values go with characters that can't appear in the templates.
+        self.placeholders = {key: u'\0{}\0'.format(key) for key in recipient_keys}
+
+        self.context = dict(context)
+        self.plain_template = template.plain_template.format(**dict(self.context, **self.placeholders))
+
+        self.escaped_context = _escape_context(context)
+        self.html_template = template.html_template.format(**dict(self.escaped_context, **self.placeholders))
+
+    def _render(self, prerendered, message_body, context):
+        """
+        Create a message from a prerendered template, the message body and the
+        complete context for the recipient, as CourseEmailTemplate._render does.
+        """
+        # Substitute all %%-encoded keywords in the message body
+        if 'user_id' in context and 'course_id' in context:
+            message_body = substitute_keywords_with_data(message_body, context)
+
+        result = prerendered
+        for key in self.recipient_keys:
+            if self.placeholders[key] in result:
+                result = result.replace(self.placeholders[key], u'{}'.format(context[key]))
+
+        message_body_tag = COURSE_EMAIL_MESSAGE_BODY_TAG.format()
+        result = result.replace(message_body_tag, message_body, 1)
+
+        return wrap_message(result)
+
+    def render_plaintext(self, plaintext, recipient_context):
+        """
+        Create plain text message, with the recipient's values from the
+        `recipient_context` dict.
+        """
+        context = dict(self.context)
+        context.update((key, recipient_context[key]) for key in self.recipient_keys if key in recipient_context)
+        return self._render(self.plain_template, plaintext, context)
+
+    def render_htmltext(self, htmltext, recipient_context):
+        """
+        Create HTML text message, with the recipient's values from the
+        `recipient_context` dict.
+        """
+        context = dict(self.escaped_context)
+        context.update(_escape_context({
+            key: recipient_context[key] for key in self.recipient_keys if key in recipient_context
+        }))
+        return self._render(self.html_template, htmltext, context)
+
 
 class CourseAuthorization(models.Model):
     """
@@ -430,6 +509,13 @@ class CourseAuthorization(models.Model):
         except cls.DoesNotExist:
             return False
 
+    @classmethod
+    def instructor_email_enabled_courses(cls, course_ids):
+        """
+        Returns the set of the given course ids for which email is enabled.
+        """
+        return set(cls.objects.filter(course_id__in=course_ids, email_enabled=True).values_list('course_id', flat=True))
+
     def __unicode__(self):
         not_en = "Not "
         if self.email_enabled:
@@ -471,6 +557,20 @@ class BulkEmailFlag(ConfigurationModel):
         else:  # implies enabled == True and require_course_email == False, so email is globally enabled
             return True
 
+    @classmethod
+    def courses_with_feature_enabled(cls, course_ids):
+        """
+        Returns the set of the given course ids for which the bulk email feature
+        is available, as determined by feature_enabled, with at most one query
+        for all of the courses.
+        """
+        if not BulkEmailFlag.is_enabled():
+            return set()
+        elif BulkEmailFlag.current().require_course_email_auth:
+            return CourseAuthorization.instructor_email_enabled_courses(course_ids)
+        else:
+            return set(course_ids)
+
     class Meta(object):
         app_label = "bulk_email"
 
@@ -7,6 +7,7 @@ import json
 import logging
 import random
 import re
+import threading
 from collections import Counter
 from smtplib import SMTPConnectError, SMTPDataError, SMTPException, SMTPServerDisconnected
 from time import sleep
@@ -94,6 +95,45 @@ BULK_EMAIL_FAILURE_ERRORS = (
 )
 
 
+# The keys of the email context whose values differ between the recipients of an email.
+RECIPIENT_CONTEXT_KEYS = ('name', 'email', 'user_id')
+
+# Holds each thread's persistent mail connection (see BULK_EMAIL_PERSISTENT_CONNECTIONS).
+_persistent_connections = threading.local()
+
+
+def _get_mail_connection():
+    """
+    Returns an open mail connection for sending a subtask's emails.
+
+    When settings.BULK_EMAIL_PERSISTENT_CONNECTIONS is set, the connection
+    released by the previous subtask that the worker ran is reused, rather
+    than a new connection being set up for each subtask.
+    """
+    connection = None
+    if settings.BULK_EMAIL_PERSISTENT_CONNECTIONS:
+        connection = getattr(_persistent_connections, 'connection', None)
+        _persistent_connections.connection = None
+    if connection is None:
+        connection = get_connection()
+    connection.open()
+    return connection
+
+
+def _release_mail_connection(connection, keep_open):
+    """
+    Releases a connection returned by _get_mail_connection.
+
+    The connection is only left open for the next subtask if connections are
+    persistent and `keep_open` is set, which it shouldn't be if sending failed
+    in a way that might have left the connection unusable.
+    """
+    if settings.BULK_EMAIL_PERSISTENT_CONNECTIONS and keep_open:
+        _persistent_connections.connection = connection
+    else:
+        connection.close()
+
+
 def _get_course_email_context(course):
     """
     Returns context arguments to apply to all emails, independent of recipient.
@@ -202,9 +242,13 @@ def perform_delegate_email_batches(entry_id, course_id, task_input, action_name)
         log.warning(msg)
         raise ValueError(msg)
 
+    # Look up the course's opt-outs once, rather than for each subtask.
+    course_optout_ids = _get_course_optout_ids(course_id)
+
     def _create_send_email_subtask(to_list, initial_subtask_status):
         """Creates a subtask to send email to a given recipient list."""
         subtask_id = initial_subtask_status.task_id
+        optout_ids = sorted(recipient['pk'] for recipient in to_list if recipient['pk'] in course_optout_ids)
         new_subtask = send_course_email.subtask(
             (
                 entry_id,
@@ -212,6 +256,7 @@ def perform_delegate_email_batches(entry_id, course_id, task_input, action_name)
                 to_list,
                 global_email_context,
                 initial_subtask_status.to_dict(),
+                optout_ids,
             ),
             task_id=subtask_id,
             routing_key=routing_key,
@@ -237,7 +282,7 @@ def perform_delegate_email_batches(entry_id, course_id, task_input, action_name)
 
 
 @task(default_retry_delay=settings.BULK_EMAIL_DEFAULT_RETRY_DELAY, max_retries=settings.BULK_EMAIL_MAX_RETRIES)
-def send_course_email(entry_id, email_id, to_list, global_email_context, subtask_status_dict):
+def send_course_email(entry_id, email_id, to_list, global_email_context, subtask_status_dict, optout_ids=None):
     """
     Sends an email to a list of recipients.
 
@@ -266,6 +311,8 @@ def send_course_email(entry_id, email_id, to_list, global_email_context, subtask
 
         Most values will be zero on initial call, but may be different when the task is
         invoked as part of a retry.
+      * `optout_ids`: ids of the users in `to_list` who have opted out of email for the course,
+        as determined when the subtask was queued.  If None, the Optout table is queried instead.
 
     Sends to all addresses contained in to_list that are not also in the Optout table.
     Emails are sent multi-part, in both plain text and html.  Updates InstructorTask object
@@ -300,6 +347,7 @@ def send_course_email(entry_id, email_id, to_list, global_email_context, subtask
                 to_list,
                 global_email_context,
                 subtask_status,
+                optout_ids,
             )
     except Exception:
         # Unexpected exception. Try to write out the failure to the entry before failing.
@@ -332,13 +380,28 @@ def send_course_email(entry_id, email_id, to_list, global_email_context, subtask
     return new_subtask_status.to_dict()
 
 
-def _filter_optouts_from_recipients(to_list, course_id):
+def _get_course_optout_ids(course_id):
+    """
+    Returns the set of ids of the users who have opted out of email for the course.
+    """
+    return set(Optout.objects.filter(course_id=course_id).values_list('user_id', flat=True))
+
+
+def _filter_optouts_from_recipients(to_list, course_id, optout_ids=None):
     """
     Filters a recipient list based on student opt-outs for a given course.
 
+    If `optout_ids`, the ids of the opted-out users on the list, are given,
+    they are used rather than querying for the course's opt-outs.
+
     Returns the filtered recipient list, as well as the number of optouts
     removed from the list.
     """
+    if optout_ids is not None:
+        optout_ids = set(optout_ids)
+        filtered_list = [recipient for recipient in to_list if recipient['pk'] not in optout_ids]
+        return filtered_list, len(to_list) - len(filtered_list)
+
     optouts = Optout.objects.filter(
         course_id=course_id,
         user__in=[i['pk'] for i in to_list]
@@ -420,7 +483,7 @@ def _get_source_address(course_id, course_title, course_language, truncate=True)
     return from_addr
 
 
-def _send_course_email(entry_id, email_id, to_list, global_email_context, subtask_status):
+def _send_course_email(entry_id, email_id, to_list, global_email_context, subtask_status, optout_ids=None):
     """
     Performs the email sending task.
 
@@ -437,6 +500,8 @@ def _send_course_email(entry_id, email_id, to_list, global_email_context, subtas
         for all recipients of this email.  This dict is to be used to fill in slots in email
         template.  It does not include 'name' and 'email', which will be provided by the to_list.
       * `subtask_status` : object of class SubtaskStatus representing current status.
+      * `optout_ids`: ids of the users in `to_list` who have opted out of email for the course,
+        or None if the Optout table should be queried for them.
 
     Sends to all addresses contained in to_list that are not also in the Optout table.
     Emails are sent multi-part, in both plain text and html.
@@ -483,7 +548,7 @@ def _send_course_email(entry_id, email_id, to_list, global_email_context, subtas
     # that existed at that time, and we don't need to keep checking for changes
     # in the Optout list.
     if subtask_status.get_retry_count() == 0:
-        to_list, num_optout = _filter_optouts_from_recipients(to_list, course_email.course_id)
+        to_list, num_optout = _filter_optouts_from_recipients(to_list, course_email.course_id, optout_ids)
         subtask_status.increment(skipped=num_optout)
 
     course_title = global_email_context['course_title']
@@ -493,15 +558,19 @@ def _send_course_email(entry_id, email_id, to_list, global_email_context, subtas
     from_addr = course_email.from_addr if course_email.from_addr else \
         _get_source_address(course_email.course_id, course_title, course_language)
 
+    # Define context values to use in all course emails:
+    email_context = {'name': '', 'email': ''}
+    email_context.update(global_email_context)
+    email_context['course_id'] = course_email.course_id
+
     # use the CourseEmailTemplate that was associated with the CourseEmail
     course_email_template = course_email.get_template()
+    keep_connection_open = False
+    connection = None
     try:
-        connection = get_connection()
-        connection.open()
-
-        # Define context values to use in all course emails:
-        email_context = {'name': '', 'email': ''}
-        email_context.update(global_email_context)
+        # Render the parts of the template that are the same for every recipient once.
+        course_email_template = course_email_template.prerender(email_context, RECIPIENT_CONTEXT_KEYS)
+        connection = _get_mail_connection()
 
         while to_list:
             # Update context with user-specific values from the user at the end of the list.
@@ -515,7 +584,6 @@ def _send_course_email(entry_id, email_id, to_list, global_email_context, subtas
             email_context['email'] = email
             email_context['name'] = current_recipient['profile__name']
             email_context['user_id'] = current_recipient['pk']
-            email_context['course_id'] = course_email.course_id
 
             # Construct message content using templates and context:
             plaintext_msg = course_email_template.render_plaintext(course_email.text_message, email_context)
@@ -703,11 +771,13 @@ def _send_course_email(entry_id, email_id, to_list, global_email_context, subtas
         # All went well.  Update counters with progress to date,
         # and set the state to SUCCESS:
         subtask_status.increment(state=SUCCESS)
+        keep_connection_open = True
         # Successful completion is marked by an exception value of None.
         return subtask_status, None
     finally:
         # Clean up at the end.
-        connection.close()
+        if connection is not None:
+            _release_mail_connection(connection, keep_connection_open)
 
 
 def _get_current_task():
@@ -224,6 +224,22 @@ class CourseEmailTemplateTest(TestCase):
         self.assertIn(context['course_title'], message)
         self.assertIn(context['name'], message)
 
+    def test_prerendered_matches_template(self):
+        template = CourseEmailTemplate.get_template()
+        context = self._add_xss_fields(self._get_sample_html_context())
+        prerendered = template.prerender(
+            dict(context, name='', email='', user_id=None), ('name', 'email', 'user_id')
+        )
+        message = "Dear %%USER_FULLNAME%%, thanks for enrolling in %%COURSE_DISPLAY_NAME%%."
+        self.assertEqual(
+            prerendered.render_plaintext(message, dict(context)),
+            template.render_plaintext(message, dict(context)),
+        )
+        self.assertEqual(
+            prerendered.render_htmltext(message, dict(context)),
+            template.render_htmltext(message, dict(context)),
+        )
+
 
 @attr(shard=1)
 class CourseAuthorizationTest(TestCase):
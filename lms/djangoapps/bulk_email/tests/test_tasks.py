@@ -26,12 +26,18 @@ from boto.ses.exceptions import (
 from celery.states import FAILURE, SUCCESS  # pylint: disable=no-name-in-module, import-error
 from django.conf import settings
 from django.core.management import call_command
+from django.test.utils import override_settings
 from mock import Mock, patch
 from nose.plugins.attrib import attr
 from opaque_keys.edx.locator import CourseLocator
 
 from bulk_email.models import SEND_TO_LEARNERS, SEND_TO_MYSELF, SEND_TO_STAFF, CourseEmail, Optout
-from bulk_email.tasks import _get_course_email_context
+from bulk_email.tasks import (
+    _get_course_email_context,
+    _get_mail_connection,
+    _persistent_connections,
+    _release_mail_connection
+)
 from lms.djangoapps.instructor_task.models import InstructorTask
 from lms.djangoapps.instructor_task.subtasks import SubtaskStatus, update_subtask_status
 from lms.djangoapps.instructor_task.tasks import send_bulk_course_email
@@ -197,6 +203,31 @@ class TestBulkEmailInstructorTask(InstructorTaskCourseTestCase):
             get_conn.return_value.send_messages.side_effect = cycle([None])
             self._test_run_with_task(send_bulk_course_email, 'emailed', num_emails, num_emails)
 
+    @override_settings(BULK_EMAIL_PERSISTENT_CONNECTIONS=True)
+    def test_successful_with_persistent_connection(self):
+        # Select number of emails to fit into a single subtask.
+        num_emails = settings.BULK_EMAIL_EMAILS_PER_TASK
+        # We also send email to the instructor:
+        self._create_students(num_emails - 1)
+        self.addCleanup(setattr, _persistent_connections, 'connection', None)
+        with patch('bulk_email.tasks.get_connection', autospec=True) as get_conn:
+            get_conn.return_value.send_messages.side_effect = cycle([None])
+            self._test_run_with_task(send_bulk_course_email, 'emailed', num_emails, num_emails)
+        # The connection is left open for the next subtask to reuse.
+        self.assertFalse(get_conn.return_value.close.called)
+        self.assertIs(_get_mail_connection(), get_conn.return_value)
+
+    @override_settings(BULK_EMAIL_PERSISTENT_CONNECTIONS=True)
+    def test_persistent_connection_dropped_after_failure(self):
+        self.addCleanup(setattr, _persistent_connections, 'connection', None)
+        with patch('bulk_email.tasks.get_connection', side_effect=[Mock(), Mock()]):
+            connection = _get_mail_connection()
+            _release_mail_connection(connection, keep_open=True)
+            self.assertIs(_get_mail_connection(), connection)
+            _release_mail_connection(connection, keep_open=False)
+            self.assertTrue(connection.close.called)
+            self.assertIsNot(_get_mail_connection(), connection)
+
     def test_successful_twice(self):
         # Select number of emails to fit into a single subtask.
         num_emails = settings.BULK_EMAIL_EMAILS_PER_TASK
@@ -244,6 +275,21 @@ class TestBulkEmailInstructorTask(InstructorTaskCourseTestCase):
                 send_bulk_course_email, 'emailed', num_emails, expected_succeeds, skipped=expected_skipped
             )
 
+    def test_optouts_queried_once(self):
+        # Select number of emails to fit into a single subtask.
+        num_emails = settings.BULK_EMAIL_EMAILS_PER_TASK
+        # We also send email to the instructor:
+        students = self._create_students(num_emails - 1)
+        Optout.objects.create(user=students[0], course_id=self.course.id)
+        with patch('bulk_email.tasks.get_connection', autospec=True) as get_conn:
+            get_conn.return_value.send_messages.side_effect = cycle([None])
+            with patch('bulk_email.tasks.Optout', wraps=Optout) as mock_optout:
+                self._test_run_with_task(
+                    send_bulk_course_email, 'emailed', num_emails, num_emails - 1, skipped=1
+                )
+        # The optouts were looked up by the parent task, and not again by the subtask.
+        self.assertEquals(mock_optout.objects.filter.call_count, 1)
+
     def _test_email_address_failures(self, exception):
         """Test that celery handles bad address errors by failing and not retrying."""
         # Select number of emails to fit into a single subtask.
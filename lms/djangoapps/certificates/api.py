@@ -125,7 +125,7 @@ def get_certificate_for_user(username, course_key):
 
 
 def generate_user_certificates(student, course_key, course=None, insecure=False, generation_mode='batch',
-                               forced_grade=None):
+                               forced_grade=None, xqueue=None):
     """
     It will add the add-cert request into the xqueue.
 
@@ -146,8 +146,12 @@ def generate_user_certificates(student, course_key, course=None, insecure=False,
         in case of django command and `self` if student initiated the request.
         forced_grade - a string indicating to replace grade parameter. if present grading
                        will be skipped.
+        xqueue (XQueueCertInterface): Optionally provide the interface to add the
+            certificate with, so that one connection to the XQueue is reused for a
+            batch of students.
     """
-    xqueue = XQueueCertInterface()
+    if xqueue is None:
+        xqueue = XQueueCertInterface()
     if insecure:
         xqueue.use_https = False
 
@@ -21,6 +21,7 @@ from lms.djangoapps.certificates.models import (
 )
 from course_modes.models import CourseMode
 from lms.djangoapps.grades.course_grade_factory import CourseGradeFactory
+from lms.djangoapps.grades.models import PersistentCourseGrade
 from lms.djangoapps.verify_student.models import SoftwareSecurePhotoVerification
 from student.models import CourseEnrollment, UserProfile
 from xmodule.modulestore.django import modulestore
@@ -75,6 +76,10 @@ class XQueueCertInterface(object):
                    For a user that already has a certificate
                    this will delete his cert.
 
+       prefetch:   Load the data that add_cert needs about
+                   a batch of students with a few queries,
+                   before adding their certificates.
+
     """
 
     def __init__(self, request=None):
@@ -102,6 +107,49 @@ class XQueueCertInterface(object):
         self.whitelist = CertificateWhitelist.objects.all()
         self.restricted = UserProfile.objects.filter(allow_certificate=False)
         self.use_https = True
+        self._prefetched = None
+
+    def prefetch(self, course_id, students):
+        """
+        Load the data that add_cert needs about each of the given students
+        in the course: their grades, names, whitelist entries, ID
+        verifications and certificate restrictions.
+
+        This makes a few queries for all of the students, rather than a few
+        queries for each student as they are added.  The data is replaced
+        when the next batch of students is prefetched.
+
+        Arguments:
+          course_id - courseenrollment.course_id (CourseKey)
+          students  - list of User.object
+        """
+        user_ids = [student.id for student in students]
+        PersistentCourseGrade.prefetch(course_id, students)
+        self._prefetched = {
+            'course_id': course_id,
+            'profile_names': dict(UserProfile.objects.filter(user_id__in=user_ids).values_list('user_id', 'name')),
+            'whitelisted': set(
+                self.whitelist.filter(
+                    user_id__in=user_ids, course_id=course_id, whitelist=True
+                ).values_list('user_id', flat=True)
+            ),
+            'verified': set(
+                SoftwareSecurePhotoVerification.verified_query().filter(
+                    user_id__in=user_ids
+                ).values_list('user_id', flat=True)
+            ),
+            'restricted': set(self.restricted.filter(user_id__in=user_ids).values_list('user_id', flat=True)),
+        }
+
+    def _get_prefetched(self, student, course_id):
+        """
+        Return the prefetched data of the student's batch, or None if the
+        student was not prefetched for the course.
+        """
+        prefetched = self._prefetched
+        if prefetched and prefetched['course_id'] == course_id and student.id in prefetched['profile_names']:
+            return prefetched
+        return None
 
     def regen_cert(self, student, course_id, course=None, forced_grade=None, template_file=None, generate_pdf=True):
         """(Re-)Make certificate for a particular student in a particular course
@@ -260,18 +308,28 @@ class XQueueCertInterface(object):
         if course is None:
             course = modulestore().get_course(course_id, depth=0)
 
-        profile = UserProfile.objects.get(user=student)
-        profile_name = profile.name
+        prefetched = self._get_prefetched(student, course_id)
+        if prefetched:
+            profile_name = prefetched['profile_names'][student.id]
+        else:
+            profile = UserProfile.objects.get(user=student)
+            profile_name = profile.name
 
         # Needed for access control in grading.
         self.request.user = student
         self.request.session = {}
 
-        is_whitelisted = self.whitelist.filter(user=student, course_id=course_id, whitelist=True).exists()
+        if prefetched:
+            is_whitelisted = student.id in prefetched['whitelisted']
+        else:
+            is_whitelisted = self.whitelist.filter(user=student, course_id=course_id, whitelist=True).exists()
         course_grade = CourseGradeFactory().read(student, course)
         enrollment_mode, __ = CourseEnrollment.enrollment_mode_for_user(student, course_id)
         mode_is_verified = enrollment_mode in GeneratedCertificate.VERIFIED_CERTS_MODES
-        user_is_verified = SoftwareSecurePhotoVerification.user_is_verified(student)
+        if prefetched:
+            user_is_verified = student.id in prefetched['verified']
+        else:
+            user_is_verified = SoftwareSecurePhotoVerification.user_is_verified(student)
         cert_mode = enrollment_mode
         is_eligible_for_certificate = is_whitelisted or CourseMode.is_eligible_for_certificate(enrollment_mode)
         unverified = False
@@ -383,7 +441,11 @@ class XQueueCertInterface(object):
         # Check to see whether the student is on the the embargoed
         # country restricted list. If so, they should not receive a
         # certificate -- set their status to restricted and log it.
-        if self.restricted.filter(user=student).exists():
+        if prefetched:
+            is_restricted = student.id in prefetched['restricted']
+        else:
+            is_restricted = self.restricted.filter(user=student).exists()
+        if is_restricted:
             cert.status = status.restricted
             cert.save()
 
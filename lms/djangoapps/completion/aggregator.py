@@ -0,0 +1,124 @@
+"""
+Per-user cached completion of a course.
+
+The completion aggregate of a learner's course is kept in the cache, so that
+the course outline and the blocks API can be served without loading all of
+the learner's completion rows on every request.  It holds the learner's block
+completions in the course and the most recently completed block.  It is built
+from the database the first time it is read, and cleared whenever the
+learner's completions in the course change.
+
+Completions are usually submitted inside the transaction of a request, so the
+aggregate is cleared once more after the request's transaction has committed,
+by CompletionAggregateMiddleware.  Otherwise a read racing with the
+submission could cache the completions from before it.
+"""
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+from django.core.cache import cache
+from django.db import transaction
+from opaque_keys.edx.keys import UsageKey
+
+from openedx.core.djangoapps.request_cache import get_cache
+
+from .models import BlockCompletion
+
+AGGREGATE_CACHE_KEY = 'completion.aggregator.aggregate.{user_id}.{course_key}'
+
+# Aggregates cleared within a transaction, which are cleared again after it commits.
+PENDING_CLEAR_CACHE_NAMESPACE = 'completion.aggregator.pending_clear'
+
+# In case an aggregate is not cleared after a submission (e.g. one made in a
+# transaction outside of a request), it is also rebuilt from the database
+# this often, so that it can't hide a learner's progress for long.
+AGGREGATE_CACHE_TIMEOUT = 5 * 60
+
+
+class CourseCompletionAggregate(object):
+    """
+    The completion of a learner's blocks in a course.
+    """
+    def __init__(self, course_key, data):
+        self.course_key = course_key
+        self._data = data
+
+    @property
+    def completions(self):
+        """
+        Returns a dict of the UsageKeys of the learner's completed blocks to
+        their completion values, like BlockCompletion.get_course_completions.
+        """
+        return {
+            UsageKey.from_string(block_key): completion
+            for block_key, completion in self._data['completions'].iteritems()
+        }
+
+    @property
+    def latest_block_key(self):
+        """
+        Returns the UsageKey of the block whose completion was submitted most
+        recently, or None if there are no completions.
+        """
+        latest = self._data['latest']
+        return UsageKey.from_string(latest) if latest is not None else None
+
+
+def get_course_completion_aggregate(user, course_key):
+    """
+    Returns the CourseCompletionAggregate of the user in the course, from the
+    cache if it is there, or else from the user's completions in the database.
+    """
+    cache_key = AGGREGATE_CACHE_KEY.format(user_id=user.id, course_key=course_key)
+    data = cache.get(cache_key)
+    if data is None:
+        data = _build_aggregate_data(user, course_key)
+        cache.set(cache_key, data, AGGREGATE_CACHE_TIMEOUT)
+    return CourseCompletionAggregate(course_key, data)
+
+
+def clear_course_completion_aggregate(user, course_key):
+    """
+    Clears the user's cached aggregate of the course, so that it is rebuilt
+    from the database the next time it is read.
+
+    When called within a transaction, the aggregate is cleared again by
+    clear_pending_course_completion_aggregates once the transaction has
+    committed.
+    """
+    cache_key = AGGREGATE_CACHE_KEY.format(user_id=user.id, course_key=course_key)
+    cache.delete(cache_key)
+    if transaction.get_connection().in_atomic_block:
+        get_cache(PENDING_CLEAR_CACHE_NAMESPACE)[cache_key] = True
+
+
+def clear_pending_course_completion_aggregates():
+    """
+    Clears the aggregates which were cleared within a transaction that has
+    since been committed or rolled back.
+    """
+    pending = get_cache(PENDING_CLEAR_CACHE_NAMESPACE)
+    if pending:
+        cache.delete_many(list(pending))
+        pending.clear()
+
+
+def _build_aggregate_data(user, course_key):
+    """
+    Returns the user's completions in the course, loaded with a single query.
+    """
+    completions = {}
+    latest = latest_modified = None
+    for block_key, completion, modified in BlockCompletion.objects.filter(
+            user=user,
+            course_key=course_key,
+    ).values_list('block_key', 'completion', 'modified'):
+        block_key = unicode(block_key.map_into_course(course_key))
+        completions[block_key] = completion
+        if latest_modified is None or modified > latest_modified:
+            latest, latest_modified = block_key, modified
+
+    return {
+        'completions': completions,
+        'latest': latest,
+    }
@@ -12,7 +12,9 @@ from opaque_keys.edx.keys import CourseKey, UsageKey
 from xblock.completable import XBlockCompletionMode
 from xblock.core import XBlock
 
+from .aggregator import clear_course_completion_aggregate
 from .models import BlockCompletion
+from .signals import BLOCK_COMPLETIONS_SUBMITTED
 from . import waffle
 
 
@@ -41,3 +43,12 @@ def scorable_block_completion(sender, **kwargs):  # pylint: disable=unused-argum
         block_key=block_key,
         completion=completion,
     )
+
+
+@receiver(BLOCK_COMPLETIONS_SUBMITTED)
+def update_aggregate_completion(sender, user, course_key, block_completions, **kwargs):  # pylint: disable=unused-argument
+    """
+    When completions are submitted, clear the user's cached course completion
+    aggregate, so that it is rebuilt with them.
+    """
+    clear_course_completion_aggregate(user, course_key)
@@ -0,0 +1,30 @@
+"""
+Middleware for the completion app
+"""
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+from .aggregator import clear_pending_course_completion_aggregates
+
+
+class CompletionAggregateMiddleware(object):
+    """
+    Clear the course completion aggregates which were cleared within the
+    request's transaction, once it has committed.
+
+    Response middleware runs after the view's ATOMIC_REQUESTS transaction has
+    ended, so a read that raced with a submission can't leave an aggregate
+    cached without the submitted completions.
+    """
+    def process_response(self, _request, response):
+        """
+        Clear the pending aggregates after a request.
+        """
+        clear_pending_course_completion_aggregates()
+        return response
+
+    def process_exception(self, _request, _exception):
+        """
+        Clear the pending aggregates after a failed request.
+        """
+        clear_pending_course_completion_aggregates()
@@ -4,15 +4,19 @@ Completion tracking and aggregation models.
 
 from __future__ import absolute_import, division, print_function, unicode_literals
 
+from collections import OrderedDict, defaultdict
+
 from django.contrib.auth.models import User
 from django.core.exceptions import ValidationError
-from django.db import models, transaction, connection
+from django.db import IntegrityError, models, transaction, connection
+from django.utils.timezone import now
 from django.utils.translation import ugettext as _
 from model_utils.models import TimeStampedModel
 from opaque_keys.edx.django.models import CourseKeyField, UsageKeyField
 from opaque_keys.edx.keys import CourseKey
 
 from . import waffle
+from .signals import BLOCK_COMPLETIONS_SUBMITTED
 
 # pylint: disable=ungrouped-imports
 try:
@@ -87,17 +91,14 @@ class BlockCompletionManager(models.Manager):
             )
 
         if waffle.waffle().is_enabled(waffle.ENABLE_COMPLETION_TRACKING):
-            obj, is_new = self.get_or_create(
-                user=user,
-                course_key=course_key,
-                block_type=block_type,
-                block_key=block_key,
-                defaults={'completion': completion},
-            )
-            if not is_new and obj.completion != completion:
-                obj.completion = completion
-                obj.full_clean()
-                obj.save()
+            obj, is_new, is_changed = self._set_completion(user, course_key, block_type, block_key, completion)
+            if is_changed:
+                BLOCK_COMPLETIONS_SUBMITTED.send(
+                    sender=self.model,
+                    user=user,
+                    course_key=course_key,
+                    block_completions={block_key: completion},
+                )
         else:
             # If the feature is not enabled, this method should not be called.  Error out with a RuntimeError.
             raise RuntimeError(
@@ -105,11 +106,38 @@ class BlockCompletionManager(models.Manager):
             )
         return obj, is_new
 
-    @transaction.atomic()
+    def _set_completion(self, user, course_key, block_type, block_key, completion):
+        """
+        Get or create the completion of a block, and update its value if it differs.
+
+        Returns a tuple of the BlockCompletion, whether it was created and whether it was created or changed.
+        """
+        obj, is_new = self.get_or_create(
+            user=user,
+            course_key=course_key,
+            block_type=block_type,
+            block_key=block_key,
+            defaults={'completion': completion},
+        )
+        if not is_new and obj.completion != completion:
+            obj.completion = completion
+            obj.full_clean()
+            obj.save()
+            return obj, is_new, True
+        return obj, is_new, is_new
+
     def submit_batch_completion(self, user, course_key, blocks):
         """
         Performs a batch insertion of completion objects.
 
+        The existing completions of all of the blocks are read with a single
+        query, the new ones are inserted with a single query, and the changed
+        ones are updated with one query for each distinct completion value.
+        When a block appears in the batch more than once, its last completion
+        value is used.  If any completions were created or changed, the
+        BLOCK_COMPLETIONS_SUBMITTED signal is sent once for the whole batch,
+        after the transaction writing them.
+
         Parameters:
             * user (django.contrib.auth.models.User): The user for whom the
               completions are being submitted.
@@ -136,12 +164,100 @@ class BlockCompletionManager(models.Manager):
                 If there was a problem getting, creating, or updating the
                 BlockCompletion record in the database.
         """
-        block_completions = {}
-        for block, completion in blocks:
-            (block_completion, is_new) = self.submit_completion(user, course_key, block, completion)
-            block_completions[block_completion] = is_new
+        if not isinstance(course_key, CourseKey):
+            raise ValueError(
+                "course_key must be an instance of `opaque_keys.edx.keys.CourseKey`.  Got {}".format(type(course_key))
+            )
+        if not waffle.waffle().is_enabled(waffle.ENABLE_COMPLETION_TRACKING):
+            raise RuntimeError(
+                "BlockCompletion.objects.submit_batch_completion should not be called when the feature is disabled."
+            )
+
+        submitted = OrderedDict()
+        for block_key, completion in blocks:
+            if not hasattr(block_key, 'block_type'):
+                raise ValueError(
+                    "block_key must be an instance of `opaque_keys.edx.keys.UsageKey`.  Got {}".format(type(block_key))
+                )
+            validate_percent(completion)
+            submitted[block_key] = completion
+
+        block_completions, changed_completions = self._write_batch_completion(user, course_key, submitted)
+        if changed_completions:
+            BLOCK_COMPLETIONS_SUBMITTED.send(
+                sender=self.model,
+                user=user,
+                course_key=course_key,
+                block_completions=changed_completions,
+            )
         return block_completions
 
+    @transaction.atomic()
+    def _write_batch_completion(self, user, course_key, submitted):
+        """
+        Writes the submitted completions of a batch, an OrderedDict of UsageKeys
+        to completion values.
+
+        Returns a tuple of the dict of BlockCompletions to whether they were
+        created, and the dict of the created or changed UsageKeys to their
+        completion values.
+        """
+        existing = {
+            block_completion.block_key: block_completion
+            for block_completion in self.filter(user=user, course_key=course_key, block_key__in=submitted.keys())
+        }
+        block_completions = {}
+        changed_completions = {}
+        new_completions = []
+        changed_pks_by_completion = defaultdict(list)
+        for block_key, completion in submitted.iteritems():
+            block_completion = existing.get(block_key)
+            if block_completion is None:
+                new_completions.append(self.model(
+                    user=user,
+                    course_key=course_key,
+                    block_type=block_key.block_type,
+                    block_key=block_key,
+                    completion=completion,
+                ))
+                changed_completions[block_key] = completion
+            else:
+                if block_completion.completion != completion:
+                    block_completion.completion = completion
+                    changed_pks_by_completion[completion].append(block_completion.pk)
+                    changed_completions[block_key] = completion
+                block_completions[block_completion] = False
+
+        for completion, pks in changed_pks_by_completion.iteritems():
+            self.filter(pk__in=pks).update(completion=completion, modified=now())
+
+        if new_completions:
+            try:
+                with transaction.atomic():
+                    self.bulk_create(new_completions)
+            except IntegrityError:
+                # Another request created some of these completions since they
+                # were read, so fall back to setting the new ones one at a time.
+                # They are signalled along with the rest of the batch.
+                for new_completion in new_completions:
+                    block_completion, is_new, is_changed = self._set_completion(
+                        user, course_key, new_completion.block_type, new_completion.block_key, new_completion.completion
+                    )
+                    block_completions[block_completion] = is_new
+                    if not is_changed:
+                        del changed_completions[new_completion.block_key]
+            else:
+                # The bulk insert does not set the primary keys of the objects on
+                # every database, so read the new rows back.
+                for block_completion in self.filter(
+                        user=user,
+                        course_key=course_key,
+                        block_key__in=[new_completion.block_key for new_completion in new_completions],
+                ):
+                    block_completions[block_completion] = True
+
+        return block_completions, changed_completions
+
 
 class BlockCompletion(TimeStampedModel, models.Model):
     """
@@ -0,0 +1,20 @@
+"""
+Completion related signals.
+"""
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+from django.dispatch import Signal
+
+# Signal that indicates that some of a user's block completions have been
+# created or changed.  It is sent once for each call to
+# BlockCompletion.objects.submit_completion or submit_batch_completion that
+# changed anything, rather than once for each block in a batch.
+BLOCK_COMPLETIONS_SUBMITTED = Signal(
+    providing_args=[
+        'user',  # The User whose completions changed
+        'course_key',  # CourseKey of the course in which the blocks are found
+        'block_completions',  # Dict of the UsageKeys of the created or changed
+                              # blocks to their new float completion values
+    ]
+)
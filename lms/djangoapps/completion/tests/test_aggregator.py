@@ -0,0 +1,101 @@
+"""
+Test the cached course completion aggregates.
+"""
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+from django.http import HttpResponse
+from django.test import RequestFactory
+
+from student.tests.factories import CourseEnrollmentFactory, UserFactory
+from xmodule.modulestore.tests.django_utils import ModuleStoreTestCase
+from xmodule.modulestore.tests.factories import CourseFactory, ItemFactory
+
+from .. import aggregator
+from ..middleware import CompletionAggregateMiddleware
+from ..models import BlockCompletion
+from ..test_utils import CompletionWaffleTestMixin
+
+
+class CourseCompletionAggregateTestCase(CompletionWaffleTestMixin, ModuleStoreTestCase):
+    """
+    Test that course completion aggregates are built and kept up to date.
+    """
+    ENABLED_CACHES = ['default']
+
+    def setUp(self):
+        super(CourseCompletionAggregateTestCase, self).setUp()
+        self.override_waffle_switch(True)
+
+        self.course = CourseFactory.create()
+        self.chapter = ItemFactory.create(category='chapter', parent=self.course)
+        self.sequential = ItemFactory.create(category='sequential', parent=self.chapter)
+        self.vertical = ItemFactory.create(category='vertical', parent=self.sequential)
+        self.htmls = [ItemFactory.create(category='html', parent=self.vertical) for __ in range(4)]
+
+        self.user = UserFactory.create()
+        CourseEnrollmentFactory.create(user=self.user, course_id=self.course.id)
+
+    def _submit(self, html_index, completion):
+        BlockCompletion.objects.submit_completion(
+            self.user, self.course.id, self.htmls[html_index].location, completion
+        )
+
+    def _assert_aggregate(self, aggregate):
+        """
+        Assert that the aggregate has the user's completions from the database.
+        """
+        self.assertEqual(aggregate.completions, BlockCompletion.get_course_completions(self.user, self.course.id))
+        self.assertEqual(
+            aggregate.latest_block_key,
+            BlockCompletion.get_latest_block_completed(self.user, self.course.id).block_key,
+        )
+
+    def test_build(self):
+        self._submit(0, 1.0)
+        self._submit(2, 0.5)
+
+        aggregate = aggregator.get_course_completion_aggregate(self.user, self.course.id)
+
+        self.assertEqual(aggregate.completions, {self.htmls[0].location: 1.0, self.htmls[2].location: 0.5})
+        self.assertEqual(aggregate.latest_block_key, self.htmls[2].location)
+        self._assert_aggregate(aggregate)
+
+    def test_cached(self):
+        self._submit(0, 1.0)
+        aggregator.get_course_completion_aggregate(self.user, self.course.id)
+
+        with self.assertNumQueries(0):
+            aggregate = aggregator.get_course_completion_aggregate(self.user, self.course.id)
+        self._assert_aggregate(aggregate)
+
+    def test_cleared_on_submission(self):
+        self._submit(0, 0.5)
+        aggregator.get_course_completion_aggregate(self.user, self.course.id)
+
+        self._submit(0, 1.0)
+        BlockCompletion.objects.submit_batch_completion(
+            self.user, self.course.id, [(self.htmls[2].location, 1.0), (self.htmls[3].location, 1.0)]
+        )
+
+        # The aggregate is rebuilt with a single query.
+        with self.assertNumQueries(1):
+            aggregate = aggregator.get_course_completion_aggregate(self.user, self.course.id)
+        self._assert_aggregate(aggregate)
+
+    def test_cleared_after_request(self):
+        # Test cases run in a transaction, like requests under ATOMIC_REQUESTS.
+        self._submit(0, 0.5)
+        self._submit(0, 1.0)
+
+        # A read racing with the submission caches the aggregate from before
+        # the submission's transaction committed.
+        completions = BlockCompletion.objects.filter(user=self.user, block_key=self.htmls[0].location)
+        completions.update(completion=0.5)
+        aggregator.get_course_completion_aggregate(self.user, self.course.id)
+        completions.update(completion=1.0)
+
+        CompletionAggregateMiddleware().process_response(RequestFactory().get('/'), HttpResponse())
+
+        aggregate = aggregator.get_course_completion_aggregate(self.user, self.course.id)
+        self.assertEqual(aggregate.completions[self.htmls[0].location], 1.0)
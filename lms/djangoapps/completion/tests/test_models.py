@@ -5,12 +5,15 @@ Test models, managers, and validators.
 from __future__ import absolute_import, division, print_function, unicode_literals
 
 from django.core.exceptions import ValidationError
+from django.db import IntegrityError
 from django.test import TestCase
+from mock import Mock, patch
 
 from opaque_keys.edx.keys import CourseKey, UsageKey
 from student.tests.factories import CourseEnrollmentFactory, UserFactory
 
 from .. import models, waffle
+from ..signals import BLOCK_COMPLETIONS_SUBMITTED
 
 
 class PercentValidatorTestCase(TestCase):
@@ -187,6 +190,91 @@ class SubmitBatchCompletionTestCase(TestCase):
         model = models.BlockCompletion.objects.first()
         self.assertEqual(model.completion, 1.0)
 
+    def test_submit_batch_completion_bulk_queries(self):
+        block_keys = [self.course_key_obj.make_usage_key('video', 'video{}'.format(index)) for index in range(10)]
+        models.BlockCompletion.objects.submit_batch_completion(
+            self.user, self.course_key_obj, [(block_key, 0.0) for block_key in block_keys[:5]]
+        )
+
+        handler = Mock()
+        BLOCK_COMPLETIONS_SUBMITTED.connect(handler)
+        self.addCleanup(BLOCK_COMPLETIONS_SUBMITTED.disconnect, handler)
+        # Read the existing completions, update the changed ones, insert the
+        # new ones and read them back, within two savepoints.
+        with self.assertNumQueries(8):
+            block_completions = models.BlockCompletion.objects.submit_batch_completion(
+                self.user, self.course_key_obj, [(block_key, 1.0) for block_key in block_keys[2:]]
+            )
+
+        self.assertEqual(
+            {block_completion.block_key: is_new for block_completion, is_new in block_completions.items()},
+            {block_key: index >= 5 for index, block_key in enumerate(block_keys) if index >= 2},
+        )
+        self.assertEqual(
+            models.BlockCompletion.get_course_completions(self.user, self.course_key_obj),
+            {block_key: 0.0 if index < 2 else 1.0 for index, block_key in enumerate(block_keys)},
+        )
+        self.assertEqual(handler.call_count, 1)
+        self.assertEqual(handler.call_args[1]['user'], self.user)
+        self.assertEqual(handler.call_args[1]['course_key'], self.course_key_obj)
+        self.assertEqual(
+            handler.call_args[1]['block_completions'],
+            {block_key: 1.0 for block_key in block_keys[2:]},
+        )
+
+    def test_submit_batch_completion_integrity_error(self):
+        block_keys = [self.course_key_obj.make_usage_key('video', 'video{}'.format(index)) for index in range(3)]
+        models.BlockCompletion.objects.submit_batch_completion(
+            self.user, self.course_key_obj, [(block_keys[0], 1.0)]
+        )
+
+        handler = Mock()
+        BLOCK_COMPLETIONS_SUBMITTED.connect(handler)
+        self.addCleanup(BLOCK_COMPLETIONS_SUBMITTED.disconnect, handler)
+        # Another request inserting completions concurrently makes the bulk insert fail.
+        with patch.object(models.BlockCompletionManager, 'bulk_create', side_effect=IntegrityError):
+            block_completions = models.BlockCompletion.objects.submit_batch_completion(
+                self.user, self.course_key_obj, [(block_key, 0.5) for block_key in block_keys]
+            )
+
+        self.assertEqual(
+            {block_completion.block_key: is_new for block_completion, is_new in block_completions.items()},
+            {block_key: index > 0 for index, block_key in enumerate(block_keys)},
+        )
+        # Each block is signalled once, in the signal for the whole batch.
+        self.assertEqual(handler.call_count, 1)
+        self.assertEqual(
+            handler.call_args[1]['block_completions'],
+            {block_key: 0.5 for block_key in block_keys},
+        )
+
+    def test_submit_batch_completion_dedupes_blocks(self):
+        blocks = [(self.block_key, 0.0), (self.block_key, 0.5), (self.block_key, 1.0)]
+        block_completions = models.BlockCompletion.objects.submit_batch_completion(
+            self.user, self.course_key_obj, blocks
+        )
+        self.assertEqual(len(block_completions), 1)
+        self.assertEqual(models.BlockCompletion.objects.count(), 1)
+        self.assertEqual(models.BlockCompletion.objects.get().completion, 1.0)
+
+    def test_submit_batch_completion_unchanged(self):
+        blocks = [(self.block_key, 1.0)]
+        models.BlockCompletion.objects.submit_batch_completion(self.user, self.course_key_obj, blocks)
+
+        handler = Mock()
+        BLOCK_COMPLETIONS_SUBMITTED.connect(handler)
+        self.addCleanup(BLOCK_COMPLETIONS_SUBMITTED.disconnect, handler)
+        with self.assertNumQueries(3):
+            models.BlockCompletion.objects.submit_batch_completion(self.user, self.course_key_obj, blocks)
+        self.assertFalse(handler.called)
+
+    def test_submit_batch_completion_invalid_completion(self):
+        with self.assertRaises(ValidationError):
+            models.BlockCompletion.objects.submit_batch_completion(
+                self.user, self.course_key_obj, [(self.block_key, 1.5)]
+            )
+        self.assertEqual(models.BlockCompletion.objects.count(), 0)
+
 
 class BatchCompletionMethodTests(TestCase):
 
@@ -33,6 +33,12 @@ ENABLE_COURSE_VISUAL_PROGRESS = 'enable_course_visual_progress'
 # SiteConfiguration visual progress enablement
 ENABLE_SITE_VISUAL_PROGRESS = 'enable_site_visual_progress'
 
+# Full name: completion.enable_completion_aggregation
+# Indicates whether to serve learners' completions in the course outline and
+# blocks API from their cached course completion aggregates,
+# rather than loading their completion rows on every request.
+ENABLE_COMPLETION_AGGREGATION = 'enable_completion_aggregation'
+
 
 def waffle():
     """
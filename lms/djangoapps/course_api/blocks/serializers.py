@@ -2,16 +2,76 @@
 Serializers for Course Blocks related return objects.
 """
 from django.conf import settings
+from django.utils.functional import cached_property
+from django.utils.http import RFC3986_SUBDELIMS, urlquote
 from rest_framework import serializers
 from rest_framework.reverse import reverse
+from rest_framework.utils.encoders import JSONEncoder
 
 from .transformers import SUPPORTED_FIELDS
 
+# Stands in for the block's usage key when a block URL is reversed into a template.  It must
+# match the usage key patterns of the URLs in BlockUrlTemplates.
+BLOCK_KEY_PLACEHOLDER = 'BLOCK_KEY_PLACEHOLDER'
+
+# The characters which django's reverse() leaves unquoted in URLs.
+URL_SAFE_CHARACTERS = RFC3986_SUBDELIMS + str('/~:@')
+
+# Number of blocks encoded into each chunk of a streamed JSON response.
+BLOCKS_PER_JSON_CHUNK = 100
+
+
+class BlockUrlTemplates(object):
+    """
+    Builds the URLs of blocks from templates, reversing each URL pattern only
+    once per course rather than once per block.
+    """
+    def __init__(self, request):
+        self.request = request
+        self._templates = {}
+
+    def url(self, url_name, block_key, block_key_kwarg, course_id_kwarg=None):
+        """
+        Return the absolute URL named url_name for the given block.
+
+        Arguments:
+            url_name (str): The name of the URL pattern.
+            block_key (UsageKey): The block to return the URL for.
+            block_key_kwarg (str): The name of the pattern's usage key argument.
+            course_id_kwarg (str): The name of the pattern's course id argument, if it has one.
+        """
+        template_key = (url_name, block_key.course_key)
+        template = self._templates.get(template_key)
+        if template is None:
+            kwargs = {block_key_kwarg: BLOCK_KEY_PLACEHOLDER}
+            if course_id_kwarg:
+                kwargs[course_id_kwarg] = unicode(block_key.course_key)
+            template = self._templates[template_key] = reverse(url_name, kwargs=kwargs, request=self.request)
+        return template.replace(BLOCK_KEY_PLACEHOLDER, urlquote(unicode(block_key), safe=URL_SAFE_CHARACTERS))
+
 
 class BlockSerializer(serializers.Serializer):  # pylint: disable=abstract-method
     """
     Serializer for single course block
     """
+    @cached_property
+    def _url_templates(self):
+        """
+        The URL templates shared by all the blocks this serializer represents.
+        """
+        return BlockUrlTemplates(self.context['request'])
+
+    @cached_property
+    def _requested_supported_fields(self):
+        """
+        The supported fields which were requested, in the order of SUPPORTED_FIELDS.
+        """
+        requested_fields = set(self.context['requested_fields'])
+        return [
+            supported_field for supported_field in SUPPORTED_FIELDS
+            if supported_field.requested_field_name in requested_fields
+        ]
+
     def _get_field(self, block_key, transformer, field_name, default):
         """
         Get the field value requested.  The field may be an XBlock field, a
@@ -38,37 +98,30 @@ class BlockSerializer(serializers.Serializer):  # pylint: disable=abstract-metho
         data = {
             'id': unicode(block_key),
             'block_id': unicode(block_key.block_id),
-            'lms_web_url': reverse(
-                'jump_to',
-                kwargs={'course_id': unicode(block_key.course_key), 'location': unicode(block_key)},
-                request=self.context['request'],
+            'lms_web_url': self._url_templates.url(
+                'jump_to', block_key, block_key_kwarg='location', course_id_kwarg='course_id',
             ),
-            'student_view_url': reverse(
-                'render_xblock',
-                kwargs={'usage_key_string': unicode(block_key)},
-                request=self.context['request'],
+            'student_view_url': self._url_templates.url(
+                'render_xblock', block_key, block_key_kwarg='usage_key_string',
             ),
         }
 
         if settings.FEATURES.get("ENABLE_LTI_PROVIDER") and 'lti_url' in self.context['requested_fields']:
-            data['lti_url'] = reverse(
-                'lti_provider_launch',
-                kwargs={'course_id': unicode(block_key.course_key), 'usage_id': unicode(block_key)},
-                request=self.context['request'],
+            data['lti_url'] = self._url_templates.url(
+                'lti_provider_launch', block_key, block_key_kwarg='usage_id', course_id_kwarg='course_id',
             )
 
         # add additional requested fields that are supported by the various transformers
-        for supported_field in SUPPORTED_FIELDS:
-            if supported_field.requested_field_name in self.context['requested_fields']:
-                field_value = self._get_field(
-                    block_key,
-                    supported_field.transformer,
-                    supported_field.block_field_name,
-                    supported_field.default_value,
-                )
-                if field_value is not None:
-                    # only return fields that have data
-                    data[supported_field.serializer_field_name] = field_value
+        for supported_field in self._requested_supported_fields:
+            field_value = self._get_field(
+                block_key,
+                supported_field.transformer,
+                supported_field.block_field_name,
+                supported_field.default_value,
+            )
+            if field_value is not None:
+                # only return fields that have data
+                data[supported_field.serializer_field_name] = field_value
 
         if 'children' in self.context['requested_fields']:
             children = self.context['block_structure'].get_children(block_key)
@@ -90,7 +143,50 @@ class BlockDictSerializer(serializers.Serializer):  # pylint: disable=abstract-m
         """
         Serialize to a dictionary of blocks keyed by the block's usage_key.
         """
+        # A single serializer is shared by all the blocks, so that its URL templates are reused.
+        block_serializer = BlockSerializer(context=self.context)
         return {
-            unicode(block_key): BlockSerializer(block_key, context=self.context).data
+            unicode(block_key): block_serializer.to_representation(block_key)
             for block_key in structure
         }
+
+
+def iter_blocks_json(block_structure, context, return_type='dict'):
+    """
+    Encode the blocks of block_structure as JSON, in the format that
+    BlockDictSerializer (return_type 'dict') or BlockSerializer (return_type
+    'list') would return them in.
+
+    Yields the JSON a few blocks at a time, so that the response can be
+    streamed to the client without holding all the serialized blocks in memory.
+    """
+    block_serializer = BlockSerializer(context=context)
+    encoder = JSONEncoder()
+
+    def encode_block(block_key):
+        """
+        Encode a single block, as a dict item or as a list element.
+        """
+        encoded_block = encoder.encode(block_serializer.to_representation(block_key))
+        if return_type == 'dict':
+            return u'{}: {}'.format(encoder.encode(unicode(block_key)), encoded_block)
+        return encoded_block
+
+    if return_type == 'dict':
+        yield u'{{"root": {}, "blocks": {{'.format(encoder.encode(unicode(block_structure.root_block_usage_key)))
+        closing = u'}}'
+    else:
+        yield u'['
+        closing = u']'
+
+    chunk = []
+    separator = u''
+    for block_key in block_structure:
+        chunk.append(encode_block(block_key))
+        if len(chunk) == BLOCKS_PER_JSON_CHUNK:
+            yield separator + u', '.join(chunk)
+            separator = u', '
+            chunk = []
+    if chunk:
+        yield separator + u', '.join(chunk)
+    yield closing
@@ -1,7 +1,11 @@
 """
 Tests for Course Blocks serializers
 """
+import json
+
+from django.test.client import RequestFactory
 from mock import MagicMock
+from rest_framework.utils.encoders import JSONEncoder
 
 from lms.djangoapps.course_blocks.api import COURSE_BLOCK_ACCESS_TRANSFORMERS, get_course_blocks
 from openedx.core.djangoapps.content.block_structure.transformers import BlockStructureTransformers
@@ -11,7 +15,7 @@ from xmodule.modulestore import ModuleStoreEnum
 from xmodule.modulestore.tests.django_utils import SharedModuleStoreTestCase
 from xmodule.modulestore.tests.factories import ToyCourseFactory
 
-from ..serializers import BlockDictSerializer, BlockSerializer
+from ..serializers import BlockDictSerializer, BlockSerializer, iter_blocks_json
 from ..transformers.blocks_api import BlocksAPITransformer
 from .helpers import deserialize_usage_key
 
@@ -231,3 +235,26 @@ class TestBlockDictSerializer(TestBlockSerializerBase):
             self.assert_extended_block(serialized_block)
             self.assert_staff_fields(serialized_block)
         self.assertEquals(len(serializer.data['blocks']), 29)
+
+
+class TestIterBlocksJson(TestBlockSerializerBase):
+    """
+    Tests iter_blocks_json, which streams the JSON encoding of the blocks.
+    """
+    def setUp(self):
+        super(TestIterBlocksJson, self).setUp()
+        self.serializer_context['request'] = RequestFactory().get('/')
+        self.add_additional_requested_fields()
+
+    def test_dict(self):
+        streamed = json.loads(u''.join(iter_blocks_json(self.block_structure, self.serializer_context)))
+        serializer = BlockDictSerializer(self.block_structure, many=False, context=self.serializer_context)
+        self.assertEquals(streamed, json.loads(json.dumps(serializer.data, cls=JSONEncoder)))
+
+    def test_list(self):
+        streamed = json.loads(u''.join(iter_blocks_json(self.block_structure, self.serializer_context, 'list')))
+        serializer = BlockSerializer(self.block_structure, many=True, context=self.serializer_context)
+        self.assertEquals(streamed, json.loads(json.dumps(serializer.data, cls=JSONEncoder)))
+        for serialized_block in streamed:
+            self.assertIn('/jump_to/', serialized_block['lms_web_url'])
+            self.assertTrue(serialized_block['student_view_url'].endswith(serialized_block['id']))
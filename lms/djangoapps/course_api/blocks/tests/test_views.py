@@ -1,6 +1,7 @@
 """
 Tests for Blocks Views
 """
+import json
 from datetime import datetime
 from string import join
 from urllib import urlencode
@@ -14,6 +15,7 @@ from student.tests.factories import AdminFactory, CourseEnrollmentFactory, UserF
 from xmodule.modulestore.tests.django_utils import SharedModuleStoreTestCase
 from xmodule.modulestore.tests.factories import ToyCourseFactory
 
+from ..views import STREAM_BLOCKS_RESPONSE
 from .helpers import deserialize_usage_key
 
 
@@ -188,6 +190,13 @@ class TestBlocksView(SharedModuleStoreTestCase):
             self.assertEquals(block_data['type'], block_key.block_type)
             self.assertEquals(block_data['display_name'], self.store.get_item(block_key).display_name or '')
 
+    def test_streamed_response(self):
+        expected_data = json.loads(self.verify_response().content)
+        with STREAM_BLOCKS_RESPONSE.override(active=True):
+            response = self.verify_response()
+        self.assertTrue(response.streaming)
+        self.assertEquals(json.loads(''.join(response.streaming_content)), expected_data)
+
     def test_return_type_param(self):
         response = self.verify_response(params={'return_type': 'list'})
         self.verify_response_block_list(response)
@@ -4,6 +4,8 @@ Block Completion Transformer
 
 from xblock.completable import XBlockCompletionMode as CompletionMode
 
+from lms.djangoapps.completion import waffle
+from lms.djangoapps.completion.aggregator import get_course_completion_aggregate
 from lms.djangoapps.completion.models import BlockCompletion
 from openedx.core.djangoapps.content.block_structure.transformer import BlockStructureTransformer
 
@@ -60,18 +62,21 @@ class BlockCompletionTransformer(BlockStructureTransformer):
 
             return completion_mode in (CompletionMode.AGGREGATOR, CompletionMode.EXCLUDED)
 
-        completions = BlockCompletion.objects.filter(
-            user=usage_info.user,
-            course_key=usage_info.course_key,
-        ).values_list(
-            'block_key',
-            'completion',
-        )
+        if waffle.waffle().is_enabled(waffle.ENABLE_COMPLETION_AGGREGATION):
+            completions_dict = get_course_completion_aggregate(usage_info.user, usage_info.course_key).completions
+        else:
+            completions = BlockCompletion.objects.filter(
+                user=usage_info.user,
+                course_key=usage_info.course_key,
+            ).values_list(
+                'block_key',
+                'completion',
+            )
 
-        completions_dict = {
-            block.map_into_course(usage_info.course_key): completion
-            for block, completion in completions
-        }
+            completions_dict = {
+                block.map_into_course(usage_info.course_key): completion
+                for block, completion in completions
+            }
 
         for block_key in block_structure.topological_traversal():
             if _is_block_an_aggregator_or_excluded(block_key):
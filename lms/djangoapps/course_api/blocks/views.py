@@ -2,13 +2,14 @@
 CourseBlocks API views
 """
 from django.core.exceptions import ValidationError
-from django.http import Http404
+from django.http import Http404, StreamingHttpResponse
 from opaque_keys import InvalidKeyError
 from opaque_keys.edx.keys import CourseKey
 from rest_framework.generics import ListAPIView
 from rest_framework.response import Response
 from six import text_type
 
+from openedx.core.djangoapps.waffle_utils import WaffleSwitch, WaffleSwitchNamespace
 from openedx.core.lib.api.view_utils import DeveloperErrorViewMixin, view_auth_classes
 from xmodule.modulestore.django import modulestore
 from xmodule.modulestore.exceptions import ItemNotFoundError
@@ -16,6 +17,11 @@ from xmodule.modulestore.exceptions import ItemNotFoundError
 from .api import get_blocks
 from .forms import BlockListGetForm
 
+# Full name: course_api.stream_blocks_response
+# Stream the JSON responses of the blocks API to the client a few blocks at a time,
+# rather than building and rendering the whole response in memory.
+STREAM_BLOCKS_RESPONSE = WaffleSwitch(WaffleSwitchNamespace(name=u'course_api'), u'stream_blocks_response')
+
 
 @view_auth_classes()
 class BlocksView(DeveloperErrorViewMixin, ListAPIView):
@@ -200,24 +206,30 @@ class BlocksView(DeveloperErrorViewMixin, ListAPIView):
         if not params.is_valid():
             raise ValidationError(params.errors)
 
+        # Only JSON responses can be streamed; other formats, such as the browsable API, are rendered as a whole.
+        stream = STREAM_BLOCKS_RESPONSE.is_enabled() and request.accepted_renderer.format == 'json'
+
         try:
-            return Response(
-                get_blocks(
-                    request,
-                    params.cleaned_data['usage_key'],
-                    params.cleaned_data['user'],
-                    params.cleaned_data['depth'],
-                    params.cleaned_data.get('nav_depth'),
-                    params.cleaned_data['requested_fields'],
-                    params.cleaned_data.get('block_counts', []),
-                    params.cleaned_data.get('student_view_data', []),
-                    params.cleaned_data['return_type'],
-                    params.cleaned_data.get('block_types_filter', None),
-                )
+            blocks = get_blocks(
+                request,
+                params.cleaned_data['usage_key'],
+                params.cleaned_data['user'],
+                params.cleaned_data['depth'],
+                params.cleaned_data.get('nav_depth'),
+                params.cleaned_data['requested_fields'],
+                params.cleaned_data.get('block_counts', []),
+                params.cleaned_data.get('student_view_data', []),
+                params.cleaned_data['return_type'],
+                params.cleaned_data.get('block_types_filter', None),
+                stream=stream,
             )
         except ItemNotFoundError as exception:
             raise Http404("Block not found: {}".format(text_type(exception)))
 
+        if stream:
+            return StreamingHttpResponse(blocks, content_type='application/json')
+        return Response(blocks)
+
 
 @view_auth_classes()
 class BlocksInCourseView(BlocksView):
@@ -381,7 +381,7 @@ class CertificateAvailableDate(DateSummary):
             )
 
 
-def verified_upgrade_deadline_link(user, course=None, course_id=None):
+def verified_upgrade_deadline_link(user, course=None, course_id=None, verified_mode=None):
     """
     Format the correct verified upgrade link for the specified ``user``
     in a course.
@@ -394,6 +394,8 @@ def verified_upgrade_deadline_link(user, course=None, course_id=None):
             the link for.
         course (:class:`.CourseOverview`): The course to render a link for.
         course_id (:class:`.CourseKey`): The course_id of the course to render for.
+        verified_mode (:class:`.Mode`): The verified mode of the course, if it
+            has already been loaded. Otherwise it is looked up.
 
     Returns:
         The formatted link that will allow the user to upgrade to verified
@@ -404,7 +406,7 @@ def verified_upgrade_deadline_link(user, course=None, course_id=None):
 
     ecommerce_service = EcommerceService()
     if ecommerce_service.is_enabled(user):
-        course_mode = CourseMode.verified_mode_for_course(course_id)
+        course_mode = verified_mode or CourseMode.verified_mode_for_course(course_id)
         if course_mode is not None:
             return ecommerce_service.get_checkout_page_url(course_mode.sku)
         else:
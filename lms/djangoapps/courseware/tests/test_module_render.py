@@ -49,6 +49,7 @@ from courseware.tests.tests import LoginEnrollmentTestCase
 from lms.djangoapps.completion.models import BlockCompletion
 from lms.djangoapps.completion import waffle as completion_waffle
 from lms.djangoapps.lms_xblock.field_data import LmsFieldData
+from lms.djangoapps.lms_xblock.fragment_cache import CACHE_USER_INDEPENDENT_FRAGMENTS
 from openedx.core.djangoapps.credit.api import set_credit_requirement_status, set_credit_requirements
 from openedx.core.djangoapps.credit.models import CreditCourse
 from openedx.core.lib.courses import course_image_url
@@ -1296,6 +1297,65 @@ class TestGatedSubsectionRendering(SharedModuleStoreTestCase, MilestonesTestCase
         self.assertIsNone(actual['next_of_active_section'])
 
 
+@attr(shard=1)
+@patch('xmodule.html_module.HtmlModule.get_html', autospec=True, return_value=u'<p>Content</p>')
+class TestUserIndependentFragmentCache(ModuleStoreTestCase):
+    """
+    Tests that the views of user-independent blocks are shared between users.
+    """
+    ENABLED_CACHES = ['default']
+
+    def setUp(self):
+        super(TestUserIndependentFragmentCache, self).setUp()
+        self.course = CourseFactory.create(default_store=ModuleStoreEnum.Type.split)
+        self.users = [UserFactory.create() for __ in range(2)]
+
+    def _render(self, html, user):
+        """
+        Render the student view of the html block for the user.
+        """
+        request = RequestFactory().get('/')
+        request.user = user
+        request.session = {}
+        descriptor = self.store.get_item(html.location)
+        field_data_cache = FieldDataCache.cache_for_descriptor_descendents(self.course.id, user, descriptor)
+        module = render.get_module_for_descriptor(user, request, descriptor, field_data_cache, self.course.id)
+        return module.render(STUDENT_VIEW).content
+
+    def _render_for_all_users(self, data):
+        """
+        Render an html block with `data` for all the users.
+        """
+        html = ItemFactory.create(category='html', parent_location=self.course.location, data=data)
+        for user in self.users:
+            self.assertIn(u'<p>Content</p>', self._render(html, user))
+
+    def test_rendered_once(self, mock_get_html):
+        with CACHE_USER_INDEPENDENT_FRAGMENTS.override(active=True):
+            self._render_for_all_users(u'<p>Content</p>')
+        self.assertEqual(mock_get_html.call_count, 1)
+
+    @patch('xmodule.x_module.dog_stats_api')
+    def test_cached_renders_timed(self, mock_dog_stats_api, mock_get_html):
+        with CACHE_USER_INDEPENDENT_FRAGMENTS.override(active=True):
+            self._render_for_all_users(u'<p>Content</p>')
+        self.assertEqual(mock_get_html.call_count, 1)
+        html_render_tags = [
+            call[1]['tags'] for call in mock_dog_stats_api.histogram.call_args_list
+            if u'block_type:html' in call[1]['tags'] and u'action:render' in call[1]['tags']
+        ]
+        self.assertEqual(len(html_render_tags), len(self.users))
+
+    def test_switch_disabled(self, mock_get_html):
+        self._render_for_all_users(u'<p>Content</p>')
+        self.assertEqual(mock_get_html.call_count, len(self.users))
+
+    def test_user_dependent(self, mock_get_html):
+        with CACHE_USER_INDEPENDENT_FRAGMENTS.override(active=True):
+            self._render_for_all_users(u'<p>Content for %%USER_ID%%</p>')
+        self.assertEqual(mock_get_html.call_count, len(self.users))
+
+
 @attr(shard=1)
 @ddt.ddt
 class TestHtmlModifiers(ModuleStoreTestCase):
@@ -9,31 +9,46 @@ from django.conf import settings
 from edxmako.shortcuts import render_to_string
 
 
+def _notes_course_and_user(block):
+    """
+    Returns the course and the user if notes are enabled for the component, None otherwise.
+    """
+    # Import is placed here to avoid model import at project startup.
+    from edxnotes.helpers import is_feature_enabled
+    is_studio = getattr(block.system, "is_author_mode", False)
+    course = block.descriptor.runtime.modulestore.get_course(block.runtime.course_id)
+
+    # Must be disabled when:
+    # - in Studio
+    # - Harvard Annotation Tool is enabled for the course
+    # - the feature flag or `edxnotes` setting of the course is set to False
+    # - the user is not authenticated
+    user = block.runtime.get_real_user(block.runtime.anonymous_student_id)
+
+    if is_studio or not is_feature_enabled(course, user):
+        return None
+    return course, user
+
+
 def edxnotes(cls):
     """
     Decorator that makes components annotatable.
     """
     original_get_html = cls.get_html
+    original_has_support = cls.has_support
 
     def get_html(self, *args, **kwargs):
         """
         Returns raw html for the component.
         """
         # Import is placed here to avoid model import at project startup.
-        from edxnotes.helpers import generate_uid, get_edxnotes_id_token, get_public_endpoint, get_token_url, is_feature_enabled
-        is_studio = getattr(self.system, "is_author_mode", False)
-        course = self.descriptor.runtime.modulestore.get_course(self.runtime.course_id)
-
-        # Must be disabled when:
-        # - in Studio
-        # - Harvard Annotation Tool is enabled for the course
-        # - the feature flag or `edxnotes` setting of the course is set to False
-        # - the user is not authenticated
-        user = self.runtime.get_real_user(self.runtime.anonymous_student_id)
-
-        if is_studio or not is_feature_enabled(course, user):
+        from edxnotes.helpers import generate_uid, get_edxnotes_id_token, get_public_endpoint, get_token_url
+        notes_course_and_user = _notes_course_and_user(self)
+
+        if notes_course_and_user is None:
             return original_get_html(self, *args, **kwargs)
         else:
+            course, user = notes_course_and_user
             return render_to_string("edxnotes_wrapper.html", {
                 "content": original_get_html(self, *args, **kwargs),
                 "uid": generate_uid(),
@@ -52,5 +67,15 @@ def edxnotes(cls):
                 },
             })
 
+    def has_support(self, view, functionality):
+        """
+        Annotatable components include the user's notes token, so they aren't
+        user independent when notes are enabled.
+        """
+        if functionality == 'user_independent' and _notes_course_and_user(self) is not None:
+            return False
+        return original_has_support(self, view, functionality)
+
     cls.get_html = get_html
+    cls.has_support = has_support
     return cls
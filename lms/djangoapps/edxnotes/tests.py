@@ -87,6 +87,12 @@ class TestProblem(object):
         """
         return "original_get_html"
 
+    def has_support(self, view, functionality):  # pylint: disable=unused-argument
+        """
+        Imitate a module whose views are user independent.
+        """
+        return functionality == 'user_independent'
+
 
 @attr(shard=3)
 @skipUnless(settings.FEATURES["ENABLE_EDXNOTES"], "EdxNotes feature needs to be enabled.")
@@ -145,6 +151,20 @@ class EdxNotesDecoratorTest(ModuleStoreTestCase):
             render_to_string("edxnotes_wrapper.html", expected_context),
         )
 
+    @patch.dict("django.conf.settings.FEATURES", {"ENABLE_EDXNOTES": True})
+    def test_user_independent_unless_edxnotes_enabled(self):
+        """
+        Tests that the component is only user independent when it isn't wrapped.
+        """
+        self.course.edxnotes = False
+        self.assertTrue(self.problem.has_support(self.problem.get_html, 'user_independent'))
+
+        self.course.edxnotes = True
+        CourseEnrollmentFactory(course_id=self.course.id, user=self.user)
+        enable_edxnotes_for_the_course(self.course, self.user.id)
+        self.assertFalse(self.problem.has_support(self.problem.get_html, 'user_independent'))
+        self.assertFalse(self.problem.has_support(self.problem.get_html, 'multi_device'))
+
     @patch.dict("django.conf.settings.FEATURES", {"ENABLE_EDXNOTES": True})
     def test_edxnotes_disabled_if_edxnotes_flag_is_false(self):
         """
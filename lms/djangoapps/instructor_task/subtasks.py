@@ -25,6 +25,8 @@ SUBTASK_LOCK_EXPIRE = 60 * 10  # Lock expires in 10 minutes
 # Number of times to retry if a subtask update encounters a lock on the InstructorTask.
 # (These are recursive retries, so don't make this number too large.)
 MAX_DATABASE_LOCK_RETRIES = 5
+# Number of items to fetch with each query when generating the items for subtasks.
+ITEMS_PER_QUERY = 10000
 
 
 def _get_number_of_subtasks(total_num_items, items_per_task):
@@ -43,6 +45,26 @@ def _get_number_of_subtasks(total_num_items, items_per_task):
     return num_subtasks
 
 
+def _iterate_items_by_pk(queryset, item_fields, items_per_query=None):
+    """
+    Yields the values of `item_fields` (which must include 'pk') for each item in the queryset, in order of pk.
+
+    The items are fetched in chunks of `items_per_query`, using the last pk of each chunk as the starting
+    point for the next one, so that neither a huge result set is held open nor an offset scanned past.
+    """
+    items_per_query = items_per_query or ITEMS_PER_QUERY
+    queryset = queryset.order_by('pk').values(*item_fields)
+    last_pk = None
+    while True:
+        chunk_queryset = queryset if last_pk is None else queryset.filter(pk__gt=last_pk)
+        items = list(chunk_queryset[:items_per_query])
+        for item in items:
+            yield item
+        if len(items) < items_per_query:
+            return
+        last_pk = items[-1]['pk']
+
+
 @contextmanager
 def track_memory_usage(metric, course_id):
     """
@@ -99,7 +121,7 @@ def _generate_items_for_subtask(
 
     with track_memory_usage('course_email.subtask_generation.memory', course_id):
         for queryset in item_querysets:
-            for item in queryset.values(*all_item_fields).iterator():
+            for item in _iterate_items_by_pk(queryset, all_item_fields):
                 if len(items_for_task) == items_per_task and num_subtasks < total_num_subtasks - 1:
                     yield items_for_task
                     num_items_queued += items_per_task
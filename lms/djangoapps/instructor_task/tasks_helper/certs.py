@@ -8,11 +8,15 @@ from django.db.models import Q
 
 from lms.djangoapps.certificates.api import generate_user_certificates
 from lms.djangoapps.certificates.models import CertificateStatuses, GeneratedCertificate
+from lms.djangoapps.certificates.queue import XQueueCertInterface
 from student.models import CourseEnrollment
 from xmodule.modulestore.django import modulestore
 
 from .runner import TaskProgress
 
+# Batch size for prefetching the data needed to generate the certificates of students.
+STUDENT_BATCH_SIZE = 100
+
 
 def generate_students_certificates(
         _xmodule_instance_args, _entry_id, course_id, task_input, action_name):
@@ -71,19 +75,30 @@ def generate_students_certificates(
     task_progress.update_task_state(extra_meta=current_step)
 
     course = modulestore().get_course(course_id, depth=0)
-    # Generate certificate for each student
-    for student in students_require_certs:
-        task_progress.attempted += 1
-        status = generate_user_certificates(
-            student,
-            course_id,
-            course=course
-        )
-
-        if CertificateStatuses.is_passing_status(status):
-            task_progress.succeeded += 1
-        else:
-            task_progress.failed += 1
+    # Load the enrollments of the whole course at once, rather than querying
+    # each student's enrollment mode while generating their certificate.
+    CourseEnrollment.get_roster(course_id)
+    # Reuse one connection to the XQueue for every student.
+    xqueue = XQueueCertInterface()
+    students_require_certs = list(students_require_certs)
+    for batch_start in range(0, len(students_require_certs), STUDENT_BATCH_SIZE):
+        students = students_require_certs[batch_start:batch_start + STUDENT_BATCH_SIZE]
+        xqueue.prefetch(course_id, students)
+
+        # Generate certificate for each student
+        for student in students:
+            task_progress.attempted += 1
+            status = generate_user_certificates(
+                student,
+                course_id,
+                course=course,
+                xqueue=xqueue
+            )
+
+            if CertificateStatuses.is_passing_status(status):
+                task_progress.succeeded += 1
+            else:
+                task_progress.failed += 1
 
     return task_progress.update_task_state(extra_meta=current_step)
 
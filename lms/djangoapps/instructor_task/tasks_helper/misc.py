@@ -9,15 +9,13 @@ from datetime import datetime
 from time import time
 
 import unicodecsv
-from django.contrib.auth.models import User
-from django.core.exceptions import ValidationError
 from django.core.files.storage import DefaultStorage
 from openassessment.data import OraAggregateData
 from pytz import UTC
 
 from instructor_analytics.basic import get_proctored_exam_results
 from instructor_analytics.csvs import format_dictlist
-from openedx.core.djangoapps.course_groups.cohorts import add_user_to_cohort
+from openedx.core.djangoapps.course_groups.cohorts import BULK_ASSIGNMENT_BATCH_SIZE, add_users_to_cohort
 from openedx.core.djangoapps.course_groups.models import CourseUserGroup
 from survey.models import SurveyAnswer
 from util.file import UniversalNewlineIterator
@@ -158,6 +156,10 @@ def cohort_students_and_upload(_xmodule_instance_args, _entry_id, course_id, tas
     # users, and a cached reference to the corresponding cohort object
     # to prevent redundant cohort queries.
     cohorts_status = {}
+    # Batches of consecutive rows which add users to the same existing cohort,
+    # as (cohort_name, usernames_or_emails) pairs in the order of the file, so
+    # that a user listed more than once ends up in the cohort of their last row.
+    assignment_batches = []
 
     with DefaultStorage().open(task_input['file_name']) as f:
         for row in unicodecsv.DictReader(UniversalNewlineIterator(f), encoding='utf-8'):
@@ -188,32 +190,33 @@ def cohort_students_and_upload(_xmodule_instance_args, _entry_id, course_id, tas
                 task_progress.failed += 1
                 continue
 
-            try:
-                # If add_user_to_cohort successfully adds a user, a user object is returned.
-                # If a user is preassigned to a cohort, no user object is returned (we already have the email address).
-                (user, previous_cohort, preassigned) = add_user_to_cohort(cohorts_status[cohort_name]['cohort'], username_or_email)
-                if preassigned:
-                    cohorts_status[cohort_name]['Preassigned Learners'].add(username_or_email)
-                    task_progress.preassigned += 1
-                else:
-                    cohorts_status[cohort_name]['Learners Added'] += 1
-                    task_progress.succeeded += 1
-            except User.DoesNotExist:
-                # Raised when a user with the username could not be found, and the email is not valid
-                cohorts_status[cohort_name]['Learners Not Found'].add(username_or_email)
-                task_progress.failed += 1
-            except ValidationError:
-                # Raised when a user with the username could not be found, and the email is not valid,
-                # but the entered string contains an "@"
-                # Since there is no way to know if the entered string is an invalid username or an invalid email,
-                # assume that a string with the "@" symbol in it is an attempt at entering an email
-                cohorts_status[cohort_name]['Invalid Email Addresses'].add(username_or_email)
-                task_progress.failed += 1
-            except ValueError:
-                # Raised when the user is already in the given cohort
-                task_progress.skipped += 1
-
-            task_progress.update_task_state(extra_meta=current_step)
+            if (
+                    assignment_batches and assignment_batches[-1][0] == cohort_name and
+                    len(assignment_batches[-1][1]) < BULK_ASSIGNMENT_BATCH_SIZE
+            ):
+                assignment_batches[-1][1].append(username_or_email)
+            else:
+                assignment_batches.append((cohort_name, [username_or_email]))
+
+    # Add the users to the cohorts in batches, rather than one at a time.
+    for cohort_name, usernames_or_emails in assignment_batches:
+        cohort_status = cohorts_status[cohort_name]
+        results = add_users_to_cohort(cohort_status['cohort'], usernames_or_emails)
+        cohort_status['Learners Added'] += len(results.added)
+        task_progress.succeeded += len(results.added)
+        # Users already in the given cohort are skipped.
+        task_progress.skipped += len(results.present)
+        cohort_status['Preassigned Learners'].update(results.preassigned)
+        task_progress.preassigned += len(results.preassigned)
+        # Usernames that could not be found, or emails that are not valid
+        # and could not be found.  Since there is no way to know if an
+        # entered string with an "@" in it is an invalid username or an
+        # invalid email, it is assumed to be an attempt at entering an email.
+        cohort_status['Learners Not Found'].update(results.not_found)
+        cohort_status['Invalid Email Addresses'].update(results.invalid)
+        task_progress.failed += len(results.not_found) + len(results.invalid)
+
+        task_progress.update_task_state(extra_meta=current_step)
 
     current_step['step'] = 'Uploading CSV'
     task_progress.update_task_state(extra_meta=current_step)
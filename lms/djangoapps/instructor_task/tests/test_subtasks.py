@@ -79,3 +79,19 @@ class TestSubtasks(InstructorTaskCourseTestCase):
         self.assertEqual(len(mock_create_subtask_fcn_args[0][0][0]), 3)
         self.assertEqual(len(mock_create_subtask_fcn_args[1][0][0]), 3)
         self.assertEqual(len(mock_create_subtask_fcn_args[2][0][0]), 5)
+
+    def test_queue_subtasks_for_query_in_chunks(self):
+        """Test queue_subtasks_for_query() when the items are fetched with several queries."""
+
+        mock_create_subtask_fcn = Mock()
+        with patch('lms.djangoapps.instructor_task.subtasks.ITEMS_PER_QUERY', 2):
+            self._queue_subtasks(mock_create_subtask_fcn, 3, 7, 0)
+
+        # Each item is queued exactly once, in order of pk
+        queued_pks = [
+            item['pk']
+            for call_args in mock_create_subtask_fcn.call_args_list
+            for item in call_args[0][0]
+        ]
+        self.assertEqual(queued_pks, sorted(set(queued_pks)))
+        self.assertEqual(len(queued_pks), CourseEnrollment.objects.filter(course_id=self.course.id).count())
@@ -18,7 +18,8 @@ import ddt
 import unicodecsv
 from django.conf import settings
 from django.core.urlresolvers import reverse
-from django.test.utils import override_settings
+from django.db import connection
+from django.test.utils import CaptureQueriesContext, override_settings
 from freezegun import freeze_time
 from mock import MagicMock, Mock, patch
 from nose.plugins.attrib import attr
@@ -1707,6 +1708,23 @@ class TestCohortStudents(TestReportMixin, InstructorTaskCourseTestCase):
             verify_order=False
         )
 
+    def test_last_row_of_user_wins(self):
+        self._cohort_students_and_upload(
+            u'username,email,cohort\n'
+            u'student_1\xec,,Cohort 1\n'
+            u'student_2,,Cohort 2\n'
+            u'student_2,,Cohort 1\n'
+            u'student_1\xec,,Cohort 2'
+        )
+        self.assertEqual(
+            CohortMembership.objects.get(user=self.student_1, course_id=self.course.id).course_user_group,
+            self.cohort_2
+        )
+        self.assertEqual(
+            CohortMembership.objects.get(user=self.student_2, course_id=self.course.id).course_user_group,
+            self.cohort_1
+        )
+
 
 @ddt.ddt
 @patch('lms.djangoapps.instructor_task.tasks_helper.misc.DefaultStorage', new=MockDefaultStorage)
@@ -1990,9 +2008,15 @@ class TestCertificateGeneration(InstructorTaskModuleTestCase):
             'failed': 3,
             'skipped': 2
         }
-        with self.assertNumQueries(106):
+        with self.assertNumQueries(83), CaptureQueriesContext(connection) as queries:
             self.assertCertificatesGenerated(task_input, expected_results)
 
+        # The whitelist entries and ID verifications of all of the students are
+        # prefetched together, rather than queried for each student.
+        for table in ('certificates_certificatewhitelist', 'verify_student_softwaresecurephotoverification'):
+            table_queries = [query for query in queries.captured_queries if table in query['sql']]
+            self.assertEqual(len(table_queries), 1)
+
         expected_results = {
             'action_name': 'certificates generated',
             'total': 10,
@@ -0,0 +1,105 @@
+"""
+Cache of the rendered views of user-independent XBlocks.
+
+An XBlock opts in by declaring that a view supports the "user_independent"
+functionality, either with ``@XBlock.supports("user_independent")`` or by
+overriding ``has_support``. Such a view must return the same fragment for every
+learner, so its output is cached, before the runtime's wrappers are applied,
+keyed by the block's usage key, the version of the course structure it was
+loaded from, the active language and the current theme.
+
+Publishing a course creates a new structure version, so stale fragments are
+never served; they simply age out of the cache. Blocks loaded without a
+structure version (i.e. from Old Mongo courses) are not cached.
+"""
+import hashlib
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils import translation
+from web_fragments.fragment import Fragment
+
+from openedx.core.djangoapps import monitoring_utils
+from openedx.core.djangoapps.theming.helpers import get_current_theme
+from openedx.core.djangoapps.waffle_utils import WaffleSwitch, WaffleSwitchNamespace
+
+USER_INDEPENDENT = 'user_independent'
+
+# Switch to enable the cache of user-independent fragments.
+CACHE_USER_INDEPENDENT_FRAGMENTS = WaffleSwitch(
+    WaffleSwitchNamespace(name=u'lms_xblock'), u'cache_user_independent_fragments'
+)
+
+FRAGMENT_CACHE_KEY_PREFIX = u'lms_xblock.fragment'
+
+
+def _get_setting(name):
+    """
+    Return the fragment cache setting `name`.
+    """
+    return settings.XBLOCK_FRAGMENT_CACHE[name]
+
+
+def _course_version(block):
+    """
+    Return the version of the course structure `block` was loaded from, if known.
+    """
+    # XModules are bound to the descriptor that was loaded from the modulestore.
+    descriptor = getattr(block, 'descriptor', block)
+    return getattr(descriptor, 'course_version', None)
+
+
+def get_cache_key(block, view_name):
+    """
+    Return the key the output of `view_name` on `block` is cached under,
+    or None if that output can't be cached.
+    """
+    if not CACHE_USER_INDEPENDENT_FRAGMENTS.is_enabled():
+        return None
+
+    # Children may be rendered differently for each learner.
+    if block.has_children:
+        return None
+
+    view = getattr(block, view_name, None)
+    if view is None or not block.has_support(view, USER_INDEPENDENT):
+        return None
+
+    course_version = _course_version(block)
+    if course_version is None:
+        return None
+
+    theme = get_current_theme()
+    key_parts = (
+        block.scope_ids.usage_id,
+        view_name,
+        course_version,
+        translation.get_language(),
+        theme.theme_dir_name if theme else None,
+    )
+    key_hash = hashlib.sha1(u'|'.join(unicode(part) for part in key_parts).encode('utf-8'))
+    return u'{}.{}'.format(FRAGMENT_CACHE_KEY_PREFIX, key_hash.hexdigest())
+
+
+def get_fragment(cache_key):
+    """
+    Return the fragment cached under `cache_key`, or None.
+    """
+    fragment_dict = cache.get(cache_key)
+    if fragment_dict is None:
+        monitoring_utils.increment('xblock_fragment_cache.miss')
+        return None
+
+    monitoring_utils.increment('xblock_fragment_cache.hit')
+    return Fragment.from_dict(fragment_dict)
+
+
+def set_fragment(cache_key, fragment):
+    """
+    Cache `fragment` under `cache_key`, unless it is too large.
+    """
+    if len(fragment.content) > _get_setting('MAX_CONTENT_LENGTH'):
+        monitoring_utils.increment('xblock_fragment_cache.too_large')
+        return
+
+    cache.set(cache_key, fragment.to_dict(), _get_setting('TIMEOUT'))
@@ -7,6 +7,7 @@ from django.core.urlresolvers import reverse
 
 from badges.service import BadgingService
 from badges.utils import badges_enabled
+from lms.djangoapps.lms_xblock import fragment_cache
 from lms.djangoapps.lms_xblock.models import XBlockAsidesConfig
 from lms.djangoapps.completion.services import CompletionService
 from openedx.core.djangoapps.user_api.course_tag import api as user_course_tag_api
@@ -176,6 +177,34 @@ class LmsModuleSystem(ModuleSystem):  # pylint: disable=abstract-method
     def local_resource_url(self, *args, **kwargs):
         return local_resource_url(*args, **kwargs)
 
+    def render(self, block, view_name, context=None):
+        """
+        Render `view_name` on `block`, serving the views of user-independent
+        blocks from the fragment cache. See :mod:`lms.djangoapps.lms_xblock.fragment_cache`.
+
+        The runtime's wrappers and asides are applied to cached fragments on every render.
+        """
+        cache_key = fragment_cache.get_cache_key(block, view_name)
+        if cache_key is None:
+            return super(LmsModuleSystem, self).render(block, view_name, context=context)
+
+        # Mirrors xblock.runtime.Runtime.render, which would wrap the fragment
+        # before it could be cached, within the timing of MetricsMixin.render.
+        with self.render_metrics(block, view_name):
+            old_view_name = self._view_name
+            self._view_name = view_name
+            try:
+                frag = fragment_cache.get_fragment(cache_key)
+                if frag is None:
+                    frag = getattr(block, view_name)(context)
+                    block.save()
+                    fragment_cache.set_fragment(cache_key, frag)
+
+                frag = self.wrap_xblock(block, view_name, frag, context)
+                return self.render_asides(block, view_name, frag, context)
+            finally:
+                self._view_name = old_view_name
+
     def wrap_aside(self, block, aside, view, frag, context):
         """
         Creates a div which identifies the aside, points to the original block,
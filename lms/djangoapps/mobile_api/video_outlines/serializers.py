@@ -1,6 +1,7 @@
 """
 Serializer for video outline
 """
+from django.conf import settings
 from edxval.api import ValInternalError, get_video_info_for_course_and_profiles
 from rest_framework.reverse import reverse
 
@@ -10,8 +11,22 @@ from courseware.model_data import FieldDataCache
 from courseware.module_render import get_module_for_descriptor
 from util.module_utils import get_dynamic_descriptor_children
 from xmodule.modulestore.django import modulestore
+from xmodule.block_metadata_utils import display_name_with_default_escaped
 from xmodule.modulestore.mongo.base import BLOCK_TYPES_WITH_CHILDREN
 from xmodule.video_module.transcripts_model_utils import is_val_transcript_feature_enabled_for_course
+from xmodule.video_module.transcripts_utils import NON_EXISTENT_TRANSCRIPT, get_available_transcript_languages
+
+from .transformers import VideoOutlineTransformer
+
+
+def _get_course_videos(course_id, video_profiles):
+    """
+    Returns the VAL data for all the videos in the course, keyed by edx_video_id.
+    """
+    try:
+        return get_video_info_for_course_and_profiles(unicode(course_id), video_profiles)
+    except ValInternalError:  # pragma: nocover
+        return {}
 
 
 class BlockOutline(object):
@@ -24,13 +39,7 @@ class BlockOutline(object):
         self.block_types = block_types
         self.course_id = course_id
         self.request = request  # needed for making full URLS
-        self.local_cache = {}
-        try:
-            self.local_cache['course_videos'] = get_video_info_for_course_and_profiles(
-                unicode(course_id), video_profiles
-            )
-        except ValInternalError:  # pragma: nocover
-            self.local_cache['course_videos'] = {}
+        self.local_cache = {'course_videos': _get_course_videos(course_id, video_profiles)}
 
     def __iter__(self):
         def parent_or_requested_block_type(usage_key):
@@ -97,6 +106,69 @@ class BlockOutline(object):
                         child_to_parent[block] = curr_block
 
 
+class BlockStructureOutline(object):
+    """
+    Serializes course videos, pulling data from VAL and the course's block
+    structure, which must have been transformed by the
+    VideoOutlineTransformer (and the access transformers) for the user.
+    """
+    def __init__(self, course_id, block_structure, block_types, request, video_profiles):
+        """Create a BlockStructureOutline starting at the root of `block_structure`."""
+        self.block_structure = block_structure
+        self.block_types = block_types
+        self.course_id = course_id
+        self.request = request  # needed for making full URLS
+        self.local_cache = {'course_videos': _get_course_videos(course_id, video_profiles)}
+
+    def __iter__(self):
+        root_block_key = self.block_structure.root_block_usage_key
+        child_to_parent = {}
+        stack = [root_block_key]
+        while stack:
+            block_key = stack.pop()
+
+            if block_key.block_type in self.block_types:
+                block_path = [
+                    {
+                        # to be consistent with other edx-platform clients, return the defaulted display name
+                        'name': display_name_with_default_escaped(self.block_structure[ancestor_key]),
+                        'category': ancestor_key.block_type,
+                        'id': unicode(ancestor_key),
+                    }
+                    for ancestor_key in _ancestors(block_key, child_to_parent)[1:]
+                ]
+                unit_url, section_url = find_block_structure_urls(
+                    self.course_id, block_key, child_to_parent, self.block_structure, self.request
+                )
+
+                yield {
+                    "path": block_path,
+                    "named_path": [b["name"] for b in block_path],
+                    "unit_url": unit_url,
+                    "section_url": section_url,
+                    "summary": self.block_types[block_key.block_type](
+                        self.course_id, self.block_structure, block_key, self.request, self.local_cache
+                    ),
+                }
+
+            children = self.block_structure.get_children(block_key)
+            for child_key in reversed(children):
+                if child_key.block_type in self.block_types or child_key.block_type in BLOCK_TYPES_WITH_CHILDREN:
+                    stack.append(child_key)
+                    child_to_parent[child_key] = block_key
+
+
+def _ancestors(block_key, child_to_parent):
+    """
+    Returns the ancestors of a block, starting with the root of the outline.
+    """
+    ancestors = []
+    while block_key in child_to_parent:
+        block_key = child_to_parent[block_key]
+        ancestors.append(block_key)
+    return list(reversed(ancestors))
+
+
 def path(block, child_to_parent, start_block):
     """path for block"""
     block_path = []
@@ -141,17 +213,49 @@ def find_urls(course_id, block, child_to_parent, request):
                 break
             position += 1
 
+    return _courseware_urls(course_id, chapter_id, section.url_name if section else None, position, request)
+
+
+def find_block_structure_urls(course_id, block_key, child_to_parent, block_structure, request):
+    """
+    Find the section and unit urls for a block of a block structure.
+
+    Returns:
+        unit_url, section_url:
+            unit_url (str): The url of a unit
+            section_url (str): The url of a section
+
+    """
+    block_list = _ancestors(block_key, child_to_parent)
+    block_count = len(block_list)
+
+    chapter_id = block_list[1].block_id if block_count > 1 else None
+    section_key = block_list[2] if block_count > 2 else None
+    position = None
+
+    if block_count > 3:
+        position = block_structure.get_children(section_key).index(block_list[3]) + 1
+
+    return _courseware_urls(
+        course_id, chapter_id, section_key.block_id if section_key else None, position, request
+    )
+
+
+def _courseware_urls(course_id, chapter_id, section_url_name, position, request):
+    """
+    Returns the unit and section urls for the given position in the courseware.
+    """
     kwargs = {'course_id': unicode(course_id)}
     if chapter_id is None:
         course_url = reverse("courseware", kwargs=kwargs, request=request)
         return course_url, course_url
 
     kwargs['chapter'] = chapter_id
-    if section is None:
+    if section_url_name is None:
         chapter_url = reverse("courseware_chapter", kwargs=kwargs, request=request)
         return chapter_url, chapter_url
 
-    kwargs['section'] = section.url_name
+    kwargs['section'] = section_url_name
     section_url = reverse("courseware_section", kwargs=kwargs, request=request)
     if position is None:
         return section_url, section_url
@@ -165,16 +269,112 @@ def video_summary(video_profiles, course_id, video_descriptor, request, local_ca
     """
     returns summary dict for the given video module
     """
+    def get_transcripts():
+        """
+        Returns the available transcript languages and the default transcript language of the video.
+        """
+        feature_enabled = is_val_transcript_feature_enabled_for_course(course_id)
+        transcripts_info = video_descriptor.get_transcripts_info(include_val_transcripts=feature_enabled)
+        transcript_langs = video_descriptor.available_translations(
+            transcripts=transcripts_info,
+            include_val_transcripts=feature_enabled
+        )
+        return transcript_langs, video_descriptor.get_default_transcript_language(transcripts_info)
+
+    return _video_summary(video_profiles, course_id, video_descriptor, get_transcripts, request, local_cache)
+
+
+def block_structure_video_summary(video_profiles, course_id, block_structure, video_key, request, local_cache):
+    """
+    returns summary dict for the given video block of a block structure
+    transformed by the VideoOutlineTransformer
+    """
+    video = block_structure[video_key]
+
+    def get_transcripts():
+        """
+        Returns the available transcript languages and the default transcript language of the video.
+        """
+        transcripts_info = block_structure.get_transformer_block_field(
+            video_key, VideoOutlineTransformer, VideoOutlineTransformer.TRANSCRIPTS_INFO
+        )
+        transcript_langs = block_structure.get_transformer_block_field(
+            video_key, VideoOutlineTransformer, VideoOutlineTransformer.TRANSCRIPT_LANGUAGES
+        )
+        if is_val_transcript_feature_enabled_for_course(course_id):
+            transcripts_info, transcript_langs = _add_val_transcripts(video, transcripts_info, transcript_langs)
+
+        return transcript_langs, _default_transcript_language(video.transcript_language, transcripts_info)
+
+    return _video_summary(video_profiles, course_id, video, get_transcripts, request, local_cache)
+
+
+def _add_val_transcripts(video, transcripts_info, transcript_langs):
+    """
+    Adds the video's edx-val transcripts to its collected transcripts info
+    and languages, as VideoDescriptor.get_transcripts_info and
+    VideoDescriptor.available_translations do when edx-val transcripts are
+    included.
+    """
+    val_langs = get_available_transcript_languages(
+        edx_video_id=video.edx_video_id,
+        youtube_id_1_0=video.youtube_id_1_0,
+        html5_sources=video.html5_sources,
+    )
+    if not val_langs:
+        return transcripts_info, transcript_langs
+
+    sub, other_langs = transcripts_info['sub'], dict(transcripts_info['transcripts'])
+    for lang in val_langs:
+        if lang == 'en' and not sub:
+            sub = NON_EXISTENT_TRANSCRIPT
+        elif not other_langs.get(lang):
+            other_langs[lang] = NON_EXISTENT_TRANSCRIPT
+
+    if settings.FEATURES.get('FALLBACK_TO_ENGLISH_TRANSCRIPTS'):
+        # The transcripts aren't verified to exist, so the languages are just those of the transcripts info.
+        transcript_langs = list(other_langs)
+        if not transcript_langs or sub:
+            transcript_langs.append('en')
+    else:
+        transcript_langs = list(set(transcript_langs) | set(val_langs))
+
+    return {'sub': sub, 'transcripts': other_langs}, transcript_langs
+
+
+def _default_transcript_language(transcript_language, transcripts_info):
+    """
+    Returns the default transcript language of a video, as
+    VideoDescriptor.get_default_transcript_language does.
+    """
+    sub, other_langs = transcripts_info['sub'], transcripts_info['transcripts']
+    if transcript_language in other_langs:
+        return transcript_language
+    elif sub:
+        return u'en'
+    elif len(other_langs) > 0:
+        return sorted(other_langs)[0]
+    return u'en'
+
+
+def _video_summary(video_profiles, course_id, video, get_transcripts, request, local_cache):
+    """
+    returns summary dict for the given video, which may be a video module or
+    the collected data of a video block
+
+    `get_transcripts` returns the video's available transcript languages and
+    its default transcript language.
+    """
     always_available_data = {
-        "name": video_descriptor.display_name,
-        "category": video_descriptor.category,
-        "id": unicode(video_descriptor.scope_ids.usage_id),
-        "only_on_web": video_descriptor.only_on_web,
+        "name": video.display_name,
+        "category": video.category,
+        "id": unicode(video.location),
+        "only_on_web": video.only_on_web,
     }
 
     all_sources = []
 
-    if video_descriptor.only_on_web:
+    if video.only_on_web:
         ret = {
             "video_url": None,
             "video_thumbnail_url": None,
@@ -188,7 +388,7 @@ def video_summary(video_profiles, course_id, video_descriptor, request, local_ca
         return ret
 
     # Get encoded videos
-    video_data = local_cache['course_videos'].get(video_descriptor.edx_video_id, {})
+    video_data = local_cache['course_videos'].get(video.edx_video_id, {})
 
     # Get highest priority video to populate backwards compatible field
     default_encoded_video = {}
@@ -202,33 +402,28 @@ def video_summary(video_profiles, course_id, video_descriptor, request, local_ca
     if default_encoded_video:
         video_url = default_encoded_video['url']
     # Then fall back to VideoDescriptor fields for video URLs
-    elif video_descriptor.html5_sources:
-        video_url = video_descriptor.html5_sources[0]
-        all_sources = video_descriptor.html5_sources
+    elif video.html5_sources:
+        video_url = video.html5_sources[0]
+        all_sources = list(video.html5_sources)
     else:
-        video_url = video_descriptor.source
+        video_url = video.source
 
-    if video_descriptor.source:
-        all_sources.append(video_descriptor.source)
+    if video.source:
+        all_sources.append(video.source)
 
     # Get duration/size, else default
     duration = video_data.get('duration', None)
     size = default_encoded_video.get('file_size', 0)
 
     # Transcripts...
-    feature_enabled = is_val_transcript_feature_enabled_for_course(course_id)
-    transcripts_info = video_descriptor.get_transcripts_info(include_val_transcripts=feature_enabled)
-    transcript_langs = video_descriptor.available_translations(
-        transcripts=transcripts_info,
-        include_val_transcripts=feature_enabled
-    )
+    transcript_langs, language = get_transcripts()
 
     transcripts = {
         lang: reverse(
             'video-transcripts-detail',
             kwargs={
                 'course_id': unicode(course_id),
-                'block_id': video_descriptor.scope_ids.usage_id.block_id,
+                'block_id': video.location.block_id,
                 'lang': lang
             },
             request=request,
@@ -242,7 +437,7 @@ def video_summary(video_profiles, course_id, video_descriptor, request, local_ca
         "duration": duration,
         "size": size,
         "transcripts": transcripts,
-        "language": video_descriptor.get_default_transcript_language(transcripts_info),
+        "language": language,
         "encoded_videos": video_data.get('profiles'),
         "all_sources": all_sources,
     }
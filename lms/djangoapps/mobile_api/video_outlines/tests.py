@@ -15,6 +15,7 @@ from edxval import api
 from milestones.tests.utils import MilestonesTestCaseMixin
 from mock import patch
 from nose.plugins.attrib import attr
+from waffle.testutils import override_switch
 
 from mobile_api.models import MobileApiConfig
 from mobile_api.testutils import MobileAPITestCase, MobileAuthTestMixin, MobileCourseAccessTestMixin
@@ -944,6 +945,16 @@ class TestVideoSummaryList(TestVideoAPITestCase, MobileAuthTestMixin, MobileCour
         self.assertItemsEqual(course_outline[0]['summary']['transcripts'].keys(), expected_transcripts)
 
 
+@attr(shard=2)
+@override_switch('mobile_api.video_outline_from_block_structure', True)
+class TestVideoSummaryListFromBlockStructure(TestVideoSummaryList):  # pylint: disable=test-inherits-tests
+    """
+    Tests for /api/mobile/v0.5/video_outlines/courses/{course_id}.. when the
+    outline is served from the course's block structure.
+    """
+    pass
+
+
 @attr(shard=2)
 class TestTranscriptsDetail(TestVideoAPITestCase, MobileAuthTestMixin, MobileCourseAccessTestMixin,
                             TestVideoAPIMixin, MilestonesTestCaseMixin):
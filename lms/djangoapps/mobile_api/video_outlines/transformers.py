@@ -0,0 +1,76 @@
+"""
+Video Outline Transformer
+"""
+from openedx.core.djangoapps.content.block_structure.transformer import BlockStructureTransformer
+
+
+class VideoOutlineTransformer(BlockStructureTransformer):
+    """
+    Collects the video data needed by the mobile video outline, so that the
+    outline can be served from the course's cached block structure rather
+    than by binding a module for each block, and removes the blocks which
+    the outline does not navigate into.
+    """
+    WRITE_VERSION = 1
+    READ_VERSION = 1
+    TRANSCRIPTS_INFO = 'transcripts_info'
+    TRANSCRIPT_LANGUAGES = 'transcript_languages'
+
+    @classmethod
+    def name(cls):
+        return "mobile_api:video_outline"
+
+    @classmethod
+    def collect(cls, block_structure):
+        """
+        Collect the fields of each video that the video summary needs, along
+        with its transcripts and the languages they are available in.
+
+        The transcripts stored in edx-val are not collected, since they can
+        change without the course being published.
+        """
+        block_structure.request_xblock_fields(
+            'category',
+            'display_name',
+            'hide_from_toc',
+            'only_on_web',
+            'edx_video_id',
+            'html5_sources',
+            'source',
+            'youtube_id_1_0',
+            'transcript_language',
+        )
+
+        for block_key in block_structure.topological_traversal():
+            if block_key.block_type != 'video':
+                continue
+
+            block = block_structure.get_xblock(block_key)
+            transcripts_info = block.get_transcripts_info()
+            block_structure.set_transformer_block_field(
+                block_key,
+                cls,
+                cls.TRANSCRIPTS_INFO,
+                transcripts_info,
+            )
+            # This checks that the transcripts exist in the contentstore, which
+            # is too expensive to do for every video on every request.
+            block_structure.set_transformer_block_field(
+                block_key,
+                cls,
+                cls.TRANSCRIPT_LANGUAGES,
+                block.available_translations(transcripts_info, include_val_transcripts=False),
+            )
+
+    def transform(self, usage_info, block_structure):
+        """
+        Removes the blocks which are hidden from the table of contents, along
+        with their descendants.
+
+        They may not have human-readable names to display on the mobile
+        clients.  As they are still accessible in the browser, just not
+        navigable from the table of contents, the outline skips them.
+        """
+        block_structure.remove_block_traversal(
+            lambda block_key: block_structure.get_xblock_field(block_key, 'hide_from_toc', False)
+        )
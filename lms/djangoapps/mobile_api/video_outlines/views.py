@@ -14,7 +14,10 @@ from opaque_keys.edx.locator import BlockUsageLocator
 from rest_framework import generics
 from rest_framework.response import Response
 
+from lms.djangoapps.course_blocks.api import COURSE_BLOCK_ACCESS_TRANSFORMERS, get_course_blocks
 from mobile_api.models import MobileApiConfig
+from openedx.core.djangoapps.content.block_structure.transformers import BlockStructureTransformers
+from openedx.core.djangoapps.waffle_utils import WaffleSwitch, WaffleSwitchNamespace
 from xmodule.exceptions import NotFoundError
 from xmodule.modulestore.django import modulestore
 from xmodule.video_module.transcripts_utils import (
@@ -26,7 +29,15 @@ from xmodule.video_module.transcripts_model_utils import (
 )
 
 from ..decorators import mobile_course_access, mobile_view
-from .serializers import BlockOutline, video_summary
+from .serializers import BlockOutline, BlockStructureOutline, block_structure_video_summary, video_summary
+from .transformers import VideoOutlineTransformer
+
+# Full name: mobile_api.video_outline_from_block_structure
+# Serve the video outline from the course's cached block structure rather than
+# by binding a module for each block of the course.
+VIDEO_OUTLINE_FROM_BLOCK_STRUCTURE = WaffleSwitch(
+    WaffleSwitchNamespace(name=u'mobile_api'), u'video_outline_from_block_structure'
+)
 
 
 @mobile_view()
@@ -81,19 +92,31 @@ class VideoSummaryList(generics.ListAPIView):
               Management System.
     """
 
-    @mobile_course_access(depth=None)
+    @mobile_course_access()
     def list(self, request, course, *args, **kwargs):
         video_profiles = MobileApiConfig.get_video_profiles()
-        video_outline = list(
-            BlockOutline(
+        if VIDEO_OUTLINE_FROM_BLOCK_STRUCTURE.is_enabled():
+            block_structure = get_course_blocks(
+                request.user,
+                course.location,
+                BlockStructureTransformers(COURSE_BLOCK_ACCESS_TRANSFORMERS + [VideoOutlineTransformer()]),
+            )
+            video_outline = BlockStructureOutline(
+                course.id,
+                block_structure,
+                {"video": partial(block_structure_video_summary, video_profiles)},
+                request,
+                video_profiles,
+            )
+        else:
+            video_outline = BlockOutline(
                 course.id,
-                course,
+                modulestore().get_course(course.id, depth=None),
                 {"video": partial(video_summary, video_profiles)},
                 request,
                 video_profiles,
             )
-        )
-        return Response(video_outline)
+        return Response(list(video_outline))
 
 
 @mobile_view()
@@ -862,6 +862,16 @@ XBLOCK_SELECT_FUNCTION = prefer_xmodules
 # Paths to wrapper methods which should be applied to every XBlock's FieldData.
 XBLOCK_FIELD_DATA_WRAPPERS = ()
 
+# Cache of the rendered views of user-independent XBlocks, enabled by the
+# lms_xblock.cache_user_independent_fragments waffle switch.
+XBLOCK_FRAGMENT_CACHE = dict(
+    # Seconds a rendered fragment is kept for.
+    TIMEOUT=60 * 60,
+
+    # Fragments with more characters of content than this aren't cached.
+    MAX_CONTENT_LENGTH=64 * 1024,
+)
+
 ############# ModuleStore Configuration ##########
 
 MODULESTORE_BRANCH = 'published-only'
@@ -980,6 +990,8 @@ STATICFILES_DIRS = [
 
 FAVICON_PATH = 'images/favicon.ico'
 DEFAULT_COURSE_ABOUT_IMAGE_URL = 'images/pencils.jpg'
+# Image served in place of a course asset thumbnail which hasn't been generated yet
+THUMBNAIL_PLACEHOLDER_IMAGE_URL = 'images/placeholder-image.png'
 
 # User-uploaded content
 MEDIA_ROOT = '/edx/var/edxapp/media/'
@@ -1263,6 +1275,9 @@ MIDDLEWARE_CLASSES = [
     'openedx.core.djangoapps.request_cache.middleware.RequestCache',
     'openedx.core.djangoapps.monitoring_utils.middleware.MonitoringCustomMetrics',
 
+    # Must come after RequestCache, so that it runs before the request cache is cleared.
+    'lms.djangoapps.completion.middleware.CompletionAggregateMiddleware',
+
     'mobile_api.middleware.AppVersionUpgrade',
     'openedx.core.djangoapps.header_control.middleware.HeaderControlMiddleware',
     'microsite_configuration.middleware.MicrositeMiddleware',
@@ -2032,6 +2047,10 @@ BULK_EMAIL_LOG_SENT_EMAILS = False
 # parallel, and what the SES rate is.
 BULK_EMAIL_RETRY_DELAY_BETWEEN_SENDS = 0.02
 
+# Flag to indicate if a worker process should keep its mail connection open
+# between bulk email subtasks, rather than connecting for each subtask.
+BULK_EMAIL_PERSISTENT_CONNECTIONS = False
+
 ############################# Email Opt In ####################################
 
 # Minimum age for organization-wide email opt in
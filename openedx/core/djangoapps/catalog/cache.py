@@ -3,3 +3,7 @@ PROGRAM_CACHE_KEY_TPL = 'program-{uuid}'
 
 # Cache key used to locate an item containing a list of all program UUIDs for a site.
 SITE_PROGRAM_UUIDS_CACHE_KEY_TPL = 'program-uuids-{domain}'
+
+# Cache key used to locate an item containing, for a site, a dict of course run keys and a dict of
+# course UUIDs to the UUIDs of the programs which contain them.
+SITE_PROGRAM_COURSE_INDEX_CACHE_KEY_TPL = 'program-course-index-{domain}'
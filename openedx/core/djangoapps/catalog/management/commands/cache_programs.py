@@ -8,10 +8,11 @@ from django.core.management import BaseCommand
 
 from openedx.core.djangoapps.catalog.cache import (
     PROGRAM_CACHE_KEY_TPL,
+    SITE_PROGRAM_COURSE_INDEX_CACHE_KEY_TPL,
     SITE_PROGRAM_UUIDS_CACHE_KEY_TPL
 )
 from openedx.core.djangoapps.catalog.models import CatalogIntegration
-from openedx.core.djangoapps.catalog.utils import create_catalog_api_client
+from openedx.core.djangoapps.catalog.utils import build_program_course_index, create_catalog_api_client
 
 logger = logging.getLogger(__name__)
 User = get_user_model()  # pylint: disable=invalid-name
@@ -48,6 +49,11 @@ class Command(BaseCommand):
             if site_config is None or not site_config.get_value('COURSE_CATALOG_API_URL'):
                 logger.info('Skipping site {domain}. No configuration.'.format(domain=site.domain))
                 cache.set(SITE_PROGRAM_UUIDS_CACHE_KEY_TPL.format(domain=site.domain), [], None)
+                cache.set(
+                    SITE_PROGRAM_COURSE_INDEX_CACHE_KEY_TPL.format(domain=site.domain),
+                    build_program_course_index([]),
+                    None
+                )
                 continue
 
             client = create_catalog_api_client(user, site=site)
@@ -64,6 +70,11 @@ class Command(BaseCommand):
                 site_name=site.domain,
             ))
             cache.set(SITE_PROGRAM_UUIDS_CACHE_KEY_TPL.format(domain=site.domain), uuids, None)
+            cache.set(
+                SITE_PROGRAM_COURSE_INDEX_CACHE_KEY_TPL.format(domain=site.domain),
+                build_program_course_index(new_programs.values()),
+                None
+            )
 
         successful = len(programs)
         logger.info('Caching details for {successful} programs.'.format(successful=successful))
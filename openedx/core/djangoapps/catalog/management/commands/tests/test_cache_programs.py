@@ -6,6 +6,7 @@ from django.core.management import call_command
 
 from openedx.core.djangoapps.catalog.cache import (
     PROGRAM_CACHE_KEY_TPL,
+    SITE_PROGRAM_COURSE_INDEX_CACHE_KEY_TPL,
     SITE_PROGRAM_UUIDS_CACHE_KEY_TPL
 )
 from openedx.core.djangoapps.catalog.tests.factories import ProgramFactory
@@ -115,6 +116,14 @@ class TestCachePrograms(CatalogIntegrationMixin, CacheIsolationTestCase, SiteMix
         for key, program in cached_programs.items():
             self.assertEqual(program, programs[key])
 
+        # Verify that the course runs and courses of every program were indexed.
+        cached_index = cache.get(SITE_PROGRAM_COURSE_INDEX_CACHE_KEY_TPL.format(domain=self.site_domain))
+        for program in self.programs:
+            for course in program['courses']:
+                self.assertIn(program['uuid'], cached_index['courses'][course['uuid']])
+                for course_run in course['course_runs']:
+                    self.assertIn(program['uuid'], cached_index['course_runs'][course_run['key']])
+
     def test_handle_missing_service_user(self):
         """
         Verify that the command raises an exception when run without a service
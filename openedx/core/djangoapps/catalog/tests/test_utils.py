@@ -10,7 +10,11 @@ from django.test import TestCase, override_settings
 from django.test.client import RequestFactory
 from student.tests.factories import UserFactory
 
-from openedx.core.djangoapps.catalog.cache import PROGRAM_CACHE_KEY_TPL, SITE_PROGRAM_UUIDS_CACHE_KEY_TPL
+from openedx.core.djangoapps.catalog.cache import (
+    PROGRAM_CACHE_KEY_TPL,
+    SITE_PROGRAM_COURSE_INDEX_CACHE_KEY_TPL,
+    SITE_PROGRAM_UUIDS_CACHE_KEY_TPL
+)
 from openedx.core.djangoapps.catalog.models import CatalogIntegration
 from openedx.core.djangoapps.catalog.tests.factories import (
     CourseFactory,
@@ -20,6 +24,7 @@ from openedx.core.djangoapps.catalog.tests.factories import (
 )
 from openedx.core.djangoapps.catalog.tests.mixins import CatalogIntegrationMixin
 from openedx.core.djangoapps.catalog.utils import (
+    build_program_course_index,
     get_course_runs,
     get_course_runs_for_course,
     get_course_run_details,
@@ -27,6 +32,7 @@ from openedx.core.djangoapps.catalog.utils import (
     get_localized_price_text,
     get_program_types,
     get_programs,
+    get_programs_for_courses,
     get_programs_with_type
 )
 from openedx.core.djangoapps.site_configuration.tests.factories import SiteFactory
@@ -166,6 +172,37 @@ class TestGetPrograms(CacheIsolationTestCase):
         self.assertEqual(actual_program, expected_program)
         self.assertFalse(mock_warning.called)
 
+    def test_get_programs_for_courses(self, _mock_warning, _mock_info):
+        course_run = CourseRunFactory()
+        course = CourseFactory(course_runs=[course_run])
+        entitled_course = CourseFactory()
+        programs = [
+            ProgramFactory(courses=[course]),
+            ProgramFactory(courses=[course, entitled_course]),
+            ProgramFactory(courses=[entitled_course]),
+            ProgramFactory(),
+        ]
+        cache.set_many({PROGRAM_CACHE_KEY_TPL.format(uuid=program['uuid']): program for program in programs}, None)
+
+        # When called before the index is cached, the function should return None.
+        self.assertIsNone(get_programs_for_courses(self.site, [course_run['key']]))
+
+        cache.set(
+            SITE_PROGRAM_COURSE_INDEX_CACHE_KEY_TPL.format(domain=self.site.domain),
+            build_program_course_index(programs),
+            None
+        )
+
+        self.assertEqual(
+            set(program['uuid'] for program in get_programs_for_courses(self.site, [course_run['key']])),
+            set(program['uuid'] for program in programs[:2])
+        )
+        self.assertEqual(
+            set(program['uuid'] for program in get_programs_for_courses(self.site, [], [entitled_course['uuid']])),
+            set(program['uuid'] for program in programs[1:3])
+        )
+        self.assertEqual(get_programs_for_courses(self.site, ['course-v1:Not+In+Program']), [])
+
 
 @mock.patch(UTILS_MODULE + '.get_edx_api_data')
 class TestGetProgramTypes(CatalogIntegrationMixin, TestCase):
@@ -14,6 +14,7 @@ from pytz import UTC
 from entitlements.utils import is_course_run_entitlement_fullfillable
 from student.models import CourseEnrollment
 from openedx.core.djangoapps.catalog.cache import (PROGRAM_CACHE_KEY_TPL,
+                                                   SITE_PROGRAM_COURSE_INDEX_CACHE_KEY_TPL,
                                                    SITE_PROGRAM_UUIDS_CACHE_KEY_TPL)
 from openedx.core.djangoapps.catalog.models import CatalogIntegration
 from openedx.core.lib.edx_api_utils import get_edx_api_data
@@ -63,6 +64,66 @@ def get_programs(site, uuid=None):
     if not uuids:
         logger.warning('Failed to get program UUIDs from the cache.')
 
+    return _get_programs_by_uuids(uuids)
+
+
+def get_programs_for_courses(site, course_run_keys=(), course_uuids=()):
+    """Read the programs containing any of the given course runs or courses from the cache.
+
+    Only the programs found in the site's course index, which is cached by the
+    cache_programs management command, are read from the cache.
+
+    Arguments:
+        site (Site): django.contrib.sites.models object
+        course_run_keys (list): unicode keys of course runs
+        course_uuids (list): string UUIDs of courses
+
+    Returns:
+        list of dict, representing programs.
+        None, if the site's course index is not in the cache.
+    """
+    index = cache.get(SITE_PROGRAM_COURSE_INDEX_CACHE_KEY_TPL.format(domain=site.domain))
+    if index is None:
+        return None
+
+    uuids = set()
+    for course_run_key in course_run_keys:
+        uuids.update(index['course_runs'].get(course_run_key, []))
+    for course_uuid in course_uuids:
+        uuids.update(index['courses'].get(course_uuid, []))
+
+    return _get_programs_by_uuids(list(uuids)) if uuids else []
+
+
+def build_program_course_index(programs):
+    """Build the index of the course runs and courses of the given programs.
+
+    Arguments:
+        programs (list): Containing dicts representing programs.
+
+    Returns:
+        dict, with dicts of the keys of course runs ('course_runs') and the
+            UUIDs of courses ('courses') to lists of the UUIDs of the programs
+            which contain them.
+    """
+    course_runs, courses = {}, {}
+    for program in programs:
+        for course in program['courses']:
+            program_uuids = courses.setdefault(course['uuid'], [])
+            if program['uuid'] not in program_uuids:
+                program_uuids.append(program['uuid'])
+            for course_run in course['course_runs']:
+                program_uuids = course_runs.setdefault(course_run['key'], [])
+                if program['uuid'] not in program_uuids:
+                    program_uuids.append(program['uuid'])
+
+    return {'course_runs': course_runs, 'courses': courses}
+
+
+def _get_programs_by_uuids(uuids):
+    """Read the programs with the given UUIDs from the cache."""
+    missing_details_msg_tpl = 'Failed to get details for program {uuid} from the cache.'
+
     programs = cache.get_many([PROGRAM_CACHE_KEY_TPL.format(uuid=uuid) for uuid in uuids])
     programs = list(programs.values())
 
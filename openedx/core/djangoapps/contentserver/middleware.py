@@ -9,14 +9,17 @@ try:
     import newrelic.agent
 except ImportError:
     newrelic = None  # pylint: disable=invalid-name
+from django.conf import settings
+from django.contrib.staticfiles.storage import staticfiles_storage
 from django.http import (
     HttpResponse, HttpResponseNotModified, HttpResponseForbidden,
-    HttpResponseBadRequest, HttpResponseNotFound, HttpResponsePermanentRedirect)
+    HttpResponseBadRequest, HttpResponseNotFound, HttpResponsePermanentRedirect, HttpResponseRedirect)
 from six import text_type
 from student.models import CourseEnrollment
 
 from xmodule.assetstore.assetmgr import AssetManager
 from xmodule.contentstore.content import StaticContent, XASSET_LOCATION_TAG
+from xmodule.contentstore.django import contentstore
 from xmodule.modulestore import InvalidLocationError
 from opaque_keys import InvalidKeyError
 from opaque_keys.edx.locator import AssetLocator
@@ -75,6 +78,9 @@ class StaticContentServer(object):
                 content = self.load_asset_from_location(loc)
                 actual_digest = getattr(content, "content_digest", None)
             except (ItemNotFoundError, NotFoundError):
+                if loc.category == 'thumbnail' and contentstore().is_thumbnail_referenced(loc):
+                    # Thumbnails are generated in the background, so this asset's may not be ready yet.
+                    return self.get_thumbnail_placeholder_response()
                 return HttpResponseNotFound()
 
             # If this was a versioned asset, and the digest doesn't match, redirect
@@ -220,6 +226,16 @@ class StaticContentServer(object):
         # caches a version of the response without CORS headers, in turn breaking XHR requests.
         force_header_for_response(response, 'Vary', 'Origin')
 
+    @staticmethod
+    def get_thumbnail_placeholder_response():
+        """
+        Returns a temporary redirect to the image shown in place of a thumbnail that hasn't been generated yet.
+        """
+        response = HttpResponseRedirect(staticfiles_storage.url(settings.THUMBNAIL_PLACEHOLDER_IMAGE_URL))
+        # Make sure the thumbnail is fetched again once it has been generated.
+        response['Cache-Control'] = "private, no-cache, no-store"
+        return response
+
     @staticmethod
     def is_cdn_request(request):
         """
@@ -10,6 +10,7 @@ import unittest
 from uuid import uuid4
 
 from django.conf import settings
+from django.contrib.staticfiles.storage import staticfiles_storage
 from django.test import RequestFactory
 from django.test.client import Client
 from django.test.utils import override_settings
@@ -119,6 +120,36 @@ class ContentStoreToyCourseTest(SharedModuleStoreTestCase):
         resp = self.client.get(self.url_unlocked)
         self.assertEqual(resp.status_code, 200)
 
+    def test_missing_asset(self):
+        """
+        Test that a missing asset is not found.
+        """
+        resp = self.client.get(unicode(self.course_key.make_asset_key('asset', 'no_such_file.txt')))
+        self.assertEqual(resp.status_code, 404)
+
+    def test_missing_thumbnail(self):
+        """
+        Test that a thumbnail which no asset refers to is not found.
+        """
+        resp = self.client.get(unicode(self.course_key.make_asset_key('thumbnail', 'no_such_image.jpg')))
+        self.assertEqual(resp.status_code, 404)
+
+    def test_pending_thumbnail_placeholder(self):
+        """
+        Test that a placeholder is served in place of a thumbnail which hasn't been generated yet.
+        """
+        asset_key = self.course_key.make_asset_key('asset', 'pending_image.png')
+        thumbnail_key = self.course_key.make_asset_key('thumbnail', 'pending_image-png.jpg')
+        self.contentstore.save(
+            StaticContent(asset_key, 'pending_image.png', 'image/png', 'image data', thumbnail_location=thumbnail_key)
+        )
+
+        resp = self.client.get(unicode(thumbnail_key))
+        self.assertRedirects(
+            resp, staticfiles_storage.url(settings.THUMBNAIL_PLACEHOLDER_IMAGE_URL), fetch_redirect_response=False
+        )
+        self.assertEqual(resp['Cache-Control'], 'private, no-cache, no-store')
+
     def test_unlocked_versioned_asset(self):
         """
         Test that unlocked assets that are versioned are being served.
@@ -5,13 +5,17 @@ forums, and to the cohort admin views.
 
 import logging
 import random
+from collections import namedtuple
+from uuid import uuid4
 
 from courseware import courses
 from django.contrib.auth.models import User
+from django.core.cache import cache as django_cache
 from django.core.exceptions import ValidationError
 from django.core.validators import validate_email
 from django.db import IntegrityError, transaction
-from django.db.models.signals import m2m_changed, post_save
+from django.db.models import Q
+from django.db.models.signals import m2m_changed, post_delete, post_save
 from django.dispatch import receiver
 from django.http import Http404
 from django.utils.translation import ugettext as _
@@ -28,6 +32,7 @@ from .models import (
     CourseUserGroupPartitionGroup,
     UnregisteredLearnerCohortAssignments
 )
+from .config import USE_MEMBERSHIP_INDEX_SWITCH
 from .signals.signals import COHORT_MEMBERSHIP_UPDATED
 
 log = logging.getLogger(__name__)
@@ -86,6 +91,18 @@ def _cohort_membership_changed(sender, **kwargs):
         tracker.emit(event_name, event)
 
 
+@receiver(post_save, sender=CohortMembership)
+@receiver(post_delete, sender=CohortMembership)
+def _cohort_membership_saved_or_deleted(sender, instance, **kwargs):  # pylint: disable=unused-argument
+    """
+    Invalidates the membership index of the course each time a cohort membership is saved or deleted.
+
+    This runs before the change is committed, so an index read in between may still be built from the old
+    memberships; the functions below which write memberships invalidate the index again once they are committed.
+    """
+    invalidate_cohort_membership_index(instance.course_id)
+
+
 # A 'default cohort' is an auto-cohort that is automatically created for a course if no cohort with automatic
 # assignment have been specified. It is intended to be used in a cohorted course for users who have yet to be assigned
 # to a cohort, if the course staff have not explicitly created a cohort of type "RANDOM".
@@ -178,7 +195,20 @@ def bulk_cache_cohorts(course_key, users):
     clear_cache(COHORT_CACHE_NAMESPACE)
     cache = get_cache(COHORT_CACHE_NAMESPACE)
 
-    if is_course_cohorted(course_key):
+    if is_course_cohorted(course_key) and USE_MEMBERSHIP_INDEX_SWITCH.is_enabled():
+        cohort_ids_by_user_id = get_cohort_membership_index(course_key)
+        cohorts_by_id = {
+            cohort.id: cohort
+            for cohort in CourseUserGroup.objects.filter(course_id=course_key, group_type=CourseUserGroup.COHORT)
+        }
+        uncohorted_users = []
+        for user in users:
+            cohort = cohorts_by_id.get(cohort_ids_by_user_id.get(user.id))
+            if cohort is None:
+                uncohorted_users.append(user)
+            else:
+                cache[_cohort_cache_key(user.id, course_key)] = cohort
+    elif is_course_cohorted(course_key):
         cohorts_by_user = {
             membership.user: membership
             for membership in
@@ -194,6 +224,55 @@ def bulk_cache_cohorts(course_key, users):
         cache[_cohort_cache_key(user.id, course_key)] = None
 
 
+COHORT_MEMBERSHIP_INDEX_CACHE_KEY = u"cohorts.membership_index.{course_key}.{version}"
+COHORT_MEMBERSHIP_INDEX_VERSION_CACHE_KEY = u"cohorts.membership_index_version.{course_key}"
+COHORT_MEMBERSHIP_INDEX_CACHE_TIMEOUT = 60 * 60 * 24
+
+
+def _get_cohort_membership_index_version(course_key):
+    """
+    Returns the current version of the membership index of the course.
+    """
+    version_key = COHORT_MEMBERSHIP_INDEX_VERSION_CACHE_KEY.format(course_key=course_key)
+    version = django_cache.get(version_key)
+    if version is None:
+        django_cache.add(version_key, uuid4().hex, None)
+        version = django_cache.get(version_key)
+    return version
+
+
+def invalidate_cohort_membership_index(course_key):
+    """
+    Moves the course on to a new version of its membership index, so that the
+    index is rebuilt the next time it is read.  Stale versions of the index
+    are left to expire from the cache.
+    """
+    version_key = COHORT_MEMBERSHIP_INDEX_VERSION_CACHE_KEY.format(course_key=course_key)
+    django_cache.set(version_key, uuid4().hex, None)
+
+
+def get_cohort_membership_index(course_key):
+    """
+    Returns a dict of the ids of the users with a cohort in the course to the
+    ids of their cohorts.
+
+    The index is kept in the cache until a cohort membership in the course
+    changes, so that read-heavy consumers such as the forums and grade reports
+    can look up the cohorts of many users without querying their memberships.
+    """
+    cache_key = COHORT_MEMBERSHIP_INDEX_CACHE_KEY.format(
+        course_key=course_key,
+        version=_get_cohort_membership_index_version(course_key),
+    )
+    index = django_cache.get(cache_key)
+    if index is None:
+        index = dict(
+            CohortMembership.objects.filter(course_id=course_key).values_list('user_id', 'course_user_group_id')
+        )
+        django_cache.set(cache_key, index, COHORT_MEMBERSHIP_INDEX_CACHE_TIMEOUT)
+    return index
+
+
 def get_cohort(user, course_key, assign=True, use_cached=False):
     """
     Returns the user's cohort for the specified course.
@@ -260,8 +339,6 @@ def get_cohort(user, course_key, assign=True, use_cached=False):
                 user=user,
                 course_user_group=course_user_group,
             )
-
-            return cache.setdefault(cache_key, membership.course_user_group)
     except IntegrityError as integrity_error:
         # An IntegrityError is raised when multiple workers attempt to
         # create the same row in one of the cohort model entries:
@@ -272,6 +349,9 @@ def get_cohort(user, course_key, assign=True, use_cached=False):
         )
         return get_cohort(user, course_key, assign, use_cached)
 
+    invalidate_cohort_membership_index(course_key)
+    return cache.setdefault(cache_key, membership.course_user_group)
+
 
 def get_random_cohort(course_key):
     """
@@ -427,6 +507,7 @@ def remove_user_from_cohort(cohort, username_or_email):
         membership = CohortMembership.objects.get(course_user_group=cohort, user=user)
         course_key = membership.course_id
         membership.delete()
+        invalidate_cohort_membership_index(course_key)
         COHORT_MEMBERSHIP_UPDATED.send(sender=None, user=user, course_key=course_key)
     except CohortMembership.DoesNotExist:
         raise ValueError("User {} was not present in cohort {}".format(username_or_email, cohort))
@@ -457,6 +538,8 @@ def add_user_to_cohort(cohort, username_or_email):
 
         membership = CohortMembership(course_user_group=cohort, user=user)
         membership.save()  # This will handle both cases, creation and updating, of a CohortMembership for this user.
+        # The save is committed by now, unlike when the membership's post_save invalidated the index.
+        invalidate_cohort_membership_index(membership.course_id)
         COHORT_MEMBERSHIP_UPDATED.send(sender=None, user=user, course_key=membership.course_id)
         tracker.emit(
             "edx.cohort.user_add_requested",
@@ -502,6 +585,203 @@ def add_user_to_cohort(cohort, username_or_email):
                 raise ex
 
 
+# The number of users whose cohort memberships are written together by add_users_to_cohort.
+BULK_ASSIGNMENT_BATCH_SIZE = 1000
+
+CohortAssignmentResults = namedtuple(
+    'CohortAssignmentResults',
+    [
+        'added',  # list of (User, previous cohort name or None) for each user added to the cohort
+        'present',  # list of the usernames or emails of the users already present in the cohort
+        'preassigned',  # list of the emails preassigned to the cohort, which do not belong to any user
+        'not_found',  # list of the usernames or emails which do not belong to any user
+        'invalid',  # list of the unknown emails which are not valid email addresses
+    ]
+)
+
+
+def add_users_to_cohort(cohort, usernames_or_emails):
+    """
+    Look up the given users, and add those that are found to the specified
+    cohort, as add_user_to_cohort does for a single user.
+
+    The users are looked up, and their memberships written, in batches of
+    BULK_ASSIGNMENT_BATCH_SIZE, rather than one user at a time.
+
+    Arguments:
+        cohort: CourseUserGroup
+        usernames_or_emails: iterable of strings.  Each is treated as an email if it has '@'
+
+    Returns:
+        CohortAssignmentResults
+
+    Raises:
+        ValidationError if the group is not a cohort.
+    """
+    CohortMembership(course_user_group=cohort, course_id=cohort.course_id).clean()
+
+    results = CohortAssignmentResults([], [], [], [], [])
+    usernames_or_emails = list(usernames_or_emails)
+    for batch_start in range(0, len(usernames_or_emails), BULK_ASSIGNMENT_BATCH_SIZE):
+        batch = usernames_or_emails[batch_start:batch_start + BULK_ASSIGNMENT_BATCH_SIZE]
+        _add_batch_of_users_to_cohort(cohort, batch, results)
+    return results
+
+
+def _add_batch_of_users_to_cohort(cohort, usernames_or_emails, results):
+    """
+    Adds a batch of users to the cohort, appending the outcome of each to the
+    given CohortAssignmentResults.
+    """
+    users_by_username_or_email = _get_users_by_username_or_email(usernames_or_emails)
+    memberships_by_user_id = {
+        membership.user_id: membership
+        for membership in CohortMembership.objects.filter(
+            course_id=cohort.course_id,
+            user_id__in=[user.id for user in users_by_username_or_email.itervalues()],
+        ).select_related('course_user_group')
+    }
+
+    users_to_add = []
+    previous_cohorts = {}
+    unknown_emails = []
+    for username_or_email in usernames_or_emails:
+        user = users_by_username_or_email.get(username_or_email)
+        if user is None:
+            try:
+                validate_email(username_or_email)
+                unknown_emails.append(username_or_email)
+            except ValidationError:
+                if "@" in username_or_email:
+                    results.invalid.append(username_or_email)
+                else:
+                    results.not_found.append(username_or_email)
+            continue
+
+        membership = memberships_by_user_id.get(user.id)
+        if user.id in previous_cohorts or (membership and membership.course_user_group_id == cohort.id):
+            results.present.append(username_or_email)
+            continue
+        users_to_add.append(user)
+        previous_cohorts[user.id] = membership.course_user_group if membership else None
+
+    if users_to_add:
+        try:
+            with transaction.atomic():
+                _write_cohort_memberships(cohort, users_to_add, memberships_by_user_id)
+        except IntegrityError:
+            # Some of the users were assigned a cohort since their memberships
+            # were read, so add them one at a time to settle those races.
+            log.info(
+                "HANDLING_INTEGRITY_ERROR: Adding %d users to cohort %d one at a time", len(users_to_add), cohort.id
+            )
+            for user in users_to_add:
+                try:
+                    __, previous_cohort_name, __ = add_user_to_cohort(cohort, user.username)
+                    results.added.append((user, previous_cohort_name))
+                except ValueError:
+                    results.present.append(user.username)
+        else:
+            invalidate_cohort_membership_index(cohort.course_id)
+            for user in users_to_add:
+                previous_cohort = previous_cohorts[user.id]
+                COHORT_MEMBERSHIP_UPDATED.send(sender=None, user=user, course_key=cohort.course_id)
+                tracker.emit(
+                    "edx.cohort.user_add_requested",
+                    {
+                        "user_id": user.id,
+                        "cohort_id": cohort.id,
+                        "cohort_name": cohort.name,
+                        "previous_cohort_id": previous_cohort.id if previous_cohort else None,
+                        "previous_cohort_name": previous_cohort.name if previous_cohort else None,
+                    }
+                )
+                results.added.append((user, previous_cohort.name if previous_cohort else None))
+
+    if unknown_emails:
+        _preassign_emails_to_cohort(cohort, unknown_emails)
+        results.preassigned.extend(unknown_emails)
+
+
+def _get_users_by_username_or_email(usernames_or_emails):
+    """
+    Returns a dict of each of the given usernames or emails to its User, like
+    get_user_by_username_or_email, looking them all up in one query.
+    """
+    emails = [username_or_email for username_or_email in usernames_or_emails if '@' in username_or_email]
+    usernames = [username_or_email for username_or_email in usernames_or_emails if '@' not in username_or_email]
+    users = User.objects.filter(Q(email__in=emails) | Q(username__in=usernames))
+
+    # The database may match the usernames and emails case-insensitively, so
+    # fall back to matching them case-insensitively when there is no exact match.
+    by_email, by_username = {}, {}
+    for user in users:
+        by_email.setdefault(user.email.lower(), user)
+        by_username.setdefault(user.username.lower(), user)
+    for user in users:
+        by_email[user.email] = user
+        by_username[user.username] = user
+
+    users_by_username_or_email = {}
+    for username_or_email in usernames_or_emails:
+        by_key = by_email if '@' in username_or_email else by_username
+        user = by_key.get(username_or_email) or by_key.get(username_or_email.lower())
+        if user is not None:
+            users_by_username_or_email[username_or_email] = user
+    return users_by_username_or_email
+
+
+def _write_cohort_memberships(cohort, users, memberships_by_user_id):
+    """
+    Moves the users with memberships into the cohort, and creates memberships
+    in the cohort for the rest, with a few queries for the whole batch.
+    """
+    moved_users_by_previous_cohort = {}
+    new_users = []
+    for user in users:
+        membership = memberships_by_user_id.get(user.id)
+        if membership:
+            moved_users_by_previous_cohort.setdefault(membership.course_user_group, []).append(user)
+        else:
+            new_users.append(user)
+
+    for previous_cohort, moved_users in moved_users_by_previous_cohort.iteritems():
+        previous_cohort.users.remove(*moved_users)
+    CohortMembership.objects.filter(
+        course_id=cohort.course_id,
+        user_id__in=[user.id for moved_users in moved_users_by_previous_cohort.itervalues() for user in moved_users],
+    ).update(course_user_group=cohort)
+    CohortMembership.objects.bulk_create([
+        CohortMembership(course_user_group=cohort, user=user, course_id=cohort.course_id)
+        for user in new_users
+    ])
+    cohort.users.add(*users)
+
+
+def _preassign_emails_to_cohort(cohort, emails):
+    """
+    Stores the cohort of each of the emails, so that the users can be added to
+    the cohort if they eventually enroll in the course.
+    """
+    assignments = UnregisteredLearnerCohortAssignments.objects.filter(course_id=cohort.course_id, email__in=emails)
+    assigned_emails = set(assignments.values_list('email', flat=True))
+    assignments.update(course_user_group=cohort)
+    UnregisteredLearnerCohortAssignments.objects.bulk_create([
+        UnregisteredLearnerCohortAssignments(course_user_group=cohort, email=email, course_id=cohort.course_id)
+        for email in set(emails) - assigned_emails
+    ])
+
+    for email in emails:
+        tracker.emit(
+            "edx.cohort.email_address_preassigned",
+            {
+                "user_email": email,
+                "cohort_id": cohort.id,
+                "cohort_name": cohort.name,
+            }
+        )
+
+
 def get_group_info_for_cohort(cohort, use_cached=False):
     """
     Get the ids of the group and partition to which this cohort has been linked
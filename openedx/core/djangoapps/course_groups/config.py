@@ -0,0 +1,9 @@
+"""
+Waffle switches for the course_groups app.
+"""
+from openedx.core.djangoapps.waffle_utils import WaffleSwitch, WaffleSwitchNamespace
+
+WAFFLE_SWITCH_NAMESPACE = WaffleSwitchNamespace(name=u'course_groups')
+
+# Look up the cohorts of users in bulk from the cached membership index of the course.
+USE_MEMBERSHIP_INDEX_SWITCH = WaffleSwitch(WAFFLE_SWITCH_NAMESPACE, u'use_membership_index')
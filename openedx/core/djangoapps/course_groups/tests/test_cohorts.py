@@ -8,9 +8,12 @@ from nose.plugins.attrib import attr
 
 import before_after
 from django.contrib.auth.models import User
-from django.db import IntegrityError
+from django.core.cache import cache
+from django.db import IntegrityError, connection
+from django.db.models.signals import post_save
 from django.http import Http404
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 from opaque_keys.edx.locator import CourseLocator
 from six import text_type
 
@@ -21,7 +24,7 @@ from xmodule.modulestore.tests.django_utils import TEST_DATA_MIXED_MODULESTORE,
 from xmodule.modulestore.tests.factories import ToyCourseFactory
 
 from .. import cohorts
-from ..models import CourseCohort, CourseUserGroup, CourseUserGroupPartitionGroup
+from ..models import CohortMembership, CourseCohort, CourseUserGroup, CourseUserGroupPartitionGroup
 from ..tests.helpers import CohortFactory, CourseCohortFactory, config_course_cohorts, config_course_cohorts_legacy
 
 
@@ -674,6 +677,145 @@ class TestCohorts(ModuleStoreTestCase):
             lambda: cohorts.add_user_to_cohort(first_cohort, "non_existent_username")
         )
 
+    @patch("openedx.core.djangoapps.course_groups.cohorts.tracker")
+    @patch("openedx.core.djangoapps.course_groups.cohorts.COHORT_MEMBERSHIP_UPDATED")
+    def test_add_users_to_cohort(self, mock_signal, mock_tracker):
+        """
+        Make sure cohorts.add_users_to_cohort() adds users in bulk with the same
+        outcomes as cohorts.add_user_to_cohort().
+        """
+        first_user = UserFactory(username="FirstUser", email="first@example.com")
+        second_user = UserFactory(username="SecondUser", email="second@example.com")
+        third_user = UserFactory(username="ThirdUser", email="third@example.com")
+        course = modulestore().get_course(self.toy_course_key)
+        first_cohort = CohortFactory(course_id=course.id, name="FirstCohort")
+        second_cohort = CohortFactory(course_id=course.id, name="SecondCohort")
+        cohorts.add_user_to_cohort(first_cohort, "SecondUser")
+        cohorts.add_user_to_cohort(second_cohort, "ThirdUser")
+        mock_signal.reset_mock()
+
+        results = cohorts.add_users_to_cohort(second_cohort, [
+            "FirstUser",
+            "second@example.com",
+            "ThirdUser",
+            "first@example.com",
+            "new_email@example.com",
+            "non_existent_username",
+            "invalid@",
+        ])
+
+        self.assertEqual(results.added, [(first_user, None), (second_user, "FirstCohort")])
+        self.assertEqual(results.present, ["ThirdUser", "first@example.com"])
+        self.assertEqual(results.preassigned, ["new_email@example.com"])
+        self.assertEqual(results.not_found, ["non_existent_username"])
+        self.assertEqual(results.invalid, ["invalid@"])
+        self.assertItemsEqual(second_cohort.users.all(), [first_user, second_user, third_user])
+        self.assertFalse(first_cohort.users.exists())
+        self.assertEqual(cohorts.get_cohort(second_user, course.id, assign=False), second_cohort)
+        self.assertEqual(
+            mock_signal.send.call_args_list,
+            [
+                call(sender=None, user=first_user, course_key=course.id),
+                call(sender=None, user=second_user, course_key=course.id),
+            ]
+        )
+        mock_tracker.emit.assert_any_call(
+            "edx.cohort.user_add_requested",
+            {
+                "user_id": second_user.id,
+                "cohort_id": second_cohort.id,
+                "cohort_name": second_cohort.name,
+                "previous_cohort_id": first_cohort.id,
+                "previous_cohort_name": first_cohort.name,
+            }
+        )
+        mock_tracker.emit.assert_any_call(
+            "edx.cohort.email_address_preassigned",
+            {
+                "user_email": "new_email@example.com",
+                "cohort_id": second_cohort.id,
+                "cohort_name": second_cohort.name,
+            }
+        )
+
+    @patch("openedx.core.djangoapps.course_groups.cohorts.COHORT_MEMBERSHIP_UPDATED")
+    def test_add_users_to_cohort_queries(self, _mock_signal):
+        """
+        Make sure cohorts.add_users_to_cohort() looks up and writes each batch of
+        users with the same number of queries, however many users are in it.
+        """
+        course = modulestore().get_course(self.toy_course_key)
+        cohort = CohortFactory(course_id=course.id, name="Cohort")
+
+        def count_queries(num_users):
+            """
+            Returns the number of queries made to add that many new users to the cohort.
+            """
+            users = [UserFactory() for __ in range(num_users)]
+            with CaptureQueriesContext(connection) as queries:
+                results = cohorts.add_users_to_cohort(cohort, [user.username for user in users])
+            self.assertEqual(len(results.added), num_users)
+            return len(queries)
+
+        self.assertEqual(count_queries(2), count_queries(10))
+
+        with patch.object(cohorts, 'BULK_ASSIGNMENT_BATCH_SIZE', 5):
+            self.assertEqual(count_queries(10), 2 * count_queries(5))
+        self.assertEqual(cohort.users.count(), 27)
+
+    def test_cohort_membership_index(self):
+        """
+        Make sure the cohort membership index of a course is cached, and is
+        rebuilt after memberships change.
+        """
+        course = modulestore().get_course(self.toy_course_key)
+        first_cohort = CohortFactory(course_id=course.id, name="FirstCohort")
+        second_cohort = CohortFactory(course_id=course.id, name="SecondCohort")
+        first_user, second_user = UserFactory(), UserFactory()
+        cohorts.add_user_to_cohort(first_cohort, first_user.username)
+
+        with self.assertNumQueries(1):
+            self.assertEqual(cohorts.get_cohort_membership_index(course.id), {first_user.id: first_cohort.id})
+        with self.assertNumQueries(0):
+            cohorts.get_cohort_membership_index(course.id)
+
+        cohorts.add_user_to_cohort(second_cohort, first_user.username)
+        cohorts.add_users_to_cohort(second_cohort, [second_user.username])
+        self.assertEqual(
+            cohorts.get_cohort_membership_index(course.id),
+            {first_user.id: second_cohort.id, second_user.id: second_cohort.id}
+        )
+
+        cohorts.remove_user_from_cohort(second_cohort, first_user.username)
+        self.assertEqual(cohorts.get_cohort_membership_index(course.id), {second_user.id: second_cohort.id})
+
+    def test_cohort_membership_index_invalidated_after_commit(self):
+        """
+        Make sure an index read before a new membership is committed isn't
+        used once it is.
+        """
+        course = modulestore().get_course(self.toy_course_key)
+        cohort = CohortFactory(course_id=course.id, name="Cohort")
+        user = UserFactory()
+        stale_index = cohorts.get_cohort_membership_index(course.id)
+
+        def cache_stale_index(sender, instance, **kwargs):  # pylint: disable=unused-argument
+            """
+            Caches the index as a concurrent read would before the membership is committed.
+            """
+            cache.set(
+                cohorts.COHORT_MEMBERSHIP_INDEX_CACHE_KEY.format(
+                    course_key=course.id,
+                    version=cohorts._get_cohort_membership_index_version(course.id),  # pylint: disable=protected-access
+                ),
+                stale_index,
+            )
+
+        post_save.connect(cache_stale_index, sender=CohortMembership)
+        self.addCleanup(post_save.disconnect, cache_stale_index, sender=CohortMembership)
+        cohorts.add_user_to_cohort(cohort, user.username)
+        self.assertEqual(cohorts.get_cohort_membership_index(course.id), {user.id: cohort.id})
+
     @patch("openedx.core.djangoapps.course_groups.cohorts.tracker")
     def add_user_to_cohorts_race_condition(self, mock_tracker):
         """
@@ -360,6 +360,7 @@ def remove_user_from_cohort(request, course_key_string, cohort_id):
     try:
         membership = CohortMembership.objects.get(user=user, course_id=course_key)
         membership.delete()
+        cohorts.invalidate_cohort_membership_index(course_key)
 
     except CohortMembership.DoesNotExist:
         pass
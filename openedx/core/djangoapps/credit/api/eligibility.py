@@ -20,6 +20,9 @@ from student.models import CourseEnrollment
 
 log = logging.getLogger(__name__)
 
+# The number of users whose eligibility is evaluated together by update_credit_eligibilities.
+BULK_ELIGIBILITY_BATCH_SIZE = 1000
+
 
 def is_credit_course(course_key):
     """
@@ -65,7 +68,8 @@ def set_credit_requirements(course_key, requirements):
         InvalidCreditRequirements
 
     Returns:
-        None
+        bool: True if any requirement was added, disabled or had its
+            criteria changed.
     """
 
     invalid_requirements = _validate_requirements(requirements)
@@ -79,12 +83,19 @@ def set_credit_requirements(course_key, requirements):
         raise InvalidCreditCourse()
 
     old_requirements = CreditRequirement.get_course_requirements(course_key=course_key)
+    old_criteria = {(req.namespace, req.name): req.criteria for req in old_requirements}
     requirements_to_disable = _get_requirements_to_disable(old_requirements, requirements)
     if requirements_to_disable:
         CreditRequirement.disable_credit_requirements(requirements_to_disable)
 
+    changed = bool(requirements_to_disable)
     for order, requirement in enumerate(requirements):
         CreditRequirement.add_or_update_course_requirement(credit_course, requirement, order)
+        key = (requirement["namespace"], requirement["name"])
+        if key not in old_criteria or old_criteria[key] != requirement["criteria"]:
+            changed = True
+
+    return changed
 
 
 def get_credit_requirements(course_key, namespace=None):
@@ -277,6 +288,66 @@ def set_credit_requirement_status(user, course_key, req_namespace, req_name, sta
                 log.exception("Error sending email")
 
 
+def update_credit_eligibilities(course_key, usernames=None):
+    """
+    Re-evaluate the credit eligibility of learners in a course.
+
+    This is meant to be run after the requirements of the course have
+    changed, when some learners may have satisfied all of the remaining
+    requirements.  It never removes a learner's eligibility.
+
+    Args:
+        course_key (CourseKey): Identifier for the course.
+
+    Keyword Arguments:
+        usernames (list): Usernames of the learners to evaluate, or None to
+            evaluate every learner with a credit eligible enrollment.
+
+    Returns:
+        list of the usernames of the learners who became eligible for credit
+    """
+    reqs = list(CreditRequirement.get_course_requirements(course_key))
+    # With no requirements there is nothing for the learners to have satisfied.
+    if not reqs:
+        return []
+
+    newly_eligible = []
+    usernames = _get_credit_eligible_usernames(course_key, usernames)
+    for batch_start in range(0, len(usernames), BULK_ELIGIBILITY_BATCH_SIZE):
+        batch = usernames[batch_start:batch_start + BULK_ELIGIBILITY_BATCH_SIZE]
+        newly_eligible.extend(CreditEligibility.bulk_update_eligibility(reqs, batch, course_key))
+
+    _send_credit_notifications(newly_eligible, course_key)
+    return newly_eligible
+
+
+def _get_credit_eligible_usernames(course_key, usernames=None):
+    """
+    Returns the sorted usernames of the given users, or of all users if
+    usernames is None, who have an active, credit eligible enrollment in
+    the course.
+    """
+    enrollments = CourseEnrollment.objects.filter(
+        course_id=course_key,
+        is_active=True,
+        mode__in=CourseMode.CREDIT_ELIGIBLE_MODES,
+    )
+    if usernames is not None:
+        enrollments = enrollments.filter(user__username__in=usernames)
+    return sorted(enrollments.values_list('user__username', flat=True))
+
+
+def _send_credit_notifications(usernames, course_key):
+    """
+    Notify each of the users that they have become eligible for credit.
+    """
+    for username in usernames:
+        try:
+            send_credit_notifications(username, course_key)
+        except Exception:  # pylint: disable=broad-except
+            log.exception("Error sending email")
+
+
 # pylint: disable=invalid-name
 def remove_credit_requirement_status(username, course_key, req_namespace, req_name):
     """
@@ -373,6 +373,8 @@ class CreditRequirement(TimeStampedModel):
             None
         """
         cls.objects.filter(id__in=requirement_ids).update(active=False)
+        # A queryset update does not send post_save, so clear the cache here.
+        RequestCache.clear_request_cache(name=cls.CACHE_NAMESPACE)
 
     @classmethod
     def get_course_requirement(cls, course_key, namespace, name):
@@ -454,6 +456,26 @@ class CreditRequirementStatus(TimeStampedModel):
         """
         return cls.objects.filter(requirement__in=requirements, username=username)
 
+    @classmethod
+    def get_statuses_for_users(cls, requirements, usernames):
+        """
+        Get credit requirement statuses of given requirements for many users
+        with a single query.
+
+        Args:
+            requirements(list): 'CreditRequirement' objects
+            usernames(list): usernames of the users
+
+        Returns:
+            dict mapping each username with a status to a dict of requirement id to status
+        """
+        statuses_by_username = defaultdict(dict)
+        for username, requirement_id, status in cls.objects.filter(
+                requirement__in=requirements, username__in=usernames
+        ).values_list('username', 'requirement_id', 'status'):
+            statuses_by_username[username][requirement_id] = status
+        return statuses_by_username
+
     @classmethod
     @transaction.atomic
     def add_or_update_requirement_status(cls, username, requirement, status="satisfied", reason=None):
@@ -573,6 +595,56 @@ class CreditEligibility(TimeStampedModel):
         else:
             return is_eligible, False
 
+    @classmethod
+    def bulk_update_eligibility(cls, requirements, usernames, course_key):
+        """
+        Update the credit eligibility of many users in a course at once.
+
+        This is the equivalent of calling update_eligibility for each user,
+        but the statuses and existing eligibilities of all of the users are
+        read with one query each, and the new eligibilities are written with
+        a single insert.
+
+        Arguments:
+            requirements (Queryset): Queryset of `CreditRequirement`s to check.
+            usernames (list): Identifiers of the users being updated.
+            course_key (CourseKey): Identifier of the course.
+
+        Returns: list of the usernames of the users who were newly marked as eligible
+        """
+        requirements = list(requirements)
+        statuses_by_username = CreditRequirementStatus.get_statuses_for_users(requirements, usernames)
+        eligible_usernames = set(
+            username for username in usernames
+            if all(statuses_by_username[username].get(req.id) == "satisfied" for req in requirements)
+        )
+        if not eligible_usernames:
+            return []
+
+        credit_course = CreditCourse.objects.get(course_key=course_key)
+        eligible_usernames.difference_update(
+            cls.objects.filter(course=credit_course, username__in=eligible_usernames).values_list('username', flat=True)
+        )
+        eligible_usernames = sorted(eligible_usernames)
+        try:
+            with transaction.atomic():
+                cls.objects.bulk_create([
+                    cls(username=username, course=credit_course) for username in eligible_usernames
+                ])
+        except IntegrityError:
+            # Some of the users were marked as eligible since their
+            # eligibilities were read, so create them one at a time.
+            created_usernames = []
+            for username in eligible_usernames:
+                try:
+                    with transaction.atomic():
+                        cls.objects.create(username=username, course=credit_course)
+                    created_usernames.append(username)
+                except IntegrityError:
+                    pass
+            return created_usernames
+        return eligible_usernames
+
     @classmethod
     def get_user_eligibilities(cls, username):
         """
@@ -8,7 +8,7 @@ from django.conf import settings
 from opaque_keys import InvalidKeyError
 from opaque_keys.edx.keys import CourseKey, UsageKey
 
-from openedx.core.djangoapps.credit.api import set_credit_requirements
+from openedx.core.djangoapps.credit.api import set_credit_requirements, update_credit_eligibilities
 from openedx.core.djangoapps.credit.exceptions import InvalidCreditRequirements
 from openedx.core.djangoapps.credit.models import CreditCourse
 from xmodule.modulestore.django import modulestore
@@ -35,7 +35,10 @@ def update_credit_course_requirements(course_id):   # pylint: disable=invalid-na
         is_credit_course = CreditCourse.is_credit_course(course_key)
         if is_credit_course:
             requirements = _get_course_credit_requirements(course_key)
-            set_credit_requirements(course_key, requirements)
+            # Learners who have satisfied all of the remaining requirements
+            # become eligible when the others are removed or relaxed.
+            if set_credit_requirements(course_key, requirements):
+                update_credit_eligibilities(course_key)
     except (InvalidKeyError, ItemNotFoundError, InvalidCreditRequirements) as exc:
         LOGGER.error('Error on adding the requirements for course %s - %s', course_id, unicode(exc))
         raise update_credit_course_requirements.retry(args=[course_id], exc=exc)
@@ -304,10 +304,11 @@ class CreditRequirementApiTests(CreditApiTestBase):
                 },
             }
         ]
-        api.set_credit_requirements(self.course_key, requirements)
+        self.assertTrue(api.set_credit_requirements(self.course_key, requirements))
+        self.assertFalse(api.set_credit_requirements(self.course_key, requirements))
 
         # Update the requirements, removing an existing requirement
-        api.set_credit_requirements(self.course_key, requirements[1:])
+        self.assertTrue(api.set_credit_requirements(self.course_key, requirements[1:]))
 
         # Expect that now only the grade requirement is returned
         visible_reqs = api.get_credit_requirements(self.course_key)
@@ -557,6 +558,31 @@ class CreditRequirementApiTests(CreditApiTestBase):
         # status should not be changed to `failed`, rather should maintain already set status `satisfied`
         self.assert_grade_requirement_status('satisfied', 0)
 
+    @mock.patch('openedx.core.djangoapps.credit.api.eligibility.send_credit_notifications')
+    def test_update_credit_eligibilities(self, mock_send_notifications):
+        self.add_credit_course()
+        self._set_credit_course_requirements()
+        users = [
+            self.create_and_enroll_user(username=username, password='test')
+            for username in ('first', 'second', 'third')
+        ]
+        for user in users[:2]:
+            api.set_credit_requirement_status(user, self.course_key, "grade", "grade")
+        self.assertEqual(api.update_credit_eligibilities(self.course_key), [])
+
+        # Dropping the unsatisfied requirement makes the users who satisfied
+        # the remaining one eligible.
+        api.set_credit_requirements(self.course_key, [{
+            "namespace": "grade",
+            "name": "grade",
+            "display_name": "Grade",
+            "criteria": {"min_grade": 0.8},
+        }])
+        newly_eligible = api.update_credit_eligibilities(self.course_key)
+        self.assertEqual(newly_eligible, ['first', 'second'])
+        self.assertEqual(mock_send_notifications.call_count, 2)
+        self.assertEqual(api.update_credit_eligibilities(self.course_key, usernames=['first', 'third']), [])
+
     @ddt.data(
         *CourseMode.CREDIT_ELIGIBLE_MODES
     )
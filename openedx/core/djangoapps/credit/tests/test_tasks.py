@@ -65,6 +65,19 @@ class TestTaskExecution(ModuleStoreTestCase):
         requirements = get_credit_requirements(self.course.id)
         self.assertEqual(len(requirements), 1)
 
+    @mock.patch('openedx.core.djangoapps.credit.tasks.update_credit_eligibilities')
+    def test_eligibilities_updated_when_requirements_change(self, mock_update_eligibilities):
+        """
+        Make sure that eligibilities are only re-evaluated when a publish
+        changes the requirements.
+        """
+        self.add_credit_course(self.course.id)
+        on_course_publish(self.course.id)
+        self.assertEqual(mock_update_eligibilities.call_count, 1)
+
+        on_course_publish(self.course.id)
+        self.assertEqual(mock_update_eligibilities.call_count, 1)
+
     def test_proctored_exam_requirements(self):
         """
         Make sure that proctored exams are being registered as requirements
@@ -24,7 +24,11 @@ from lms.djangoapps.certificates import api as certificate_api
 from lms.djangoapps.commerce.utils import EcommerceService
 from lms.djangoapps.courseware.access import has_access
 from lms.djangoapps.grades.course_grade_factory import CourseGradeFactory
-from openedx.core.djangoapps.catalog.utils import get_programs, get_fulfillable_course_runs_for_entitlement
+from openedx.core.djangoapps.catalog.utils import (
+    get_fulfillable_course_runs_for_entitlement,
+    get_programs,
+    get_programs_for_courses
+)
 from openedx.core.djangoapps.commerce.utils import ecommerce_api_client
 from openedx.core.djangoapps.content.course_overviews.models import CourseOverview
 from openedx.core.djangoapps.credentials.utils import get_credentials
@@ -104,10 +108,18 @@ class ProgramProgressMeter(object):
 
         self.course_grade_factory = CourseGradeFactory()
 
+        # Whether only the programs containing the user's enrolled runs and
+        # entitled courses were read, using the site's program course index.
+        self.programs_indexed = False
         if uuid:
             self.programs = [get_programs(self.site, uuid=uuid)]
         else:
-            self.programs = attach_program_detail_url(get_programs(self.site), self.mobile_only)
+            programs = get_programs_for_courses(self.site, self.course_run_ids, self.course_uuids)
+            if programs is None:
+                programs = get_programs(self.site)
+            else:
+                self.programs_indexed = True
+            self.programs = attach_program_detail_url(programs, self.mobile_only)
 
     def invert_programs(self):
         """Intersect programs and enrollments.
@@ -280,7 +292,18 @@ class ProgramProgressMeter(object):
         Returns:
             list of UUIDs, each identifying a completed program.
         """
-        return [program['uuid'] for program in self.programs if self._is_program_complete(program)]
+        programs = self.programs
+        if self.programs_indexed:
+            # A program can only be complete if it contains a course run that the user has a
+            # certificate for, and the user may no longer be enrolled in that run.
+            programs = get_programs_for_courses(
+                self.site,
+                [course_run['course_run_id'] for course_run in self.completed_course_runs],
+            )
+            if programs is None:
+                programs = get_programs(self.site)
+
+        return [program['uuid'] for program in programs if self._is_program_complete(program)]
 
     def _is_program_complete(self, program):
         """Check if a user has completed a program.
@@ -1,4 +1,10 @@
-from openedx.core.djangoapps.waffle_utils import WaffleFlagNamespace, CourseWaffleFlag, WaffleFlag
+from openedx.core.djangoapps.waffle_utils import (
+    CourseWaffleFlag,
+    WaffleFlag,
+    WaffleFlagNamespace,
+    WaffleSwitch,
+    WaffleSwitchNamespace
+)
 
 
 WAFFLE_FLAG_NAMESPACE = WaffleFlagNamespace(name=u'schedules')
@@ -16,3 +22,8 @@ COURSE_UPDATE_WAFFLE_FLAG = CourseWaffleFlag(
 )
 
 DEBUG_MESSAGE_WAFFLE_FLAG = WaffleFlag(WAFFLE_FLAG_NAMESPACE, u'enable_debugging')
+
+WAFFLE_SWITCH_NAMESPACE = WaffleSwitchNamespace(name=u'schedules')
+
+# Resolve each bin of schedules from course data loaded once for the whole bin, and report timing per bin.
+BATCHED_RESOLUTION_SWITCH = WaffleSwitch(WAFFLE_SWITCH_NAMESPACE, u'batched_resolution')
@@ -8,6 +8,7 @@ import ddt
 import pytz
 from django.conf import settings
 from edx_ace.channel import ChannelType
+from edx_ace.message import Message
 from edx_ace.test_utils import StubPolicy, patch_channels, patch_policies
 from edx_ace.utils.date import serialize
 from freezegun import freeze_time
@@ -19,6 +20,7 @@ from course_modes.tests.factories import CourseModeFactory
 from courseware.models import DynamicUpgradeDeadlineConfiguration
 from lms.djangoapps.commerce.models import CommerceConfiguration
 from openedx.core.djangoapps.schedules import resolvers, tasks
+from openedx.core.djangoapps.schedules.config import BATCHED_RESOLUTION_SWITCH
 from openedx.core.djangoapps.schedules.resolvers import _get_datetime_beginning_of_day
 from openedx.core.djangoapps.schedules.tests.factories import ScheduleConfigFactory, ScheduleFactory
 from openedx.core.djangoapps.site_configuration.tests.factories import SiteConfigurationFactory, SiteFactory
@@ -363,6 +365,40 @@ class ScheduleSendEmailTestMixin(FilteredQueryCountMixin):
         self.assertEqual(mock_schedule_send.apply_async.call_count, expected_call_count)
         self.assertFalse(mock_ace.send.called)
 
+    @patch.object(tasks, 'ace')
+    @patch.object(resolvers, 'get_course_with_highlights')
+    def test_batched_resolution(self, mock_get_course_with_highlights, mock_ace):
+        user = UserFactory.create()
+        current_day, offset, target_day, upgrade_deadline = self._get_dates()
+        for course_index in range(3):
+            self._schedule_factory(
+                enrollment__user=user,
+                enrollment__course__id=CourseKey.from_string('edX/toy/course{}'.format(course_index))
+            )
+
+        sent_messages = {}
+        for batched in (True, False):
+            with BATCHED_RESOLUTION_SWITCH.override(active=batched):
+                with patch.object(CourseMode, 'modes_for_course', wraps=CourseMode.modes_for_course) as mock_modes:
+                    with patch.object(self.task, 'async_send_task') as mock_schedule_send:
+                        self.task().apply(kwargs=dict(
+                            site_id=self.site_config.site.id, target_day_str=serialize(target_day),
+                            day_offset=offset, bin_num=self._calculate_bin_for_user(user),
+                        ))
+            if batched:
+                # The course modes are loaded once for the whole bin instead.
+                self.assertFalse(mock_modes.called)
+            sent_messages[batched] = [
+                Message.from_string(call_args[0][0][1])
+                for call_args in mock_schedule_send.apply_async.call_args_list
+            ]
+
+        self.assertEqual(len(sent_messages[True]), len(sent_messages[False]))
+        for batched_message, message in zip(sent_messages[True], sent_messages[False]):
+            self.assertEqual(batched_message.recipient, message.recipient)
+            self.assertEqual(batched_message.context, message.context)
+        self.assertFalse(mock_ace.send.called)
+
     @ddt.data(
         1, 10
     )
@@ -1,6 +1,7 @@
 import datetime
-from itertools import groupby
+from itertools import groupby, islice
 import logging
+import time
 
 import attr
 from django.conf import settings
@@ -12,9 +13,11 @@ from django.db.models import F, Q
 from edx_ace.recipient_resolver import RecipientResolver
 from edx_ace.recipient import Recipient
 
+from course_modes.models import CourseMode
 from courseware.date_summary import verified_upgrade_deadline_link, verified_upgrade_link_is_valid
 from openedx.core.djangoapps.monitoring_utils import function_trace, set_custom_metric
-from openedx.core.djangoapps.schedules.content_highlights import get_week_highlights
+from openedx.core.djangoapps.schedules.config import BATCHED_RESOLUTION_SWITCH
+from openedx.core.djangoapps.schedules.content_highlights import get_course_with_highlights, get_week_highlights
 from openedx.core.djangoapps.schedules.exceptions import CourseUpdateDoesNotExist
 from openedx.core.djangoapps.schedules.models import Schedule, ScheduleExperience
 from openedx.core.djangoapps.schedules.utils import PrefixedDebugLoggerMixin
@@ -30,6 +33,9 @@ RECURRING_NUDGE_NUM_BINS = DEFAULT_NUM_BINS
 UPGRADE_REMINDER_NUM_BINS = DEFAULT_NUM_BINS
 COURSE_UPDATE_NUM_BINS = DEFAULT_NUM_BINS
 
+# The number of messages rendered at a time before they are enqueued, when resolving bins in batches.
+MESSAGES_PER_BATCH = 100
+
 
 @attr.s
 class BinnedSchedulesBaseResolver(PrefixedDebugLoggerMixin, RecipientResolver):
@@ -76,8 +82,13 @@ class BinnedSchedulesBaseResolver(PrefixedDebugLoggerMixin, RecipientResolver):
     def __attrs_post_init__(self):
         # TODO: in the next refactor of this task, pass in current_datetime instead of reproducing it here
         self.current_datetime = self.target_datetime - datetime.timedelta(days=self.day_offset)
+        self.batched = BATCHED_RESOLUTION_SWITCH.is_enabled()
 
     def send(self, msg_type):
+        if self.batched:
+            self.send_in_batches(msg_type)
+            return
+
         for (user, language, context) in self.schedules_for_bin():
             msg = msg_type.personalize(
                 Recipient(
@@ -90,6 +101,48 @@ class BinnedSchedulesBaseResolver(PrefixedDebugLoggerMixin, RecipientResolver):
             with function_trace('enqueue_send_task'):
                 self.async_send_task.apply_async((self.site.id, str(msg)), retry=False)
 
+    def send_in_batches(self, msg_type):
+        """
+        Sends the messages for this bin, rendering up to MESSAGES_PER_BATCH of them before enqueueing them, and reports
+        how long the bin took to resolve and how much of that time was spent enqueueing.
+        """
+        start_time = time.time()
+        enqueue_seconds = 0.0
+        num_messages = 0
+
+        contexts = self.schedules_for_bin()
+        while True:
+            with function_trace('render_message_batch'):
+                batch = [
+                    str(msg_type.personalize(
+                        Recipient(
+                            user.username,
+                            self.override_recipient_email or user.email,
+                        ),
+                        language,
+                        context,
+                    ))
+                    for (user, language, context) in islice(contexts, MESSAGES_PER_BATCH)
+                ]
+            if not batch:
+                break
+
+            enqueue_start_time = time.time()
+            with function_trace('enqueue_send_tasks'):
+                for msg_str in batch:
+                    self.async_send_task.apply_async((self.site.id, msg_str), retry=False)
+            enqueue_seconds += time.time() - enqueue_start_time
+            num_messages += len(batch)
+
+        bin_seconds = time.time() - start_time
+        self.log_info(
+            'Sent %d messages for bin %d in %.3f seconds, %.3f of them enqueueing',
+            num_messages, self.bin_num, bin_seconds, enqueue_seconds,
+        )
+        set_custom_metric('num_messages', num_messages)
+        set_custom_metric('bin_seconds', bin_seconds)
+        set_custom_metric('bin_enqueue_seconds', enqueue_seconds)
+
     def get_schedules_with_target_date_by_bin_and_orgs(
         self, order_by='enrollment__user__id'
     ):
@@ -178,8 +231,29 @@ class BinnedSchedulesBaseResolver(PrefixedDebugLoggerMixin, RecipientResolver):
 
         return schedules.filter(enrollment__course__org__in=org_list)
 
+    def prefetch_course_data(self, schedules):
+        """
+        Loads the course data needed to build the template contexts of all of the given schedules at once, rather than
+        schedule by schedule.
+
+        The course modes of all of their courses are loaded with a single query, and each enrollment is given the
+        verified mode of its course, which its upgrade deadline and upgrade link are computed from.
+        """
+        course_ids = {schedule.enrollment.course_id for schedule in schedules}
+        __, unexpired_modes = CourseMode.all_and_unexpired_modes_for_courses(course_ids)
+        verified_modes = {
+            course_id: CourseMode.verified_mode_for_course(course_id, modes=modes)
+            for course_id, modes in unexpired_modes.iteritems()
+        }
+        for schedule in schedules:
+            schedule.enrollment.verified_mode = verified_modes[schedule.enrollment.course_id]
+
     def schedules_for_bin(self):
         schedules = self.get_schedules_with_target_date_by_bin_and_orgs()
+        if self.batched:
+            with function_trace('prefetch_course_data'):
+                self.prefetch_course_data(schedules)
+
         template_context = get_base_template_context(self.site)
 
         for (user, user_schedules) in groupby(schedules, lambda s: s.enrollment.user):
@@ -325,7 +399,7 @@ def _get_upsell_information_for_schedule(user, schedule):
 def _get_verified_upgrade_link(user, schedule):
     enrollment = schedule.enrollment
     if enrollment.dynamic_upgrade_deadline is not None and verified_upgrade_link_is_valid(enrollment):
-        return verified_upgrade_deadline_link(user, enrollment.course)
+        return verified_upgrade_deadline_link(user, enrollment.course, verified_mode=enrollment.verified_mode)
 
 
 class CourseUpdateResolver(BinnedSchedulesBaseResolver):
@@ -338,11 +412,42 @@ class CourseUpdateResolver(BinnedSchedulesBaseResolver):
     num_bins = COURSE_UPDATE_NUM_BINS
     experience_filter = Q(experience__experience_type=ScheduleExperience.EXPERIENCES.course_updates)
 
+    # Maps each course in the bin to its descriptor, or to the CourseUpdateDoesNotExist error raised loading it, when
+    # resolving bins in batches.
+    courses_with_highlights = None
+
+    def prefetch_course_data(self, schedules):
+        """
+        Also loads each course in the bin with its highlights once, rather than once per schedule.
+        """
+        super(CourseUpdateResolver, self).prefetch_course_data(schedules)
+        self.courses_with_highlights = {}
+        for course_id in {schedule.enrollment.course_id for schedule in schedules}:
+            try:
+                self.courses_with_highlights[course_id] = get_course_with_highlights(course_id)
+            except CourseUpdateDoesNotExist as error:
+                self.courses_with_highlights[course_id] = error
+
+    def get_week_highlights(self, user, course_id, week_num):
+        """
+        Gets the highlights for the week, using the course loaded by prefetch_course_data if there is one.
+        """
+        if self.courses_with_highlights is None:
+            return get_week_highlights(user, course_id, week_num)
+
+        course_descriptor = self.courses_with_highlights[course_id]
+        if isinstance(course_descriptor, CourseUpdateDoesNotExist):
+            raise course_descriptor
+        return get_week_highlights(user, course_id, week_num, course_descriptor=course_descriptor)
+
     def schedules_for_bin(self):
         week_num = abs(self.day_offset) / 7
         schedules = self.get_schedules_with_target_date_by_bin_and_orgs(
             order_by='enrollment__course',
         )
+        if self.batched:
+            with function_trace('prefetch_course_data'):
+                self.prefetch_course_data(schedules)
 
         template_context = get_base_template_context(self.site)
         for schedule in schedules:
@@ -350,7 +455,7 @@ class CourseUpdateResolver(BinnedSchedulesBaseResolver):
             user = enrollment.user
 
             try:
-                week_highlights = get_week_highlights(user, enrollment.course_id, week_num)
+                week_highlights = self.get_week_highlights(user, enrollment.course_id, week_num)
             except CourseUpdateDoesNotExist:
                 LOG.warning(
                     'Weekly highlights for user {} in week {} of course {} does not exist or is disabled'.format(
@@ -3,16 +3,29 @@ Django models for site configurations.
 """
 import collections
 from logging import getLogger
+from uuid import uuid4
 
 from django.contrib.sites.models import Site
+from django.core.cache import cache
 from django.db import models
-from django.db.models.signals import post_save
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 from jsonfield.fields import JSONField
 from model_utils.models import TimeStampedModel
 
 logger = getLogger(__name__)  # pylint: disable=invalid-name
 
+# The version of the org index of this process is checked against this key in
+# the shared cache, so that a change to any site configuration is picked up by
+# every process.
+ORG_INDEX_VERSION_CACHE_KEY = 'site_configuration.org_index.version'
+
+# The version is bumped by the post_save and post_delete receivers, before the
+# change is committed, so a process rebuilding its index in the meantime may
+# keep the orgs from before the change under the new version.  The version
+# expires so that such an index is rebuilt after this long at most.
+ORG_INDEX_VERSION_CACHE_TIMEOUT = 5 * 60
+
 
 class SiteConfiguration(models.Model):
     """
@@ -60,6 +73,17 @@ class SiteConfiguration(models.Model):
 
         return default
 
+    def get_course_org_filter(self):
+        """
+        Returns the list of the organizations whose courses belong to this site.
+        """
+        course_org_filter = self.get_value('course_org_filter', [])
+        # The value of 'course_org_filter' can be configured as a string representing
+        # a single organization or a list of strings representing multiple organizations.
+        if not isinstance(course_org_filter, list):
+            course_org_filter = [course_org_filter]
+        return course_org_filter
+
     @classmethod
     def get_value_for_org(cls, org, name, default=None):
         """
@@ -74,15 +98,10 @@ class SiteConfiguration(models.Model):
         Returns:
             Configuration value for the given key.
         """
-        for configuration in cls.objects.filter(values__contains=org, enabled=True).all():
-            course_org_filter = configuration.get_value('course_org_filter', [])
-            # The value of 'course_org_filter' can be configured as a string representing
-            # a single organization or a list of strings representing multiple organizations.
-            if not isinstance(course_org_filter, list):
-                course_org_filter = [course_org_filter]
-            if org in course_org_filter:
-                return configuration.get_value(name, default)
-        return default
+        configuration = cls._get_org_index().get(org)
+        if configuration is None:
+            return default
+        return configuration.get_value(name, default)
 
     @classmethod
     def get_all_orgs(cls):
@@ -93,14 +112,7 @@ class SiteConfiguration(models.Model):
         Returns:
             A list of all organizations present in site configuration.
         """
-        org_filter_set = set()
-
-        for configuration in cls.objects.filter(values__contains='course_org_filter', enabled=True).all():
-            course_org_filter = configuration.get_value('course_org_filter', [])
-            if not isinstance(course_org_filter, list):
-                course_org_filter = [course_org_filter]
-            org_filter_set.update(course_org_filter)
-        return org_filter_set
+        return set(cls._get_org_index())
 
     @classmethod
     def has_org(cls, org):
@@ -110,7 +122,41 @@ class SiteConfiguration(models.Model):
         Returns:
             True if given organization is present in site configurations otherwise False.
         """
-        return org in cls.get_all_orgs()
+        return org in cls._get_org_index()
+
+    # The org index of this process, and the version of it in the shared cache.
+    _org_index = None
+    _org_index_version = None
+
+    @classmethod
+    def _get_org_index(cls):
+        """
+        Returns a dict of each organization in the course_org_filter of an
+        enabled site configuration to that configuration.
+
+        The index is kept in memory, and only rebuilt when its version in the
+        shared cache changes, or on every call if there is no shared cache.
+        """
+        version = cache.get(ORG_INDEX_VERSION_CACHE_KEY)
+        if version is None:
+            cache.add(ORG_INDEX_VERSION_CACHE_KEY, uuid4().hex, ORG_INDEX_VERSION_CACHE_TIMEOUT)
+            version = cache.get(ORG_INDEX_VERSION_CACHE_KEY)
+
+        if version is None or version != cls._org_index_version:
+            org_index = {}
+            for configuration in cls.objects.filter(enabled=True).select_related('site').order_by('id'):
+                for org in configuration.get_course_org_filter():
+                    org_index.setdefault(org, configuration)
+            cls._org_index, cls._org_index_version = org_index, version
+        return cls._org_index
+
+    @classmethod
+    def invalidate_org_index(cls):
+        """
+        Moves on to a new version of the org index, so that every process
+        rebuilds its index the next time it is used.
+        """
+        cache.set(ORG_INDEX_VERSION_CACHE_KEY, uuid4().hex, ORG_INDEX_VERSION_CACHE_TIMEOUT)
 
 
 class SiteConfigurationHistory(TimeStampedModel):
@@ -159,3 +205,12 @@ def update_site_configuration_history(sender, instance, **kwargs):  # pylint: di
         values=instance.values,
         enabled=instance.enabled,
     )
+    SiteConfiguration.invalidate_org_index()
+
+
+@receiver(post_delete, sender=SiteConfiguration)
+def invalidate_site_configuration_org_index(sender, instance, **kwargs):  # pylint: disable=unused-argument
+    """
+    Rebuild the org index of site configurations once a site configuration is deleted.
+    """
+    SiteConfiguration.invalidate_org_index()
@@ -3,12 +3,18 @@ Tests for site configuration's django models.
 """
 from mock import patch
 
+from django.core.cache import cache
 from django.test import TestCase
 from django.db import IntegrityError, transaction
 from django.contrib.sites.models import Site
 
-from openedx.core.djangoapps.site_configuration.models import SiteConfigurationHistory, SiteConfiguration
+from openedx.core.djangoapps.site_configuration.models import (
+    ORG_INDEX_VERSION_CACHE_KEY,
+    SiteConfiguration,
+    SiteConfigurationHistory,
+)
 from openedx.core.djangoapps.site_configuration.tests.factories import SiteConfigurationFactory
+from openedx.core.djangolib.testing.utils import CacheIsolationTestCase
 
 
 class SiteConfigurationTests(TestCase):
@@ -317,3 +323,74 @@ class SiteConfigurationTests(TestCase):
             list(SiteConfiguration.get_all_orgs()),
             expected_orgs,
         )
+
+
+class SiteConfigurationOrgIndexTests(CacheIsolationTestCase):
+    """
+    Tests for the org index of SiteConfiguration.
+    """
+    ENABLED_CACHES = ['default']
+
+    @classmethod
+    def setUpClass(cls):
+        super(SiteConfigurationOrgIndexTests, cls).setUpClass()
+        cls.site, _ = Site.objects.get_or_create(domain='test.localhost', name='test.localhost')
+        cls.site2, _ = Site.objects.get_or_create(domain='test-another.localhost', name='test-another.localhost')
+
+    def test_org_lookups_are_cached(self):
+        """
+        Test that the orgs of site configurations are looked up without querying
+        the database once the index is built.
+        """
+        SiteConfigurationFactory.create(
+            site=self.site,
+            values={'course_org_filter': ['TestX', 'TestY'], 'platform_name': 'Test Platform'},
+        )
+
+        with self.assertNumQueries(1):
+            self.assertTrue(SiteConfiguration.has_org('TestX'))
+
+        with self.assertNumQueries(0):
+            self.assertFalse(SiteConfiguration.has_org('TestAnotherX'))
+            self.assertEqual(SiteConfiguration.get_value_for_org('TestY', 'platform_name'), 'Test Platform')
+            self.assertEqual(SiteConfiguration.get_value_for_org('TestAnotherX', 'platform_name', 'edX'), 'edX')
+            self.assertEqual(SiteConfiguration.get_all_orgs(), {'TestX', 'TestY'})
+
+    def test_index_is_rebuilt_on_save(self):
+        """
+        Test that the index picks up site configurations that are added or changed.
+        """
+        site_configuration = SiteConfigurationFactory.create(
+            site=self.site,
+            values={'course_org_filter': 'TestX'},
+        )
+        self.assertEqual(SiteConfiguration.get_all_orgs(), {'TestX'})
+
+        SiteConfigurationFactory.create(
+            site=self.site2,
+            values={'course_org_filter': 'TestAnotherX'},
+        )
+        self.assertEqual(SiteConfiguration.get_all_orgs(), {'TestX', 'TestAnotherX'})
+
+        site_configuration.enabled = False
+        site_configuration.save()
+        self.assertEqual(SiteConfiguration.get_all_orgs(), {'TestAnotherX'})
+
+    def test_index_is_rebuilt_when_version_expires(self):
+        """
+        Test that an index built from uncommitted changes is rebuilt once its
+        version expires from the cache.
+        """
+        SiteConfigurationFactory.create(
+            site=self.site,
+            values={'course_org_filter': 'TestX'},
+        )
+        self.assertEqual(SiteConfiguration.get_all_orgs(), {'TestX'})
+
+        # Change the configuration without bumping the version, as if the
+        # index had been rebuilt before the change was committed.
+        SiteConfiguration.objects.filter(site=self.site).update(values={'course_org_filter': 'TestAnotherX'})
+        self.assertEqual(SiteConfiguration.get_all_orgs(), {'TestX'})
+
+        cache.delete(ORG_INDEX_VERSION_CACHE_KEY)
+        self.assertEqual(SiteConfiguration.get_all_orgs(), {'TestAnotherX'})
@@ -19,3 +19,7 @@ class ThemingConfig(AppConfig):
     def ready(self):
         # settings validations related to theming.
         from . import checks
+        from .helpers import get_theme_index
+
+        # Walk the theme dirs at startup, rather than during a worker's first requests.
+        get_theme_index()
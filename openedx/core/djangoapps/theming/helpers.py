@@ -6,6 +6,7 @@ you need models here, please import them inside the function which uses them.
 """
 import os
 import re
+from collections import namedtuple
 from logging import getLogger
 
 from django.conf import settings
@@ -23,6 +24,15 @@ from openedx.core.djangoapps.request_cache.middleware import RequestCache, reque
 
 logger = getLogger(__name__)  # pylint: disable=invalid-name
 
+# The themes found in the theme dirs, and the templates of each of them.
+#   * themes: dict mapping each theme dir name to its Theme.
+#   * templates: dict mapping (theme dir name, template path relative to the theme's templates dir)
+#     to the absolute path of the template file.
+ThemeIndex = namedtuple('ThemeIndex', ['themes', 'templates'])
+
+# The theme indexes built by get_theme_index, keyed by the theme dirs and project root they were built for.
+_THEME_INDEXES = {}
+
 
 @request_cached
 def get_template_path(relative_path, **kwargs):
@@ -82,14 +92,71 @@ def get_template_path_with_theme(relative_path):
     # strip `/` if present at the start of relative_path
     template_name = re.sub(r'^/+', '', relative_path)
 
-    template_path = theme.template_path / template_name
-    absolute_path = theme.path / "templates" / template_name
-    if absolute_path.exists():
-        return str(template_path)
+    if theme_has_template(theme, template_name):
+        return str(theme.template_path / template_name)
     else:
         return relative_path
 
 
+def theme_has_template(theme, template_name):
+    """
+    Returns whether the given theme overrides a template.
+
+    The theme index is consulted rather than the filesystem, except when DEBUG is on, so that
+    templates added to a theme while the server is running are picked up in development.
+
+    Parameters:
+        theme (Theme): the theme to look in
+        template_name (str): template's path relative to the templates directory e.g. 'footer.html'
+    """
+    if settings.DEBUG:
+        return (theme.path / "templates" / template_name).exists()
+    return (theme.theme_dir_name, template_name) in get_theme_index().templates
+
+
+def get_theme_index():
+    """
+    Returns the ThemeIndex of the themes in the configured theme dirs.
+
+    The theme dirs are walked once, the first time the index is needed, so that finding a theme
+    or whether it overrides a template does not touch the filesystem.  It is built again if the
+    theme dirs change, which only happens in tests.
+    """
+    theme_base_dirs = tuple(get_theme_base_dirs())
+    key = (theme_base_dirs, settings.PROJECT_ROOT)
+    theme_index = _THEME_INDEXES.get(key)
+    if theme_index is None:
+        theme_index = _THEME_INDEXES[key] = _build_theme_index(theme_base_dirs)
+    return theme_index
+
+
+def _build_theme_index(theme_base_dirs):
+    """
+    Walks the theme dirs to build their ThemeIndex.
+    """
+    themes = {}
+    templates = {}
+    for theme in get_themes_unchecked(theme_base_dirs, settings.PROJECT_ROOT):
+        # The first of the theme dirs which has a theme wins, as in get_theme_base_dir.
+        if theme.theme_dir_name in themes:
+            continue
+        themes[theme.theme_dir_name] = theme
+        for template_dir in theme.template_dirs:
+            for dirpath, __, filenames in os.walk(template_dir):
+                for filename in filenames:
+                    absolute_path = os.path.join(dirpath, filename)
+                    template_name = os.path.relpath(absolute_path, template_dir).replace(os.path.sep, '/')
+                    templates.setdefault((theme.theme_dir_name, template_name), absolute_path)
+    return ThemeIndex(themes, templates)
+
+
+def clear_theme_index():
+    """
+    Clears the theme indexes, so that they are built again from the theme dirs.
+    """
+    _THEME_INDEXES.clear()
+
+
 def get_all_theme_template_dirs():
     """
     Returns template directories for all the themes.
@@ -212,6 +279,10 @@ def get_current_theme():
     site_theme = get_current_site_theme()
     if not site_theme:
         return None
+
+    theme = get_theme_index().themes.get(site_theme.theme_dir_name)
+    if theme is not None:
+        return theme
     try:
         return Theme(
             name=site_theme.theme_dir_name,
@@ -247,6 +318,11 @@ def get_theme_base_dir(theme_dir_name, suppress_error=False):
     Returns:
         (str): Base directory that contains the given theme
     """
+    theme = get_theme_index().themes.get(theme_dir_name)
+    if theme is not None:
+        return theme.themes_base_dir
+
+    # The theme may have been added since the index was built.
     for themes_dir in get_theme_base_dirs():
         if theme_dir_name in get_theme_dirs(themes_dir):
             return themes_dir
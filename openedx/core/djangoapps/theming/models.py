@@ -2,7 +2,12 @@
 Django models supporting the Comprehensive Theming subsystem
 """
 from django.contrib.sites.models import Site
+from django.core.cache import cache
 from django.db import models
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+SITE_THEME_CACHE_KEY_TPL = 'theming.site_theme.{site_id}'
 
 
 class SiteTheme(models.Model):
@@ -32,9 +37,15 @@ class SiteTheme(models.Model):
         Returns:
             SiteTheme object for given site or a default site passed in as the argument.
         """
-
-        theme = site.themes.first()
-        return theme or default
+        # The site's theme is cached as a list, which is empty if the site has no theme,
+        # to tell that apart from a cache miss.
+        cache_key = SITE_THEME_CACHE_KEY_TPL.format(site_id=site.id)
+        themes = cache.get(cache_key)
+        if themes is None:
+            theme = site.themes.first()
+            themes = [theme] if theme else []
+            cache.set(cache_key, themes)
+        return themes[0] if themes else default
 
     @staticmethod
     def has_theme(site):
@@ -49,3 +60,12 @@ class SiteTheme(models.Model):
             True if given site has an associated site theme in database, returns False otherwise.
         """
         return site.themes.exists()
+
+
+@receiver(post_save, sender=SiteTheme)
+@receiver(post_delete, sender=SiteTheme)
+def invalidate_site_theme_cache(sender, instance, **kwargs):  # pylint: disable=unused-argument
+    """
+    Clear the cached theme of the site whose theme was changed.
+    """
+    cache.delete(SITE_THEME_CACHE_KEY_TPL.format(site_id=instance.site_id))
@@ -6,7 +6,12 @@ from django.template.loaders.filesystem import Loader as FilesystemLoader
 from django.utils._os import safe_join
 
 from edxmako.makoloader import MakoLoader
-from openedx.core.djangoapps.theming.helpers import get_all_theme_template_dirs, get_current_request, get_current_theme
+from openedx.core.djangoapps.theming.helpers import (
+    get_all_theme_template_dirs,
+    get_current_request,
+    get_current_theme,
+    theme_has_template
+)
 
 
 class ThemeTemplateLoader(MakoLoader):
@@ -35,7 +40,7 @@ class ThemeFilesystemLoader(FilesystemLoader):
         """
         if not template_dirs:
             template_dirs = self.engine.dirs
-        theme_dirs = self.get_theme_template_sources()
+        theme_dirs = self.get_theme_template_sources(template_name)
 
         # append theme dirs to the beginning so templates are looked up inside theme dir first
         if isinstance(theme_dirs, list):
@@ -44,10 +49,13 @@ class ThemeFilesystemLoader(FilesystemLoader):
         return list(super(ThemeFilesystemLoader, self).get_template_sources(template_name, template_dirs))
 
     @staticmethod
-    def get_theme_template_sources():
+    def get_theme_template_sources(template_name=None):
         """
         Return template sources for the given theme and if request object is None (this would be the case for
         management commands) return template sources for all themes.
+
+        If a template_name is given, the current theme's template sources are only returned if the theme
+        overrides that template, so that the theme's template dirs are not probed for templates it lacks.
         """
         if not get_current_request():
             # if request object is not present, then this method is being called inside a management
@@ -56,4 +64,6 @@ class ThemeFilesystemLoader(FilesystemLoader):
         else:
             # template is being accessed by a view, so return templates sources for current theme
             theme = get_current_theme()
+            if theme and template_name is not None and not theme_has_template(theme, template_name.lstrip('/')):
+                return []
             return theme and theme.template_dirs
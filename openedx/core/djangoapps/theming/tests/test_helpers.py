@@ -233,6 +233,19 @@ class TestHelpersLMS(TestCase):
         template_path = get_template_path_with_theme('header.html')
         self.assertEqual(template_path, 'header.html')
 
+    @with_comprehensive_theme('red-theme')
+    def test_theme_index(self):
+        """
+        Tests the theme index has the templates which the theme overrides.
+        """
+        theme = theming_helpers.get_current_theme()
+        theme_index = theming_helpers.get_theme_index()
+        self.assertEqual(theme_index.themes['red-theme'], theme)
+        self.assertEqual(theme_index.templates[('red-theme', 'header.html')], theme.path / 'templates' / 'header.html')
+        self.assertNotIn(('red-theme', 'course.html'), theme_index.templates)
+        self.assertTrue(theming_helpers.theme_has_template(theme, 'header.html'))
+        self.assertFalse(theming_helpers.theme_has_template(theme, 'course.html'))
+
     @with_comprehensive_theme('red-theme')
     def test_strip_site_theme_templates_path_theme_enabled(self):
         """
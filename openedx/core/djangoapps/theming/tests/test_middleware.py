@@ -6,6 +6,8 @@ from django.contrib.messages.middleware import MessageMiddleware
 from django.test import RequestFactory, TestCase, override_settings
 from django.contrib.sites.models import Site
 from openedx.core.djangoapps.theming.middleware import CurrentSiteThemeMiddleware
+from openedx.core.djangoapps.theming.models import SiteTheme
+from openedx.core.djangolib.testing.utils import CacheIsolationTestCase
 from student.tests.factories import UserFactory
 
 from ..views import set_user_preview_site_theme
@@ -88,3 +90,27 @@ class TestCurrentSiteThemeMiddleware(TestCase):
         get_request = self.create_mock_get_request()
         self.assertEqual(self.site_theme_middleware.process_request(get_request), None)
         self.assertIsNone(get_request.site_theme)
+
+
+class TestCachedSiteTheme(CacheIsolationTestCase):
+    """
+    Test that the middleware's lookup of a site's theme is cached.
+    """
+    ENABLED_CACHES = ['default']
+
+    def setUp(self):
+        super(TestCachedSiteTheme, self).setUp()
+        self.site, __ = Site.objects.get_or_create(domain='test', name='test')
+
+    def test_site_theme_cached(self):
+        self.assertIsNone(SiteTheme.get_theme(self.site))
+        with self.assertNumQueries(0):
+            self.assertIsNone(SiteTheme.get_theme(self.site))
+
+        SiteTheme.objects.create(site=self.site, theme_dir_name=TEST_THEME_NAME)
+        self.assertEqual(SiteTheme.get_theme(self.site).theme_dir_name, TEST_THEME_NAME)
+        with self.assertNumQueries(0):
+            self.assertEqual(SiteTheme.get_theme(self.site).theme_dir_name, TEST_THEME_NAME)
+
+        SiteTheme.objects.filter(site=self.site).delete()
+        self.assertIsNone(SiteTheme.get_theme(self.site))
@@ -1,6 +1,8 @@
 """
 Common utilities for the course experience, including course outline.
 """
+from lms.djangoapps.completion import waffle as completion_waffle
+from lms.djangoapps.completion.aggregator import get_course_completion_aggregate
 from lms.djangoapps.completion.models import BlockCompletion
 from lms.djangoapps.completion.waffle import visual_progress_enabled
 from lms.djangoapps.course_api.blocks.api import get_blocks
@@ -50,6 +52,16 @@ def get_course_outline_block_tree(request, course_id):
         Mark 'most recent completed block as 'resume_block'
 
         """
+        if completion_waffle.waffle().is_enabled(completion_waffle.ENABLE_COMPLETION_AGGREGATION):
+            aggregate = get_course_completion_aggregate(user, course_key)
+            latest_block_key = aggregate.latest_block_key
+            if latest_block_key:
+                recurse_mark_complete(
+                    course_block_completions=aggregate.completions,
+                    latest_block_key=latest_block_key,
+                    block=block
+                )
+            return
 
         last_completed_child_position = BlockCompletion.get_latest_block_completed(user, course_key)
 
@@ -57,11 +69,11 @@ def get_course_outline_block_tree(request, course_id):
             # Mutex w/ NOT 'course_block_completions'
             recurse_mark_complete(
                 course_block_completions=BlockCompletion.get_course_completions(user, course_key),
-                latest_completion=last_completed_child_position,
+                latest_block_key=last_completed_child_position.block_key,
                 block=block
             )
 
-    def recurse_mark_complete(course_block_completions, latest_completion, block):
+    def recurse_mark_complete(course_block_completions, latest_block_key, block):
         """
         Helper function to walk course tree dict,
         marking blocks as 'complete' and 'last_complete'
@@ -70,7 +82,7 @@ def get_course_outline_block_tree(request, course_id):
         mark parent blocks of 'last_complete' as 'last_complete'
 
         :param course_block_completions: dict[course_completion_object] =  completion_value
-        :param latest_completion: course_completion_object
+        :param latest_block_key: block key of the most recent completion
         :param block: course_outline_root_block block object or child block
 
         :return:
@@ -80,14 +92,14 @@ def get_course_outline_block_tree(request, course_id):
 
         if course_block_completions.get(locatable_block_string):
             block['complete'] = True
-            if locatable_block_string == latest_completion.block_key:
+            if locatable_block_string == latest_block_key:
                 block['resume_block'] = True
 
         if block.get('children'):
             for idx in range(len(block['children'])):
                 recurse_mark_complete(
                     course_block_completions,
-                    latest_completion,
+                    latest_block_key,
                     block=block['children'][idx]
                 )
                 if block['children'][idx]['resume_block'] is True: